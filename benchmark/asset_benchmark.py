@@ -0,0 +1,73 @@
+"""Compares asset lookup and send preparation against the previous design, which scanned every
+file on lookup and deep-copied a `File` over a `BytesIO` on every send.
+
+Usage:
+    python -m benchmark.asset_benchmark
+"""
+from __future__ import annotations
+from copy import deepcopy
+from io import BytesIO
+from pathlib import Path
+import sys
+from timeit import timeit
+import tracemalloc
+from typing import Any, Callable
+
+from nextcord import File
+
+from fazbot import Asset
+from fazbot.bot.invoke import Asset as InvokeAsset
+from fazbot.constants import Constants
+
+N_SENDS = 10_000
+N_LOOKUPS = 100_000
+
+
+def legacy_get_fp_by_key(files: dict[Path, bytes], key: str) -> Path:
+    """The previous lookup: a strict pass, then a fuzzy pass over every file."""
+    for fp in files:
+        if key == fp.stem:
+            return fp
+    for fp in files:
+        if key in fp.name:
+            return fp
+    raise KeyError(key)
+
+
+def measure(prepare: Callable[[], Any], number: int) -> tuple[float, float]:
+    """Seconds per call and bytes allocated per call of `prepare`."""
+    seconds = timeit(prepare, number=number) / number
+    tracemalloc.start()
+    kept = [prepare() for _ in range(100)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return seconds, current / 100
+
+
+def main() -> int:
+    asset = Asset(Constants.ASSET_DIR)
+    asset.read_all()
+    if not asset.files:
+        print(f"No assets found in {Constants.ASSET_DIR}")
+        return 1
+    fp, data = max(asset.files.items(), key=lambda item: len(item[1]))
+    key = fp.stem
+
+    legacy_lookup_s = timeit(lambda: legacy_get_fp_by_key(asset.files, key), number=N_LOOKUPS) / N_LOOKUPS
+    lookup_s = timeit(lambda: asset.get_fp_by_key(key), number=N_LOOKUPS) / N_LOOKUPS
+    print(f"lookup   {key:<16} legacy {legacy_lookup_s * 1e9:8.1f} ns  indexed {lookup_s * 1e9:8.1f} ns")
+
+    legacy_file = File(BytesIO(data), filename=fp.name)
+    invoke_asset = InvokeAsset(data, fp.name)
+    for name, prepare in (
+        ("legacy", lambda: deepcopy(legacy_file)),
+        ("shared", invoke_asset.get_file_to_send),
+    ):
+        seconds, allocated = measure(prepare, N_SENDS)
+        print(f"send     {name:<16} {seconds * 1e6:8.2f} us  {allocated / 1024:8.1f} KiB/send  ({len(data) / 1024:.1f} KiB asset)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Benchmarks `CraftedUtil` over 1 to 6 ingredients and several range widths.
+
+Usage:
+    python -m benchmark.crafted_util_benchmark [--baseline PATH] [--save] [--threshold RATIO]
+
+Results are diffed against the baseline JSON if it exists. `--save` overwrites the baseline with
+this run. Exits with 1 if any case got slower or used more memory than `--threshold` times its
+baseline.
+"""
+from __future__ import annotations
+from argparse import ArgumentParser
+import json
+from pathlib import Path
+import platform
+import sys
+from time import perf_counter
+import tracemalloc
+from typing import Any, Callable
+
+import numpy as np
+
+from fazbot.object import WynnIngredientValue
+from fazbot.util import CraftedSimulationUtil, CraftedUtil
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline" / "crafted_util.json"
+INGREDIENT_COUNTS = (1, 2, 3, 4, 5, 6)
+RANGE_WIDTHS = (10, 100, 400, 1000)
+MODES: dict[str, Callable[[list[WynnIngredientValue]], Any]] = {
+    "auto": lambda ings: CraftedUtil(ings),
+    "direct": lambda ings: CraftedUtil(ings, method="direct"),
+    "fft": lambda ings: CraftedUtil(ings, method="fft"),
+    "exact": lambda ings: CraftedUtil(ings, exact=True),
+}
+REPEATS = 10
+MIN_SECONDS_DELTA = 5e-4
+"""Time differences below this are treated as noise."""
+
+
+def get_ingredients(n_ings: int, range_width: int) -> list[WynnIngredientValue]:
+    # Mixed boosts so every ingredient has a different distribution
+    return [WynnIngredientValue(-range_width // 2, range_width - range_width // 2, boost) for boost in range(0, 20 * n_ings, 20)]
+
+
+def measure(func: Callable[[], Any]) -> dict[str, float]:
+    """Best wall time of `REPEATS` runs, and the peak traced memory of one run."""
+    times: list[float] = []
+    for _ in range(REPEATS):
+        start = perf_counter()
+        func()
+        times.append(perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": min(times), "peak_bytes": peak}
+
+
+def run() -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for n_ings in INGREDIENT_COUNTS:
+        for range_width in RANGE_WIDTHS:
+            ings = get_ingredients(n_ings, range_width)
+            for mode, factory in MODES.items():
+                key = f"{mode}/ings={n_ings}/width={range_width}"
+                results[key] = measure(lambda: factory(ings))
+                print(f"{key:<28} {results[key]['seconds'] * 1000:10.3f} ms {results[key]['peak_bytes'] / 1024:12.1f} KiB")
+    return results
+
+
+def validate(n_samples: int = 1_000_000, max_z_score: float = 6.0) -> bool:
+    """Checks every 1 to 6 ingredient case of the narrowest and widest range against a Monte Carlo simulation."""
+    is_valid = True
+    for n_ings in INGREDIENT_COUNTS:
+        for range_width in (RANGE_WIDTHS[0], RANGE_WIDTHS[-1]):
+            craftutil = CraftedUtil(get_ingredients(n_ings, range_width))
+            z_score = CraftedSimulationUtil.max_z_score(craftutil, n_samples, seed=n_ings * range_width)
+            is_valid &= z_score <= max_z_score
+            print(f"monte carlo/ings={n_ings}/width={range_width}: max z-score {z_score:.2f}")
+    return is_valid
+
+
+def diff(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float) -> list[str]:
+    """Returns the cases that regressed by more than `threshold` times their baseline."""
+    regressions: list[str] = []
+    print(f"\n{'case':<28} {'time':>9} {'memory':>9}")
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        time_ratio = result["seconds"] / baseline[key]["seconds"]
+        mem_ratio = result["peak_bytes"] / max(baseline[key]["peak_bytes"], 1)
+        is_slower = time_ratio > threshold and result["seconds"] - baseline[key]["seconds"] > MIN_SECONDS_DELTA
+        is_regressed = is_slower or mem_ratio > threshold
+        print(f"{key:<28} {time_ratio:8.2f}x {mem_ratio:8.2f}x{'  REGRESSED' if is_regressed else ''}")
+        if is_regressed:
+            regressions.append(key)
+    return regressions
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Benchmarks CraftedUtil and diffs against a baseline.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="Overwrite the baseline with this run.")
+    parser.add_argument("--threshold", type=float, default=1.5, help="Max allowed ratio to the baseline.")
+    parser.add_argument("--validate", action="store_true", help="Also check results against a Monte Carlo simulation.")
+    args = parser.parse_args()
+
+    if args.validate and not validate():
+        print("Monte Carlo validation failed.")
+        return 1
+
+    results = run()
+    exit_code = 0
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = diff(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold}x.")
+            exit_code = 1
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        meta = {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine()}
+        args.baseline.write_text(json.dumps({"meta": meta, "results": results}, indent=2))
+        print(f"\nSaved baseline to {args.baseline}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Compares allocation size and attribute access of `WynnEmeralds` against the previous
+mutable, `__dict__` based design.
+
+Usage:
+    python -m benchmark.wynn_emeralds_benchmark
+"""
+from __future__ import annotations
+import sys
+from timeit import timeit
+import tracemalloc
+from typing import Any, Callable
+
+from fazbot.object import WynnEmeralds
+
+N_OBJECTS = 100_000
+
+
+class LegacyWynnEmeralds:
+    """The previous design: five mutable attributes in a `__dict__`."""
+
+    def __init__(self, emeralds: int = 0, blocks: int = 0, liquids: int = 0, stacks: int = 0) -> None:
+        self._emeralds = emeralds
+        self._blocks = blocks
+        self._liquids = liquids
+        self._stacks = stacks
+        self._total = emeralds + blocks * 64 + liquids * 64 * 64 + stacks * 64 * 64 * 64
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+
+def measure_allocation(factory: Callable[[int], Any]) -> int:
+    """Bytes allocated to keep `N_OBJECTS` instances alive."""
+    tracemalloc.start()
+    objs = [factory(total) for total in range(N_OBJECTS)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+    return current
+
+
+def main() -> int:
+    for name, cls in (("legacy", LegacyWynnEmeralds), ("slotted", WynnEmeralds)):
+        allocated = measure_allocation(lambda total: cls(emeralds=total))
+        obj = cls(emeralds=123_456)
+        create_s = timeit(lambda: cls(emeralds=123_456), number=N_OBJECTS)
+        create_small_s = timeit(lambda: cls(emeralds=100), number=N_OBJECTS)
+        access_s = timeit(lambda: obj.total, number=N_OBJECTS * 10)
+        print(
+            f"{name:<8} {allocated / N_OBJECTS:8.1f} B/object  "
+            f"create {create_s / N_OBJECTS * 1e9:7.1f} ns  "
+            f"create small {create_small_s / N_OBJECTS * 1e9:7.1f} ns  total access {access_s / (N_OBJECTS * 10) * 1e9:6.1f} ns"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from .asset import Asset
+from .asset import Asset, AssetChanges
 from .bot import Bot
 from .config import Config
 from .constants import Constants
@@ -1,19 +1,109 @@
+from hashlib import sha256
 from pathlib import Path
+from time import perf_counter
+
+
+class AssetChanges:
+    """Files changed by an `Asset.reload()`."""
+
+    def __init__(self, added: list[Path], modified: list[Path], removed: list[Path], elapsed: float) -> None:
+        self._added = added
+        self._modified = modified
+        self._removed = removed
+        self._elapsed = elapsed
+
+    def __bool__(self) -> bool:
+        return bool(self._added or self._modified or self._removed)
+
+    def __str__(self) -> str:
+        parts = [
+            f"{label}: {', '.join(fp.name for fp in fps)}"
+            for label, fps in (("added", self._added), ("modified", self._modified), ("removed", self._removed))
+            if fps
+        ]
+        return f"{'; '.join(parts) if parts else 'no changes'} ({self._elapsed * 1000:.1f} ms)"
+
+    @property
+    def added(self) -> list[Path]:
+        return self._added
+
+    @property
+    def modified(self) -> list[Path]:
+        return self._modified
+
+    @property
+    def removed(self) -> list[Path]:
+        return self._removed
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds taken by the reload."""
+        return self._elapsed
 
 
 class Asset:
-    """Class for reading, storing, and writing files stored in 'asset' directory."""
+    """Class for reading, storing, and writing files stored in 'asset' directory. Files are kept
+    once as immutable `bytes`, indexed by file stem and file name for constant time lookups."""
 
     def __init__(self, path: str | Path) -> None:
         self._dir = Path(path) if isinstance(path, str) else path
         self._files: dict[Path, bytes] = {}
+        self._signatures: dict[Path, tuple[int, int, str]] = {}
+        """(mtime in ns, size, content hash) of each file when it was last read."""
+        self._fps_by_stem: dict[str, Path] = {}
+        self._fps_by_name: dict[str, Path] = {}
+        self._fuzzy_fps: dict[str, Path] = {}
+        """Memoized results of the less strict search."""
 
     def read_all(self) -> None:
         """Reads all files in `path`, and stores it into `_files`"""
-        file_paths = list(self._dir.glob("**/*"))
-        for fp in file_paths:
+        self._files = {}
+        self._signatures = {}
+        self.reload()
+
+    def reload(self) -> AssetChanges:
+        """Re-reads only files added or modified since they were last read, and drops deleted files.
+        A file whose mtime or size changed but whose content hash didn't is not reported as modified.
+
+        The new files are swapped in at once, so this can run in a worker thread while readers
+        keep using the previous `files`.
+
+        Returns:
+            AssetChanges: The added, modified and removed files.
+        """
+        start = perf_counter()
+        files = dict(self._files)
+        signatures = dict(self._signatures)
+        added: list[Path] = []
+        modified: list[Path] = []
+
+        fps = {fp for fp in self._dir.glob("**/*") if fp.is_file()}
+        for fp in sorted(fps):
+            stat = fp.stat()
+            signature = signatures.get(fp)
+            if signature is not None and signature[:2] == (stat.st_mtime_ns, stat.st_size):
+                continue
             with open(fp, "rb") as opened_file:
-                self._files[fp] = opened_file.read()
+                data = opened_file.read()
+            content_hash = sha256(data).hexdigest()
+            signatures[fp] = (stat.st_mtime_ns, stat.st_size, content_hash)
+            if signature is None:
+                added.append(fp)
+            elif signature[2] != content_hash:
+                modified.append(fp)
+            else:
+                continue
+            files[fp] = data
+
+        removed = [fp for fp in files if fp not in fps]
+        for fp in removed:
+            del files[fp]
+            del signatures[fp]
+
+        self._signatures = signatures
+        self._files = files
+        self._reindex()
+        return AssetChanges(added, modified, removed, perf_counter() - start)
 
     def write_all(self) -> None:
         """Writes all data in `_files` to their respective file path"""
@@ -39,19 +129,29 @@ class Asset:
         self.files[fp] = data
 
     def get_fp_by_key(self, key: str) -> Path:
+        # Strict search
+        fp = self._fps_by_stem.get(key) or self._fps_by_name.get(key) or self._fuzzy_fps.get(key)
+        if fp is not None:
+            return fp
+        # Less strict search
         for fp in self._files:
-            # Strict search
-            if key == fp.stem:
+            if key in fp.name:
+                self._fuzzy_fps[key] = fp
                 return fp
-        else:
-            # Less strict search
-            for fp in self._files:
-                if key in fp.name:
-                    return fp
-            else:
-                raise KeyError("Asset with key {key} not found")
+        raise KeyError(f"Asset with key {key} not found")
 
     @property
     def files(self) -> dict[Path, bytes]:
         return self._files
 
+    def _reindex(self) -> None:
+        """Rebuilds the lookup indexes from `_files`. The first file of a stem or name wins, like the
+        previous linear search."""
+        fps_by_stem: dict[str, Path] = {}
+        fps_by_name: dict[str, Path] = {}
+        for fp in self._files:
+            fps_by_stem.setdefault(fp.stem, fp)
+            fps_by_name.setdefault(fp.name, fp)
+        self._fps_by_stem = fps_by_stem
+        self._fps_by_name = fps_by_name
+        self._fuzzy_fps = {}
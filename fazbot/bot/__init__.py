@@ -1,6 +1,11 @@
 # type: ignore
+from ._asset_cdn_cache import AssetCdnCache
 from ._asset_manager import AssetManager
+from ._authorization_snapshot import AuthorizationSnapshot
 from ._checks import Checks
+from ._compute_executor import ComputeExecutor
+from ._crafted_distribution_cache import CraftedDistributionCache
+from ._expiry_scheduler import ExpiryScheduler
 from ._utils import Utils
 from ._events import Events
 
@@ -0,0 +1,134 @@
+from __future__ import annotations
+import asyncio
+from hashlib import sha256
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+from nextcord import File, HTTPException, NotFound, TextChannel
+
+from .invoke import Asset
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from nextcord import Message
+
+    from fazbot import Bot
+
+
+class AssetCdnCache:
+    """Uploads the thumbnail variant of every asset once to the configured storage channel, and
+    serves thumbnails from the uploaded attachments' CDN URLs instead of re-attaching the file to
+    every response. Uploads are tagged with the uploaded content's hash, so restarts reuse them.
+    Discord CDN URLs expire, so they are refreshed periodically. Assets without a valid URL fall
+    back to being attached."""
+
+    MESSAGE_PREFIX = "asset:"
+
+    def __init__(self, bot: Bot, refresh_interval: float = 6 * 3600, history_limit: int = 200) -> None:
+        """
+        Args:
+            bot (Bot): The bot.
+            refresh_interval (float, optional): Seconds between CDN URL refreshes. Defaults to 6 hours.
+            history_limit (int, optional): Number of messages in the storage channel scanned for
+                previous uploads. Defaults to 200.
+        """
+        self._bot = bot
+        self._refresh_interval = refresh_interval
+        self._history_limit = history_limit
+        self._channel: TextChannel | None = None
+        self._messages: dict[str, Message] = {}
+        """Uploaded message of each asset, by file name."""
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    async def setup(self) -> None:
+        """Uploads assets that aren't uploaded yet, then starts refreshing their URLs periodically."""
+        channel_id = self._bot.core.config.asset_storage_channel_id
+        if channel_id is None:
+            self._bot.logger.console.info("No asset storage channel configured, assets are sent as attachments")
+            return
+        try:
+            channel = self._bot.client.get_channel(channel_id) or await self._bot.client.fetch_channel(channel_id)
+        except HTTPException as e:
+            self._bot.logger.console.exception(f"Failed fetching asset storage channel {channel_id}: {e}")
+            return
+        if not isinstance(channel, TextChannel):
+            self._bot.logger.console.warning(f"Asset storage channel {channel_id} is not a text channel")
+            return
+        self._channel = channel
+
+        await self.sync()
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self.__refresh_loop())
+
+    async def sync(self) -> None:
+        """Matches every asset to its uploaded message, uploading missing or outdated assets."""
+        if self._channel is None:
+            return
+        uploaded = await self.__get_uploaded_messages()
+        n_uploaded = 0
+        for fp in self._bot.core.asset.files:
+            data = self._bot.asset_manager.get_sendable(fp.name)
+            tag = self.get_tag(fp, data)
+            message = uploaded.get(tag)
+            if message is None or not message.attachments:
+                message = await self.__upload(fp, data)
+                n_uploaded += 1
+            self.__set_message(fp.name, message)
+        file_names = {fp.name for fp in self._bot.core.asset.files}
+        for file_name in set(self._messages) - file_names:
+            Asset.set_url(file_name, None)
+            del self._messages[file_name]
+        self._bot.logger.console.info(f"Synced {len(self._messages)} assets to CDN, uploaded {n_uploaded}")
+
+    async def refresh(self) -> None:
+        """Re-fetches every uploaded message for fresh CDN URLs. Deleted uploads are uploaded again."""
+        if self._channel is None:
+            return
+        for file_name, message in list(self._messages.items()):
+            try:
+                self.__set_message(file_name, await self._channel.fetch_message(message.id))
+            except NotFound:
+                # Fall back to attachments until the asset is uploaded again
+                Asset.set_url(file_name, None)
+                del self._messages[file_name]
+            except HTTPException as e:
+                self._bot.logger.console.exception(f"Failed refreshing CDN URL of asset {file_name}: {e}")
+        if len(self._messages) < len(self._bot.core.asset.files):
+            await self.sync()
+
+    def stop(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    @classmethod
+    def get_tag(cls, fp: Path, data: bytes) -> str:
+        """Content of the upload message of an asset. Changes whenever the asset's content changes."""
+        return f"{cls.MESSAGE_PREFIX}{fp.name}:{sha256(data).hexdigest()[:16]}"
+
+    async def __get_uploaded_messages(self) -> dict[str, Message]:
+        assert self._channel is not None
+        bot_user = self._bot.client.user
+        uploaded: dict[str, Message] = {}
+        async for message in self._channel.history(limit=self._history_limit):
+            if message.author == bot_user and message.content.startswith(self.MESSAGE_PREFIX):
+                # History is newest first, keep the newest upload of each tag
+                uploaded.setdefault(message.content, message)
+        return uploaded
+
+    async def __upload(self, fp: Path, data: bytes) -> Message:
+        assert self._channel is not None
+        return await self._channel.send(content=self.get_tag(fp, data), file=File(BytesIO(data), filename=fp.name))
+
+    def __set_message(self, file_name: str, message: Message) -> None:
+        self._messages[file_name] = message
+        Asset.set_url(file_name, message.attachments[0].url if message.attachments else None)
+
+    async def __refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self.refresh()
+            except HTTPException as e:
+                self._bot.logger.console.exception(f"Failed refreshing asset CDN URLs: {e}")
@@ -1,38 +1,118 @@
 from __future__ import annotations
-from io import BytesIO
+import asyncio
+from hashlib import sha256
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from nextcord import File
+from nextcord import HTTPException
 
-from .invoke import InvokeConvertEmerald, InvokeCraftedProbability, InvokeIngredientProbability
+from fazbot.constants import Constants
+from fazbot.util import ImageUtil
+
+from .invoke import Asset, InvokeConvertEmerald, InvokeConvertEmeraldBulk, InvokeCraftedProbability, InvokeCraftedRecipe, InvokeCraftedSearch, InvokeIngredientProbability, InvokeIngredientSweep
 
 if TYPE_CHECKING:
-    from fazbot import Bot
+    from fazbot import AssetChanges, Bot
 
 
 class AssetManager:
     """Class for managing assets for Invoke classes. Assets passed or set into the `asset` property
-    is automatically converted into a dictionary of `dict[str, File]`. The converted asset is then 
-    passed into class variables of Invoke subclasses automatically."""
+    are indexed by file name into a `dict[str, bytes]`, sharing the asset's bytes without copying.
+    Downscaled variants of every image are added for each usage in `VARIANT_SIZES`. The indexed
+    asset is then passed into class variables of Invoke subclasses automatically."""
+
+    VARIANT_SIZES = {"thumbnail": 160, "icon": 64}
+    """Max width and height of each usage's variant. Twice the size Discord displays them at, for
+    high density screens."""
 
-    def __init__(self, bot: Bot) -> None:
+    def __init__(self, bot: Bot, cache_dir: str | Path = Constants.ASSET_CACHE_DIR) -> None:
+        """
+        Args:
+            bot (Bot): The bot.
+            cache_dir (str | Path, optional): Directory where variants are cached, keyed by their
+                source's hash. Defaults to Constants.ASSET_CACHE_DIR.
+        """
         self._bot = bot
-    
+        self._cache_dir = Path(cache_dir)
+        self._watcher_task: asyncio.Task[None] | None = None
+        self._reload_lock = asyncio.Lock()
+        """Keeps the watcher and /admin reload_asset from reloading and uploading at the same time."""
+
     def load_assets(self) -> None:
-        asset = self._bot.core.asset
-        self._assets = self.__convert_asset_file_type(asset.files)
+        self._assets = self.__build_assets()
         self.__set_invoke_assets()
 
+    def get_sendable(self, file_name: str, usage: str = "thumbnail") -> bytes:
+        """The smallest variant of asset `file_name` fitting `usage`, or the asset itself if it has none."""
+        return self._assets.get(Asset.get_variant_key(file_name, usage)) or self._assets[file_name]
+
+    async def reload_assets(self) -> AssetChanges:
+        """Re-reads changed asset files in a worker thread, then passes them to Invoke classes and
+        the CDN cache if anything changed."""
+        async with self._reload_lock:
+            changes = await asyncio.to_thread(self._bot.core.asset.reload)
+            if changes:
+                self._assets = await asyncio.to_thread(self.__build_assets)
+                self.__set_invoke_assets()
+                await self._bot.asset_cdn_cache.sync()
+        return changes
+
+    def start_watcher(self, interval: float) -> None:
+        """Starts reloading assets every `interval` seconds. Must be called inside the event loop."""
+        if self._watcher_task is None:
+            self._watcher_task = asyncio.create_task(self.__watch(interval))
+
+    def stop_watcher(self) -> None:
+        if self._watcher_task is not None:
+            self._watcher_task.cancel()
+            self._watcher_task = None
+
+    async def __watch(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                changes = await self.reload_assets()
+            except (HTTPException, KeyError, OSError) as e:
+                self._bot.logger.console.exception(f"Failed reloading assets: {e}")
+                continue
+            if changes:
+                self._bot.logger.console.info(f"Reloaded assets, {changes}")
+
+    def __build_assets(self) -> dict[str, bytes]:
+        assets: dict[str, bytes] = {}
+        for fp, data in self._bot.core.asset.files.items():
+            assets[fp.name] = data
+            for usage, size in self.VARIANT_SIZES.items():
+                try:
+                    assets[Asset.get_variant_key(fp.name, usage)] = self.__get_variant(fp, data, usage, size)
+                except ValueError:
+                    # Not an image
+                    break
+        return assets
+
+    def __get_variant(self, fp: Path, data: bytes, usage: str, size: int) -> bytes:
+        """Reads the variant from the cache directory, or creates and caches it. Cached variants of
+        previous versions of the asset are removed."""
+        variant_key = Asset.get_variant_key(fp.name, usage)
+        cache_fp = self._cache_dir / f"{sha256(data).hexdigest()[:16]}.{variant_key}"
+        if cache_fp.exists():
+            return cache_fp.read_bytes()
+
+        variant = ImageUtil.get_thumbnail(data, size)
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            for old_cache_fp in self._cache_dir.glob(f"*.{variant_key}"):
+                old_cache_fp.unlink()
+            cache_fp.write_bytes(variant)
+        except OSError as e:
+            self._bot.logger.console.warning(f"Failed caching asset variant {variant_key}: {e}")
+        return variant
+
     def __set_invoke_assets(self) -> None:
         InvokeConvertEmerald.set_assets(self._assets)
+        InvokeConvertEmeraldBulk.set_assets(self._assets)
         InvokeCraftedProbability.set_assets(self._assets)
+        InvokeCraftedRecipe.set_assets(self._assets)
+        InvokeCraftedSearch.set_assets(self._assets)
         InvokeIngredientProbability.set_assets(self._assets)
-
-    def __convert_asset_file_type(self, assets: dict[Path, bytes]) -> dict[str, File]:
-        assets_: dict[str, File] = {}
-        for fp, asset in assets.items():
-            fileio = BytesIO(asset)
-            file = File(fileio, filename=fp.name)
-            assets_[fp.name] = file
-        return assets_
+        InvokeIngredientSweep.set_assets(self._assets)
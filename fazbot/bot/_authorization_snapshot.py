@@ -0,0 +1,128 @@
+from __future__ import annotations
+import asyncio
+from datetime import timedelta
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING
+
+from sqlalchemy.exc import SQLAlchemyError
+
+if TYPE_CHECKING:
+    from fazbot import Bot
+
+
+class AuthorizationSnapshot:
+    """In-memory copy of banned user IDs and whitelisted guild IDs, so global checks are answered
+    without database I/O. Admin commands update it write-through after committing, and a periodic
+    reconcile reloads it from the database to repair any drift."""
+
+    def __init__(self, bot: Bot, reconcile_interval: float = 300) -> None:
+        """
+        Args:
+            bot (Bot): The bot.
+            reconcile_interval (float, optional): Seconds between reloads from the database.
+                Defaults to 300.
+        """
+        self._bot = bot
+        self._reconcile_interval = reconcile_interval
+        self._banned_user_ids: set[int] = set()
+        self._whitelisted_guild_ids: set[int] = set()
+        self._loaded_at: float | None = None
+        self._last_drift = 0
+        """Number of IDs the last reconcile added or removed."""
+        self._write_logs: list[list[tuple[bool, bool, tuple[int, ...]]]] = []
+        """Write-throughs made during each running `load()`, as (is ban, is add, IDs)."""
+        self._reconcile_task: asyncio.Task[None] | None = None
+
+    async def load(self) -> None:
+        """Replaces the snapshot with the current database state. Write-throughs made while it
+        loads are replayed onto the loaded state, as the database read may have missed them."""
+        t1 = perf_counter()
+        write_log: list[tuple[bool, bool, tuple[int, ...]]] = []
+        self._write_logs.append(write_log)
+        try:
+            with self._bot.core.enter_fazbotdb() as db:
+                banned_user_ids = set(await db.banned_user_repository.get_all_banned_user_ids())
+                whitelisted_guild_ids = set(await db.whitelisted_guild_repository.get_all_whitelisted_guild_ids())
+        finally:
+            self._write_logs = [log for log in self._write_logs if log is not write_log]
+        for is_ban, is_add, ids in write_log:
+            self.__apply(banned_user_ids if is_ban else whitelisted_guild_ids, is_add, ids)
+
+        if self.is_loaded:
+            self._last_drift = len(banned_user_ids ^ self._banned_user_ids) + len(whitelisted_guild_ids ^ self._whitelisted_guild_ids)
+        self._banned_user_ids = banned_user_ids
+        self._whitelisted_guild_ids = whitelisted_guild_ids
+        self._loaded_at = monotonic()
+        self._bot.logger.performance.record(f"{self.__class__.__qualname__}.load", timedelta(seconds=perf_counter() - t1))
+
+    def start_reconcile(self) -> None:
+        """Starts reloading the snapshot every `reconcile_interval` seconds. Must be called inside the event loop."""
+        if self._reconcile_task is None:
+            self._reconcile_task = asyncio.create_task(self.__reconcile_loop())
+
+    def stop_reconcile(self) -> None:
+        if self._reconcile_task is not None:
+            self._reconcile_task.cancel()
+            self._reconcile_task = None
+
+    def is_banned(self, user_id: int) -> bool:
+        return user_id in self._banned_user_ids
+
+    def is_whitelisted(self, guild_id: int) -> bool:
+        return guild_id in self._whitelisted_guild_ids
+
+    def ban(self, *user_ids: int) -> None:
+        self.__write(True, True, user_ids)
+
+    def unban(self, *user_ids: int) -> None:
+        self.__write(True, False, user_ids)
+
+    def whitelist(self, *guild_ids: int) -> None:
+        self.__write(False, True, guild_ids)
+
+    def unwhitelist(self, *guild_ids: int) -> None:
+        self.__write(False, False, guild_ids)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    @property
+    def banned_user_ids(self) -> frozenset[int]:
+        return frozenset(self._banned_user_ids)
+
+    @property
+    def whitelisted_guild_ids(self) -> frozenset[int]:
+        return frozenset(self._whitelisted_guild_ids)
+
+    @property
+    def staleness(self) -> float:
+        """Seconds since the snapshot was last loaded from the database. Infinite if never loaded."""
+        return monotonic() - self._loaded_at if self._loaded_at is not None else float("inf")
+
+    @property
+    def last_drift(self) -> int:
+        return self._last_drift
+
+    def __write(self, is_ban: bool, is_add: bool, ids: tuple[int, ...]) -> None:
+        self.__apply(self._banned_user_ids if is_ban else self._whitelisted_guild_ids, is_add, ids)
+        for write_log in self._write_logs:
+            write_log.append((is_ban, is_add, ids))
+
+    @staticmethod
+    def __apply(ids: set[int], is_add: bool, changed_ids: tuple[int, ...]) -> None:
+        if is_add:
+            ids.update(changed_ids)
+        else:
+            ids.difference_update(changed_ids)
+
+    async def __reconcile_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._reconcile_interval)
+            try:
+                await self.load()
+            except SQLAlchemyError as e:
+                self._bot.logger.console.exception(f"Failed reconciling authorization snapshot: {e}")
+                continue
+            if self._last_drift:
+                self._bot.logger.console.warning(f"Reconciled authorization snapshot, repaired {self._last_drift} IDs")
@@ -29,8 +29,12 @@ class Checks:
             return False
 
         user_id = interaction.user.id
-        with self._bot.core.enter_fazbotdb() as db:
-            is_banned = await db.banned_user_repository.is_exists(user_id)
+        snapshot = self._bot.authorization_snapshot
+        if snapshot.is_loaded:
+            is_banned = snapshot.is_banned(user_id)
+        else:
+            with self._bot.core.enter_fazbotdb() as db:
+                is_banned = await db.banned_user_repository.is_exists(user_id)
 
         if is_banned:
             await self._bot.logger.discord.warning(f"is_banned check for user {interaction.user.global_name} ({user_id}) returned True")
@@ -42,8 +46,12 @@ class Checks:
             return False
 
         guild_id = interaction.guild.id
-        with self._bot.core.enter_fazbotdb() as db:
-            is_whitelisted = await db.whitelisted_guild_repository.is_exists(guild_id)
+        snapshot = self._bot.authorization_snapshot
+        if snapshot.is_loaded:
+            is_whitelisted = snapshot.is_whitelisted(guild_id)
+        else:
+            with self._bot.core.enter_fazbotdb() as db:
+                is_whitelisted = await db.whitelisted_guild_repository.is_exists(guild_id)
 
         if not is_whitelisted:
             await self._bot.logger.discord.warning(f"is_whitelisted check for guild {interaction.guild.name} ({guild_id}) returned False")
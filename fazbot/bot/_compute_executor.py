@@ -0,0 +1,141 @@
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta, timezone
+from time import perf_counter, time
+from typing import Any, Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fazbot.logger import PerformanceLogger
+
+
+class ComputeExecutor:
+    """Runs CPU-heavy pure computations in a process pool so they don't block the bot's event loop.
+
+    Submitted callables and their arguments must be picklable. Queue-wait and run durations
+    of every job are recorded into `PerformanceLogger` under `compute.<qualname>.queue_wait`
+    and `compute.<qualname>.run`."""
+
+    def __init__(
+            self,
+            performance_logger: PerformanceLogger,
+            max_workers: int = 2,
+            max_queue: int = 16,
+            timeout: float = 10.0
+        ) -> None:
+        """
+        Args:
+            performance_logger (PerformanceLogger): Logger to record job timings into.
+            max_workers (int, optional): Number of worker processes. Defaults to 2.
+            max_queue (int, optional): Max number of jobs waiting for a worker. Submissions
+                beyond it are rejected. Defaults to 16.
+            timeout (float, optional): Default per-job timeout in seconds. Defaults to 10.0.
+        """
+        self._performance_logger = performance_logger
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._timeout = timeout
+
+        self._pool: ProcessPoolExecutor | None = None
+        self._pending = 0
+
+    def start(self) -> None:
+        """Creates the process pool and launches its workers. Should be called before the bot thread
+        starts, so that workers are forked from a process that has no other running threads."""
+        self._pool = ProcessPoolExecutor(self._max_workers)
+        self._pool.submit(_noop).result()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def submit[T](
+            self,
+            func: Callable[..., T],
+            *args: Any,
+            timeout: float | None = None,
+            deadline: datetime | None = None
+        ) -> T:
+        """Runs `func(*args)` in a worker process.
+
+        Args:
+            func (Callable[..., T]): Picklable pure function to run.
+            timeout (float | None, optional): Job timeout in seconds. Defaults to the executor timeout.
+            deadline (datetime | None, optional): Timezone-aware datetime after which the result is
+                useless, e.g. `Interaction.expires_at`. Defaults to None.
+
+        Raises:
+            RuntimeError: If the queue is full.
+            TimeoutError: If the job didn't finish within the timeout or before the deadline.
+                The job is cancelled if it hasn't been handed to a worker yet. Otherwise it keeps
+                running and counts towards the queue limit until it finishes, but its result is discarded.
+        """
+        timeout = self.__get_effective_timeout(timeout, deadline)
+        if self._pending >= self._max_workers + self._max_queue:
+            raise RuntimeError("The bot is busy with other computations. Please try again later.")
+
+        pool = self.__get_pool()
+        qualname = func.__qualname__
+        submitted_at = time()
+        loop = asyncio.get_running_loop()
+        try:
+            job = pool.submit(_run_timed, func, args)
+            self._pending += 1
+            # Released when the job itself is done, not when the caller stops waiting, so abandoned
+            # jobs still running in a worker keep counting towards the queue limit. Added before
+            # wrap_future(), so the count is released before the caller resumes.
+            job.add_done_callback(lambda _: self.__release(loop))
+            started_at, run_duration, res = await asyncio.wait_for(asyncio.wrap_future(job), timeout)
+        except TimeoutError:
+            job.cancel()
+            raise TimeoutError(f"Computation {qualname} timed out after {timeout:.1f}s.")
+        except BrokenProcessPool:
+            self._pool = None
+            raise
+
+        perf = self._performance_logger
+        perf.record(f"compute.{qualname}.queue_wait", timedelta(seconds=max(started_at - submitted_at, 0)))
+        perf.record(f"compute.{qualname}.run", timedelta(seconds=run_duration))
+        return res
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted jobs that haven't finished yet, queued or running."""
+        return self._pending
+
+    def __release(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Called from the pool's thread when a job is done."""
+        def decrement() -> None:
+            self._pending -= 1
+
+        try:
+            loop.call_soon_threadsafe(decrement)
+        except RuntimeError:
+            pass  # Event loop is closed, nothing is waiting on the count anymore
+
+    def __get_effective_timeout(self, timeout: float | None, deadline: datetime | None) -> float:
+        timeout = self._timeout if timeout is None else timeout
+        if deadline is not None:
+            remaining = (deadline - datetime.now(timezone.utc)).total_seconds()
+            if remaining <= 0:
+                raise TimeoutError("Interaction expired before the computation started.")
+            timeout = min(timeout, remaining)
+        return timeout
+
+    def __get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self._max_workers)
+        return self._pool
+
+
+def _noop() -> None: ...
+
+
+def _run_timed[T](func: Callable[..., T], args: tuple[Any, ...]) -> tuple[float, float, T]:
+    """Runs inside a worker process. Returns the wall-clock start time, run duration, and result."""
+    started_at = time()
+    t1 = perf_counter()
+    res = func(*args)
+    return started_at, perf_counter() - t1, res
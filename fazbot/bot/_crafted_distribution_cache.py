@@ -0,0 +1,95 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from fazbot.object import WynnIngredientValue
+from fazbot.util import CraftedUtil
+
+from .invoke import InvokeCraftedProbability
+
+if TYPE_CHECKING:
+    from fazbot import Bot
+
+
+class CraftedDistributionCache:
+    """Persists `CraftedUtil` distributions in the fazbot database, keyed by the canonical ingredient
+    string, so popular recipes survive restarts without any convolution work. The cache is
+    best-effort: database errors are logged and treated as cache misses.
+
+    The number and total size of stored distributions are tracked in memory, so the table is only
+    scanned for eviction once a limit is exceeded. Eviction then trims it to `EVICT_RATIO` of the
+    limits, so it doesn't rerun on every following save."""
+
+    EVICT_RATIO = 0.9
+
+    def __init__(self, bot: Bot, max_entries: int = 2_000, max_bytes: int = 64 * 1024**2, prewarm_count: int = 50) -> None:
+        """
+        Args:
+            bot (Bot): The bot.
+            max_entries (int, optional): Max number of stored distributions. Defaults to 2_000.
+            max_bytes (int, optional): Max total size of stored distributions. Defaults to 64 MiB.
+            prewarm_count (int, optional): Number of most requested distributions to load into
+                memory on startup. Defaults to 50.
+        """
+        self._bot = bot
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._prewarm_count = prewarm_count
+        self._usage: tuple[int, int] | None = None
+        """Number of stored distributions and their total size in bytes. None until read from the database."""
+
+    async def load(self, ingredients: list[WynnIngredientValue]) -> CraftedUtil | None:
+        """Loads the stored distribution of canonically ordered `ingredients`, if any."""
+        try:
+            with self._bot.core.enter_fazbotdb() as db:
+                entity = await db.crafted_distribution_repository.get(self.get_key(ingredients))
+        except SQLAlchemyError as e:
+            self._bot.logger.console.exception(f"Failed loading crafted distribution: {e}")
+            return None
+        return CraftedUtil.from_bytes(ingredients, entity.data) if entity else None
+
+    async def save(self, ingredients: list[WynnIngredientValue], craftutil: CraftedUtil) -> None:
+        """Stores the distribution of canonically ordered `ingredients`, keeping its request count
+        if it is already stored. Evicts least recently requested distributions if that exceeds
+        the size limits."""
+        data = craftutil.to_bytes()
+        try:
+            with self._bot.core.enter_fazbotdb() as db:
+                repo = db.crafted_distribution_repository
+                is_inserted = await repo.upsert(self.get_key(ingredients), data)
+                if self._usage is None:
+                    self._usage = await repo.get_usage()
+                elif is_inserted:
+                    entries, total_bytes = self._usage
+                    self._usage = (entries + 1, total_bytes + len(data))
+
+                entries, total_bytes = self._usage
+                if entries > self._max_entries or total_bytes > self._max_bytes:
+                    await repo.evict(int(self._max_entries * self.EVICT_RATIO), int(self._max_bytes * self.EVICT_RATIO))
+                    self._usage = await repo.get_usage()
+        except SQLAlchemyError as e:
+            self._usage = None
+            self._bot.logger.console.exception(f"Failed saving crafted distribution: {e}")
+
+    async def prewarm(self) -> None:
+        """Loads the most requested distributions into `InvokeCraftedProbability`'s in-memory cache."""
+        try:
+            with self._bot.core.enter_fazbotdb() as db:
+                entities = await db.crafted_distribution_repository.get_most_requested(self._prewarm_count)
+        except SQLAlchemyError as e:
+            self._bot.logger.console.exception(f"Failed prewarming crafted distributions: {e}")
+            return
+
+        for entity in entities:
+            ingredients = self.parse_key(entity.ingredients)
+            InvokeCraftedProbability.add_cached_craftutil(CraftedUtil.from_bytes(ingredients, entity.data))
+        self._bot.logger.console.info(f"Prewarmed {len(entities)} crafted distributions")
+
+    @staticmethod
+    def get_key(ingredients: list[WynnIngredientValue]) -> str:
+        return ";".join(",".join(map(str, ing.to_tuple())) for ing in ingredients)
+
+    @staticmethod
+    def parse_key(key: str) -> list[WynnIngredientValue]:
+        return [WynnIngredientValue.from_string(ing_str) for ing_str in key.split(";")] if key else []
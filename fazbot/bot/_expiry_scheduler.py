@@ -0,0 +1,143 @@
+from __future__ import annotations
+import asyncio
+from datetime import datetime, timedelta
+import heapq
+from typing import Any, Callable, TYPE_CHECKING
+
+from sqlalchemy.exc import SQLAlchemyError
+
+if TYPE_CHECKING:
+    from fazbot import Bot, IFazBotDatabase
+    from fazbot.db.fazbot.repository._expirable_repository import ExpirableRepository
+
+
+class ExpiryScheduler:
+    """Deletes timed entries, such as timed bans and whitelists, once their `until` passes.
+
+    Upcoming expirations are kept in a min-heap, so the scheduler sleeps until the earliest one
+    instead of polling rows. Each tick deletes every expired row of a table with one
+    `DELETE ... WHERE until <= now`, then calls the table's callback with the expired IDs."""
+
+    def __init__(self, bot: Bot, max_sleep: float = 3600, retry_delay: float = 60) -> None:
+        """
+        Args:
+            bot (Bot): The bot.
+            max_sleep (float, optional): Max seconds between ticks. Defaults to 3600.
+            retry_delay (float, optional): Seconds before retrying a failed delete. Defaults to 60.
+        """
+        self._bot = bot
+        self._max_sleep = max_sleep
+        self._retry_delay = retry_delay
+        self._sources: dict[str, tuple[Callable[[IFazBotDatabase], ExpirableRepository[Any, Any]], Callable[..., None]]] = {}
+        self._heap: list[tuple[datetime, str, Any]] = []
+        self._untils: dict[tuple[str, Any], datetime] = {}
+        """Current expiry of every scheduled entry. Heap entries that don't match it are stale."""
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def register(
+            self,
+            name: str,
+            get_repository: Callable[[IFazBotDatabase], ExpirableRepository[Any, Any]],
+            on_expire: Callable[..., None]
+        ) -> None:
+        """Registers a table whose entries expire.
+
+        Args:
+            name (str): Name of the table, used by `schedule()`.
+            get_repository (Callable[[IFazBotDatabase], ExpirableRepository]): Gets the table's repository.
+            on_expire (Callable[..., None]): Called with the IDs of the expired entries.
+        """
+        self._sources[name] = (get_repository, on_expire)
+
+    async def load(self) -> None:
+        """Schedules the expiry of every timed entry in the registered tables."""
+        for name, (get_repository, _) in self._sources.items():
+            with self._bot.core.enter_fazbotdb() as db:
+                expirations = await get_repository(db).get_expirations()
+            for id_, until in expirations:
+                self.schedule(name, id_, until)
+        self._bot.logger.console.info(f"Scheduled {len(self._untils)} expirations")
+
+    def schedule(self, name: str, id_: Any, until: datetime) -> None:
+        """Schedules entry `id_` of table `name` to expire at `until`, replacing any previous expiry."""
+        if name not in self._sources:
+            raise KeyError(f"Table {name} is not registered.")
+        until = self.to_column_time(until)
+        self._untils[(name, id_)] = until
+        heapq.heappush(self._heap, (until, name, id_))
+        if self._heap[0][0] == until:
+            self._wakeup.set()
+
+    def unschedule(self, name: str, id_: Any) -> None:
+        """Cancels the expiry of entry `id_` of table `name`, e.g. when it is deleted early."""
+        self._untils.pop((name, id_), None)
+
+    async def expire_due(self, now: datetime | None = None) -> dict[str, list[Any]]:
+        """Deletes entries expired at `now`, and calls their tables' callbacks.
+
+        Returns:
+            dict[str, list[Any]]: IDs of the expired entries of each table.
+        """
+        now = self.to_column_time(now) if now else datetime.now()
+        due: dict[str, list[Any]] = {}
+        while self._heap and self._heap[0][0] <= now:
+            until, name, id_ = heapq.heappop(self._heap)
+            if self._untils.get((name, id_)) != until:
+                continue
+            del self._untils[(name, id_)]
+            due.setdefault(name, []).append(id_)
+
+        expired: dict[str, list[Any]] = {}
+        for name, ids in due.items():
+            get_repository, on_expire = self._sources[name]
+            try:
+                with self._bot.core.enter_fazbotdb() as db:
+                    await get_repository(db).delete_expired(now)
+            except SQLAlchemyError as e:
+                self._bot.logger.console.exception(f"Failed deleting expired {name} entries: {e}")
+                for id_ in ids:
+                    self.schedule(name, id_, now + timedelta(seconds=self._retry_delay))
+                continue
+            on_expire(*ids)
+            expired[name] = ids
+        return expired
+
+    @staticmethod
+    def to_column_time(until: datetime) -> datetime:
+        """Converts `until` to naive local time at whole seconds, the convention of the `until` columns.
+        Timezone-aware datetimes, e.g. parsed from `12:00 UTC`, can't be compared with them, and
+        MySQL `DATETIME` rounds fractional seconds, so a rounded up entry would outlive its expiry."""
+        if until.tzinfo is not None:
+            until = until.astimezone().replace(tzinfo=None)
+        return until.replace(microsecond=0)
+
+    def start(self) -> None:
+        """Starts expiring entries in the background. Must be called inside the event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.__run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @property
+    def pending(self) -> int:
+        """Number of scheduled expirations."""
+        return len(self._untils)
+
+    async def __run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            expired = await self.expire_due()
+            for name, ids in expired.items():
+                self._bot.logger.console.info(f"Expired {len(ids)} {name} entries")
+
+            delay = self._max_sleep
+            if self._heap:
+                delay = min(delay, max((self._heap[0][0] - datetime.now()).total_seconds(), 0))
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
@@ -7,7 +7,7 @@ if TYPE_CHECKING:
 
     from fazbot import Core, Logger
 
-    from . import AssetManager, Checks, Events
+    from . import AssetCdnCache, AssetManager, AuthorizationSnapshot, Checks, ComputeExecutor, CraftedDistributionCache, Events, ExpiryScheduler
     from .cog import CogCore
 
 
@@ -16,8 +16,12 @@ class Bot(Protocol):
     def stop(self) -> None: ...
     async def on_ready_setup(self) -> None: ...
     @property
+    def asset_cdn_cache(self) -> AssetCdnCache: ...
+    @property
     def asset_manager(self) -> AssetManager: ...
     @property
+    def authorization_snapshot(self) -> AuthorizationSnapshot: ...
+    @property
     def cogs(self) -> CogCore: ...
     @property
     def core(self) -> Core: ...
@@ -26,6 +30,12 @@ class Bot(Protocol):
     @property
     def checks(self) -> Checks: ...
     @property
+    def compute_executor(self) -> ComputeExecutor: ...
+    @property
+    def crafted_distribution_cache(self) -> CraftedDistributionCache: ...
+    @property
     def events(self) -> Events: ...
     @property
+    def expiry_scheduler(self) -> ExpiryScheduler: ...
+    @property
     def logger(self) -> Logger: ...
@@ -1,16 +1,24 @@
 from __future__ import annotations
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import nextcord
 from nextcord import Interaction
 
 from . import CogBase
-from .. import Utils
+from .. import ExpiryScheduler, Utils
+
+if TYPE_CHECKING:
+    from fazbot.db import LatencyHistogram
 
 
 class Admin(CogBase):
 
+    _DB_STATS_LIMIT = 10
+    """Max query shapes listed by `/admin db_stats`."""
+    _DB_STATS_WIDTH = 80
+    """Max characters of a query shape listed by `/admin db_stats`."""
+
     # override
     def _setup(self) -> None:
         client = self._bot.client
@@ -28,6 +36,27 @@ class Admin(CogBase):
     @nextcord.slash_command(name="admin", description="Admin commands.")
     async def admin(self, interaction: Interaction[Any]) -> None: ...
   
+    @admin.subcommand(name="auth_snapshot")
+    async def auth_snapshot(self, interaction: Interaction[Any], reconcile: bool = False) -> None:
+        """(dev only) Shows the in-memory ban and whitelist snapshot.
+
+        Parameters
+        ----------
+        reconcile : bool, optional
+            Reloads the snapshot from the database first, by default False
+        """
+        snapshot = self._bot.authorization_snapshot
+        if reconcile:
+            await snapshot.load()
+
+        await self._respond_successful(
+            interaction,
+            f"Banned users: `{len(snapshot.banned_user_ids)}`\n"
+            f"Whitelisted guilds: `{len(snapshot.whitelisted_guild_ids)}`\n"
+            f"Staleness: `{snapshot.staleness:.1f}s`\n"
+            f"Last drift: `{snapshot.last_drift}` IDs"
+        )
+
     @admin.subcommand(name="ban")
     async def ban(
             self,
@@ -60,11 +89,14 @@ class Admin(CogBase):
                 user_id=user.id,
                 reason=reason,
                 from_=datetime.now(),
-                until=Utils.must_parse_date_string(until) if until else None
+                until=ExpiryScheduler.to_column_time(Utils.must_parse_date_string(until)) if until else None
             )
 
             await banlist.insert(user_to_ban)
 
+        self._bot.authorization_snapshot.ban(user.id)
+        if user_to_ban.until is not None:
+            self._bot.expiry_scheduler.schedule(banlist.table_name, user.id, user_to_ban.until)
         await self._respond_successful(interaction, f"Banned user `{user.name}` (`{user.id}`).")
 
     @admin.subcommand(name="unban")
@@ -85,9 +117,60 @@ class Admin(CogBase):
                 return await self._respond_error(interaction, f"User `{user.name}` (`{user.id}`) is not banned.")
 
             await banlist.delete(user.id, session)
-            
+
+        self._bot.authorization_snapshot.unban(user.id)
+        self._bot.expiry_scheduler.unschedule(banlist.table_name, user.id)
         await self._respond_successful(interaction, f"Unbanned user `{user.name}` (`{user.id}`).")
 
+    @admin.subcommand(name="db_pool")
+    async def db_pool(self, interaction: Interaction[Any], reset: bool = False) -> None:
+        """(dev only) Shows the database connection pool usage.
+
+        Parameters
+        ----------
+        reset : bool, optional
+            Resets the recorded checkout waits afterwards, by default False
+        """
+        with self._bot.core.enter_fazbotdb() as db:
+            profile = db.pool_profile
+            stats = db.pool_statistics
+
+        await self._respond_successful(
+            interaction,
+            f"Checked out: `{stats.checked_out}`/`{stats.size}` (+`{stats.overflow}`/`{profile.max_overflow}` overflow)\n"
+            f"Idle: `{stats.checked_in}`\n"
+            f"Checkouts: `{stats.checkouts}`\n"
+            f"Wait: `{stats.mean_wait * 1000:.2f} ms` mean, `{stats.max_wait * 1000:.2f} ms` max"
+        )
+        if reset:
+            stats.reset()
+
+    @admin.subcommand(name="db_stats")
+    async def db_stats(self, interaction: Interaction[Any], by_operation: bool = False, reset: bool = False) -> None:
+        """(dev only) Shows database query latency percentiles of the slowest query shapes.
+
+        Parameters
+        ----------
+        by_operation : bool, optional
+            Groups queries by repository method instead of by statement, by default False
+        reset : bool, optional
+            Resets the recorded latencies afterwards, by default False
+        """
+        with self._bot.core.enter_fazbotdb() as db:
+            stats = db.query_statistics
+
+        histograms = stats.by_operation if by_operation else stats.by_statement
+        if not histograms:
+            return await self._respond_successful(interaction, "No queries recorded.")
+
+        await self._respond_successful(
+            interaction,
+            f"Top {min(len(histograms), self._DB_STATS_LIMIT)} of {len(histograms)} by total time\n"
+            f"{self.__get_latency_table(histograms)}"
+        )
+        if reset:
+            stats.reset()
+
     @admin.subcommand(name="echo")
     async def echo(self, interaction: Interaction[Any], message: str) -> None:
         """(dev only) Echoes a message.
@@ -101,11 +184,11 @@ class Admin(CogBase):
 
     @admin.subcommand(name="reload_asset")
     async def reload_asset(self, interaction: Interaction[Any]) -> None:
-        """(dev only) Reloads asset."""
-        self._bot.core.asset.read_all()
+        """(dev only) Reloads changed asset files."""
+        await interaction.response.defer()
+        changes = await self._bot.asset_manager.reload_assets()
 
-        self._bot.asset_manager.load_assets()
-        await self._respond_successful(interaction, "Reloaded asset successfully.")
+        await self._respond_successful(interaction, f"Reloaded asset successfully, {changes}.")
 
     @admin.subcommand(name="reload_config")
     async def reload_config(self, interaction: Interaction[Any]) -> None:
@@ -218,11 +301,14 @@ class Admin(CogBase):
                 guild_id=guild.id,
                 guild_name=guild.name,
                 from_=datetime.now(),
-                until=Utils.must_parse_date_string(until) if until else None
+                until=ExpiryScheduler.to_column_time(Utils.must_parse_date_string(until)) if until else None
             )
             
             await whitelist.insert(guild_to_whitelist, session)
-            
+
+        self._bot.authorization_snapshot.whitelist(guild.id)
+        if guild_to_whitelist.until is not None:
+            self._bot.expiry_scheduler.schedule(whitelist.table_name, guild.id, guild_to_whitelist.until)
         await self._respond_successful(interaction, f"Whitelisted guild `{guild.name}` (`{guild.id}`).")
 
     @admin.subcommand(name="unwhitelist")
@@ -242,9 +328,25 @@ class Admin(CogBase):
             if not await whitelist.is_exists(guild.id, session):
                 return await self._respond_error(interaction, f"Guild `{guild.name}` (`{guild.id}`) is not whitelisted.")
 
-            await whitelist.delete(guild.id, session) 
+            await whitelist.delete(guild.id, session)
 
+        self._bot.authorization_snapshot.unwhitelist(guild.id)
+        self._bot.expiry_scheduler.unschedule(whitelist.table_name, guild.id)
         await self._respond_successful(interaction, f"Unwhitelisted guild `{guild.name}` (`{guild.id}`).")
 
+    def __get_latency_table(self, histograms: dict[str, LatencyHistogram]) -> str:
+        top = sorted(histograms.items(), key=lambda item: item[1].total, reverse=True)[:self._DB_STATS_LIMIT]
+        rows = [["n", "p50", "p95", "p99", "rows", "query"]]
+        for name, histogram in top:
+            rows.append([
+                str(histogram.count),
+                *(f"{histogram.get_percentile(percent) * 1000:.1f}" for percent in (50, 95, 99)),
+                f"{histogram.rows / histogram.count:.1f}",
+                name if len(name) <= self._DB_STATS_WIDTH else name[:self._DB_STATS_WIDTH - 3] + "..."
+            ])
+        widths = [max(len(row[col]) for row in rows) for col in range(len(rows[0]) - 1)]
+        lines = [" ".join([*(cell.rjust(width) for cell, width in zip(row, widths)), row[-1]]) for row in rows]
+        return "Latencies in ms, rows per query\n```\n" + "\n".join(lines) + "\n```"
+
     def __is_channel_sendable(self, channel: Any) -> bool:
         return hasattr(channel, "send")
@@ -4,7 +4,7 @@ import nextcord
 from nextcord import Interaction
 
 from . import CogBase
-from ..invoke import InvokeConvertEmerald, InvokeCraftedProbability, InvokeIngredientProbability
+from ..invoke import InvokeConvertEmerald, InvokeConvertEmeraldBulk, InvokeCraftedProbability, InvokeCraftedRecipe, InvokeCraftedSearch, InvokeIngredientProbability, InvokeIngredientSweep
 
 
 class WynnUtils(CogBase):
@@ -22,6 +22,15 @@ class WynnUtils(CogBase):
             ingredient4: str = InvokeCraftedProbability.INGSTR_DEFAULT,
             ingredient5: str = InvokeCraftedProbability.INGSTR_DEFAULT,
             ingredient6: str = InvokeCraftedProbability.INGSTR_DEFAULT,
+            confidence: float | None = None,
+            effectiveness1: str = InvokeCraftedProbability.EFFSTR_DEFAULT,
+            effectiveness2: str = InvokeCraftedProbability.EFFSTR_DEFAULT,
+            effectiveness3: str = InvokeCraftedProbability.EFFSTR_DEFAULT,
+            effectiveness4: str = InvokeCraftedProbability.EFFSTR_DEFAULT,
+            effectiveness5: str = InvokeCraftedProbability.EFFSTR_DEFAULT,
+            effectiveness6: str = InvokeCraftedProbability.EFFSTR_DEFAULT,
+            target: int | None = None,
+            summary_bins: str = "mass",
     ) -> None:
         """Computes crafted roll probabilities.
         Improved with help from afterfive.
@@ -40,11 +49,96 @@ class WynnUtils(CogBase):
             min,max[,efficiency]
         ingredient4: str
             min,max[,efficiency]
+        confidence: float
+            Shows the roll you hit with this % chance, e.g. 90
+        effectiveness1: str
+            Positional effectiveness of ingredient1, e.g. touching=-10,under=20. Finds the best slots
+        effectiveness2: str
+            Positional effectiveness of ingredient2
+        effectiveness3: str
+            Positional effectiveness of ingredient3
+        effectiveness4: str
+            Positional effectiveness of ingredient4
+        effectiveness5: str
+            Positional effectiveness of ingredient5
+        effectiveness6: str
+            Positional effectiveness of ingredient6
+        target: int
+            Finds the slots with the best chance of rolling atleast this, instead of the best expected roll
+        summary_bins: str
+            Groups summary rolls into bins of equal 'mass' (chance) or equal 'width'
         """
         await InvokeCraftedProbability(
-                interaction, [ingredient1, ingredient2, ingredient3, ingredient4, ingredient5, ingredient6]
+                interaction,
+                [ingredient1, ingredient2, ingredient3, ingredient4, ingredient5, ingredient6],
+                confidence,
+                [effectiveness1, effectiveness2, effectiveness3, effectiveness4, effectiveness5, effectiveness6],
+                target,
+                summary_bins  # type: ignore
         ).run()
 
+    @nextcord.slash_command(name="crafted_recipe")
+    async def crafted_recipe(
+            self,
+            interaction: Interaction[Any],
+            ingredient1: str = InvokeCraftedRecipe.INGSTR_DEFAULT,
+            ingredient2: str = InvokeCraftedRecipe.INGSTR_DEFAULT,
+            ingredient3: str = InvokeCraftedRecipe.INGSTR_DEFAULT,
+            ingredient4: str = InvokeCraftedRecipe.INGSTR_DEFAULT,
+            ingredient5: str = InvokeCraftedRecipe.INGSTR_DEFAULT,
+            ingredient6: str = InvokeCraftedRecipe.INGSTR_DEFAULT,
+            stat_names: str = "",
+    ) -> None:
+        """Computes crafted roll probabilities of every stat of a recipe at once.
+
+        Parameters
+        -----------
+        ingredient1: str
+            min,max[,efficiency] of each stat, separated by ';'
+        ingredient2: str
+            min,max[,efficiency] of each stat, separated by ';'
+        ingredient3: str
+            min,max[,efficiency] of each stat, separated by ';'
+        ingredient4: str
+            min,max[,efficiency] of each stat, separated by ';'
+        ingredient5: str
+            min,max[,efficiency] of each stat, separated by ';'
+        ingredient6: str
+            min,max[,efficiency] of each stat, separated by ';'
+        stat_names: str
+            Names of the stats, separated by ','
+        """
+        await InvokeCraftedRecipe(
+                interaction, [ingredient1, ingredient2, ingredient3, ingredient4, ingredient5, ingredient6], stat_names
+        ).run()
+
+    @nextcord.slash_command(name="crafted_search")
+    async def crafted_search(
+            self,
+            interaction: Interaction[Any],
+            candidates: str,
+            target: int,
+            confidence: float = 50,
+            costs: str = "",
+            max_ingredients: int = 6,
+    ) -> None:
+        """Finds the cheapest set of ingredients that rolls atleast the target with the given chance.
+
+        Parameters
+        -----------
+        candidates: str
+            min,max[,efficiency] of each candidate ingredient, separated by ';'
+        target: int
+            Crafted roll to reach
+        confidence: float
+            Required % chance of rolling atleast the target, e.g. 50
+        costs: str
+            Cost of each candidate ingredient, separated by ';'. Finds the smallest set if empty
+        max_ingredients: int
+            Max number of ingredients in the set, up to 6
+        """
+        await InvokeCraftedSearch(interaction, candidates, target, confidence, costs, max_ingredients).run()
+
     @nextcord.slash_command(name="convert_emerald")
     async def convert_emerald(self, interaction: Interaction[Any], emerald_string: str = "") -> None:
         """Converts input emeralds into common emerald units.
@@ -56,8 +150,37 @@ class WynnUtils(CogBase):
         """
         await InvokeConvertEmerald(interaction, emerald_string).run()
 
+    @nextcord.slash_command(name="convert_emerald_bulk")
+    async def convert_emerald_bulk(
+            self,
+            interaction: Interaction[Any],
+            prices: str = "",
+            file: nextcord.Attachment | None = None,
+            as_csv: bool = False,
+    ) -> None:
+        """Converts many emerald prices at once, with their trade market set prices.
+
+        Parameters
+        -----------
+        prices: str
+            Emerald strings separated by ';', e.g. "1stx 2le; 10eb; 1/3x 1000eb"
+        file: nextcord.Attachment
+            Text file with one emerald string per line
+        as_csv: bool
+            Sends the result as a CSV file instead of a table
+        """
+        await InvokeConvertEmeraldBulk(interaction, prices, file, as_csv).run()
+
     @nextcord.slash_command(name="ingredient_probability")
-    async def ingredient_probability(self, interaction: Interaction[Any], base_chance: str, loot_bonus: int = 0, loot_quality: int = 0) -> None:
+    async def ingredient_probability(
+            self,
+            interaction: Interaction[Any],
+            base_chance: str,
+            loot_bonus: int = 0,
+            loot_quality: int = 0,
+            drops: int = 1,
+            confidence: float | None = None,
+    ) -> None:
         """Computes boosted ingredient drop probability after loot bonus and loot quality.
 
         Parameters
@@ -68,6 +191,33 @@ class WynnUtils(CogBase):
             Loot bonus value.
         loot_quality: int
             Loot quality value.
+        drops: int
+            Number of drops to compute the mobs needed for.
+        confidence: float
+            Also shows the mobs needed for this % chance of getting the drops, e.g. 95
         """
-        await InvokeIngredientProbability(interaction, base_chance, loot_bonus, loot_quality).run()
+        await InvokeIngredientProbability(interaction, base_chance, loot_bonus, loot_quality, drops, confidence).run()
+
+    @nextcord.slash_command(name="ingredient_sweep")
+    async def ingredient_sweep(
+            self,
+            interaction: Interaction[Any],
+            base_chance: str,
+            loot_bonuses: str = "0:200:20",
+            loot_qualities: str = "0:100:20",
+            drops: int = 1,
+    ) -> None:
+        """Computes boosted ingredient drop probability over many loot bonus and loot quality values.
 
+        Parameters
+        -----------
+        base_chance: str
+            Ingredient base drop chance. (Supported format: 1.2%, 1.2/100)
+        loot_bonuses: str
+            Loot bonus values, as start:stop:step or comma-separated values, e.g. 0:200:20
+        loot_qualities: str
+            Loot quality values, as start:stop:step or comma-separated values, e.g. 0,50,100
+        drops: int
+            Number of drops to compute the expected mobs for.
+        """
+        await InvokeIngredientSweep(interaction, base_chance, loot_bonuses, loot_qualities, drops).run()
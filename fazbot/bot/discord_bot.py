@@ -2,14 +2,18 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime
 from threading import Thread
+from time import perf_counter
 from typing import TYPE_CHECKING
 
 from nextcord import Intents
 from nextcord.ext import commands
 from sqlalchemy.exc import IntegrityError
 
-from . import AssetManager, Bot, Checks, Events, Utils
+from fazbot.db.fazbot.model import BannedUser, WhitelistedGuild
+
+from . import AssetCdnCache, AssetManager, AuthorizationSnapshot, Bot, Checks, ComputeExecutor, CraftedDistributionCache, Events, ExpiryScheduler, Utils
 from .cog import CogCore
+from .invoke import Invoke, InvokeCraftedProbability
 
 if TYPE_CHECKING:
     from fazbot import Core, Logger
@@ -21,10 +25,17 @@ class DiscordBot(Bot):
         self._core = core
         self._logger = core.logger
 
+        self._asset_cdn_cache = AssetCdnCache(self)
         self._asset_manager = AssetManager(self)
+        self._authorization_snapshot = AuthorizationSnapshot(self)
         self._checks = Checks(self)
+        self._compute_executor = ComputeExecutor(self._logger.performance)
+        self._crafted_distribution_cache = CraftedDistributionCache(self)
         self._cogs = CogCore(self)
         self._events = Events(self)
+        self._expiry_scheduler = ExpiryScheduler(self)
+        self._expiry_scheduler.register(BannedUser.__tablename__, lambda db: db.banned_user_repository, self._authorization_snapshot.unban)
+        self._expiry_scheduler.register(WhitelistedGuild.__tablename__, lambda db: db.whitelisted_guild_repository, self._authorization_snapshot.unwhitelist)
 
         self._event_loop = asyncio.new_event_loop()
 
@@ -40,6 +51,9 @@ class DiscordBot(Bot):
     def start(self) -> None:
         self.logger.console.info(f"Starting {self.__get_cls_qualname()}...")
         self.asset_manager.load_assets()
+        self.compute_executor.start()
+        Invoke.set_compute_executor(self.compute_executor)
+        InvokeCraftedProbability.set_distribution_cache(self.crafted_distribution_cache)
         self.checks.load_checks()
         self.events.load_events()
         self._discord_bot_thread.start()
@@ -47,22 +61,44 @@ class DiscordBot(Bot):
 
     def stop(self) -> None:
         self.logger.console.info(f"Stopping {self.__get_cls_qualname()}...")
+        self.asset_cdn_cache.stop()
+        self.asset_manager.stop_watcher()
+        self.authorization_snapshot.stop_reconcile()
+        self.expiry_scheduler.stop()
         self._event_loop.run_until_complete(self.client.close())
+        self.compute_executor.shutdown()
 
     async def on_ready_setup(self) -> None:
         """Setup after the bot is ready."""
+        await self.__warm_fazbotdb_pool()
         await self.__create_all_fazbot_tables()
         await self.__whitelist_dev_guild()
-
-        whitelisted_guild_ids = await self.__get_whitelisted_guild_ids()
+        await self.authorization_snapshot.load()
+        self.authorization_snapshot.start_reconcile()
+        await self.expiry_scheduler.load()
+        self.expiry_scheduler.start()
+        await self.crafted_distribution_cache.prewarm()
+        await self.asset_cdn_cache.setup()
+        if self.core.config.asset_watch_interval is not None:
+            self.asset_manager.start_watcher(self.core.config.asset_watch_interval)
+
+        whitelisted_guild_ids = list(self.authorization_snapshot.whitelisted_guild_ids)
         await self.cogs.setup(whitelisted_guild_ids)
 
         await self.__sync_dev_guild()
 
+    @property
+    def asset_cdn_cache(self) -> AssetCdnCache:
+        return self._asset_cdn_cache
+
     @property
     def asset_manager(self) -> AssetManager:
         return self._asset_manager
 
+    @property
+    def authorization_snapshot(self) -> AuthorizationSnapshot:
+        return self._authorization_snapshot
+
     @property
     def cogs(self) -> CogCore:
         return self._cogs
@@ -79,10 +115,22 @@ class DiscordBot(Bot):
     def checks(self) -> Checks:
         return self._checks
 
+    @property
+    def compute_executor(self) -> ComputeExecutor:
+        return self._compute_executor
+
+    @property
+    def crafted_distribution_cache(self) -> CraftedDistributionCache:
+        return self._crafted_distribution_cache
+
     @property
     def events(self) -> Events:
         return self._events
 
+    @property
+    def expiry_scheduler(self) -> ExpiryScheduler:
+        return self._expiry_scheduler
+
     @property
     def logger(self) -> Logger:
         return self._logger
@@ -94,14 +142,15 @@ class DiscordBot(Bot):
     def __get_cls_qualname(self) -> str:
         return self.__class__.__qualname__
 
-    async def __create_all_fazbot_tables(self) -> None:
+    async def __warm_fazbotdb_pool(self) -> None:
+        t1 = perf_counter()
         with self.core.enter_fazbotdb() as db:
-            await db.create_all()
+            n = await db.warm_pool()
+        self.logger.console.info(f"Opened {n} database connections in {(perf_counter() - t1) * 1000:.1f} ms")
 
-    async def __get_whitelisted_guild_ids(self) -> list[int]:
+    async def __create_all_fazbot_tables(self) -> None:
         with self.core.enter_fazbotdb() as db:
-            guild_ids = await db.whitelisted_guild_repository.get_all_whitelisted_guild_ids()
-            return list(guild_ids)
+            await db.create_all()
 
     async def __sync_dev_guild(self) -> None:
         """Synchronizes commands registered to dev guild into discord."""
@@ -1,7 +1,12 @@
 from ._asset import Asset
 from ._invoke import Invoke
+from ._paginator import Paginator, PaginatorView
 
 from .invoke_convert_emerald import InvokeConvertEmerald  # depends: Invoke
+from .invoke_convert_emerald_bulk import InvokeConvertEmeraldBulk  # depends: Invoke
 from .invoke_crafted_probability import InvokeCraftedProbability  # depends: Invoke
+from .invoke_crafted_recipe import InvokeCraftedRecipe  # depends: Invoke
+from .invoke_crafted_search import InvokeCraftedSearch  # depends: Invoke
 from .invoke_help import InvokeHelp  # depends: Invoke
 from .invoke_ingredient_probability import InvokeIngredientProbability  # depends: Invoke
+from .invoke_ingredient_sweep import InvokeIngredientSweep  # depends: Invoke, InvokeIngredientProbability
@@ -1,21 +1,73 @@
 from __future__ import annotations
-from copy import deepcopy
-from typing import TYPE_CHECKING
+from io import BytesIO
+import time
+from urllib.parse import parse_qs, urlparse
 
-if TYPE_CHECKING:
-    from nextcord import File
+from nextcord import File
 
 
 class Asset:
 
-    def __init__(self, file: File, file_name: str) -> None:
-        self._file = file
+    URL_EXPIRY_MARGIN = 3600
+    """Seconds before a CDN URL expires at which it is no longer used."""
+
+    _urls: dict[str, tuple[str, float]] = {}
+    """CDN URL and its expiry timestamp of each uploaded asset, by file name. Shared by every
+    `Asset` of the same file."""
+
+    def __init__(self, data: bytes, file_name: str) -> None:
+        self._data = data
         self._file_name = file_name
 
     def get_file_to_send(self) -> File:
-        return deepcopy(self._file)
+        """A fresh `File` to send. Its reader shares the asset's immutable bytes instead of copying them."""
+        # BytesIO only copies its initial bytes once written to, which File never does
+        return File(BytesIO(self._data), filename=self._file_name)
+
+    def get_files_to_send(self) -> list[File]:
+        """Files to attach to a message using this asset. Empty if the asset is served from its CDN URL."""
+        return [] if self.url else [self.get_file_to_send()]
+
+    @staticmethod
+    def get_variant_key(file_name: str, usage: str) -> str:
+        """Key of the downscaled variant of asset `file_name` for `usage`, e.g. craftingtable.thumbnail.png"""
+        stem, dot, suffix = file_name.rpartition(".")
+        return f"{stem}.{usage}.{suffix}" if dot else f"{file_name}.{usage}"
+
+    @property
+    def data(self) -> bytes:
+        return self._data
 
     @property
     def filename(self) -> str:
         return self._file_name
 
+    @property
+    def url(self) -> str | None:
+        """CDN URL of the uploaded asset, or None if it isn't uploaded or the URL is about to expire."""
+        url_expiry = self._urls.get(self._file_name)
+        if url_expiry is None:
+            return None
+        url, expires_at = url_expiry
+        return url if time.time() < expires_at - self.URL_EXPIRY_MARGIN else None
+
+    @property
+    def thumbnail_url(self) -> str:
+        return self.url or f"attachment://{self._file_name}"
+
+    @classmethod
+    def set_url(cls, file_name: str, url: str | None) -> None:
+        """Sets the CDN URL of asset `file_name`. None falls back to attaching the file."""
+        if url is None:
+            cls._urls.pop(file_name, None)
+            return
+        cls._urls[file_name] = (url, cls.__get_url_expiry(url))
+
+    @staticmethod
+    def __get_url_expiry(url: str) -> float:
+        # Discord CDN URLs are signed, with the expiry as a hex unix timestamp in the `ex` parameter
+        ex = parse_qs(urlparse(url).query).get("ex")
+        try:
+            return float(int(ex[0], 16)) if ex else float("inf")
+        except ValueError:
+            return float("inf")
@@ -1,41 +1,55 @@
 from __future__ import annotations
 from abc import ABC
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 from . import Asset
 
 if TYPE_CHECKING:
-    from nextcord import Embed, File, Interaction
+    from nextcord import Embed, Interaction
+    from .. import ComputeExecutor
 
 
 class Invoke(ABC):
 
+    _compute_executor: ComputeExecutor
+
     def __init__(self, interaction: Interaction[Any]) -> None:
         self._interaction = interaction
 
+    @classmethod
+    def set_compute_executor(cls, compute_executor: ComputeExecutor) -> None:
+        Invoke._compute_executor = compute_executor
+
+    async def _compute[T](self, func: Callable[..., T], *args: Any) -> T:
+        """Runs a CPU-heavy pure function in the shared compute executor. The job is abandoned once
+        the interaction expires. The interaction should be deferred before calling this."""
+        return await self._compute_executor.submit(func, *args, deadline=self._interaction.expires_at)
+
     @staticmethod
-    def _set_embed_thumbnail_with_asset(embed: Embed, filename: str) -> None:
-        embed.set_thumbnail(url=f"attachment://{filename}")
+    def _set_embed_thumbnail_with_asset(embed: Embed, asset: Asset) -> None:
+        embed.set_thumbnail(url=asset.thumbnail_url)
 
     @staticmethod
-    def _get_from_assets(assets: dict[str, File], key: str) -> Asset:
+    def _get_from_assets(assets: dict[str, bytes], key: str, usage: str = "thumbnail") -> Asset:
         """Helper method to get an asset.
         Normally only be used inside `_set_assets()`
 
         Args:
-            assets (dict[str, File]): asset dictionary. Normally obtained from `_set_assets()`
+            assets (dict[str, bytes]): asset dictionary. Normally obtained from `_set_assets()`
             key (str): The file name of the asset.
+            usage (str, optional): Usage of the asset. Its downscaled variant for that usage is sent
+                if there is one. Defaults to "thumbnail".
 
         Returns:
-            Asset: The asset object containing File object and the file name
+            Asset: The asset object containing the file's bytes and the file name
         """
-        file = assets.get(key, None)
-        if not file:
+        data = assets.get(Asset.get_variant_key(key, usage), None) or assets.get(key, None)
+        if not data:
             raise KeyError(f"Asset with key {key} doesn't exist.")
-        asset = Asset(file, key)
+        asset = Asset(data, key)
         return asset
 
     @classmethod
-    def set_assets(cls, assets: dict[str, File]) -> None:
+    def set_assets(cls, assets: dict[str, bytes]) -> None:
         ...
 
@@ -0,0 +1,146 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, TYPE_CHECKING
+
+from nextcord import ButtonStyle, ui
+
+if TYPE_CHECKING:
+    from nextcord import Embed, Interaction
+
+
+class Paginator:
+    """Splits embed fields into pages that fit Discord's embed limits. Lines are chunked into pages
+    in one pass, and only (start, end) line ranges are kept per field, so a page's text is only
+    joined once that page is rendered."""
+
+    FIELD_VALUE_LIMIT = 1024
+    EMBED_LIMIT = 6000
+    FIELDS_LIMIT = 25
+    _BASE_EMBED_MARGIN = 100
+    """Room for page numbers that differ between the probed and the rendered base embed."""
+
+    def __init__(self, get_base_embed: Callable[[int, int], Embed], max_fields: int = FIELDS_LIMIT) -> None:
+        """
+        Args:
+            get_base_embed (Callable[[int, int], Embed]): Builds the embed of page (page, total pages),
+                without the paginated fields.
+            max_fields (int, optional): Max fields per page. Defaults to 25.
+        """
+        self._get_base_embed = get_base_embed
+        self._max_fields = max_fields
+        self._budget = self.EMBED_LIMIT - len(get_base_embed(1, 1)) - self._BASE_EMBED_MARGIN
+
+        self._lines: list[str] = []
+        self._pages: list[list[tuple[str, int, int, bool]]] = [[]]
+        """Fields of each page as (name, start line, end line, inline)."""
+        self._page_len = 0
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+    def add_lines(self, lines: Iterable[str], name: str = "") -> None:
+        """Adds lines as one or more fields. Only the first field is named `name`."""
+        start = len(self._lines)
+        field_name = name
+        field_len = 0
+        for line in lines:
+            line_len = len(line) + 1
+            if len(self._lines) > start and (
+                field_len + line_len > self.FIELD_VALUE_LIMIT or
+                self._page_len + len(field_name) + field_len + line_len > self._budget
+            ):
+                self.__add_field(field_name, start, len(self._lines), False, field_len)
+                start = len(self._lines)
+                field_name = ""
+                field_len = 0
+            self._lines.append(line)
+            field_len += line_len
+        if len(self._lines) > start:
+            self.__add_field(field_name, start, len(self._lines), False, field_len)
+
+    def add_field(self, name: str, value: str, inline: bool = False) -> None:
+        """Adds a field as is. `value` should fit in one field."""
+        self._lines.append(value)
+        self.__add_field(name, len(self._lines) - 1, len(self._lines), inline, len(value))
+
+    def get_page(self, page: int) -> Embed:
+        """Renders the embed of `page`, starting from 1."""
+        if not 1 <= page <= self.page_count:
+            raise ValueError(f"Page must be between 1 and {self.page_count}.")
+        embed = self._get_base_embed(page, self.page_count)
+        for name, start, end, inline in self._pages[page - 1]:
+            embed.add_field(name=name, value="\n".join(self._lines[start:end]), inline=inline)
+        return embed
+
+    def __add_field(self, name: str, start: int, end: int, inline: bool, value_len: int) -> None:
+        field_len = len(name) + value_len
+        page = self._pages[-1]
+        if page and (len(page) >= self._max_fields or self._page_len + field_len > self._budget):
+            page = []
+            self._pages.append(page)
+            self._page_len = 0
+        page.append((name, start, end, inline))
+        self._page_len += field_len
+
+
+class PaginatorView(ui.View):
+    """View with buttons to move between the pages of a `Paginator`."""
+
+    def __init__(self, interaction: Interaction[Any], paginator: Paginator, timeout: float = 120) -> None:
+        super().__init__(timeout=timeout)
+        self._interaction = interaction
+        self._paginator = paginator
+        self._page = 1
+        self.__update_page_buttons()
+
+    @property
+    def page(self) -> int:
+        return self._page
+
+    def set_paginator(self, paginator: Paginator) -> None:
+        """Replaces the paginator and goes back to the first page."""
+        self._paginator = paginator
+        self._page = 1
+        self.__update_page_buttons()
+
+    def get_embed(self) -> Embed:
+        return self._paginator.get_page(self._page)
+
+    # override
+    async def on_timeout(self) -> None:
+        # Remove all items on timeout
+        for item in self.children:
+            self.remove_item(item)
+        await self._interaction.edit_original_message(view=self)
+
+    @ui.button(style=ButtonStyle.blurple, emoji="⏮️", row=1)
+    async def first_page(self, button: ui.Button[Any], interaction: Interaction[Any]) -> None:
+        await self._go_to_page(interaction, 1)
+
+    @ui.button(style=ButtonStyle.blurple, emoji="◀️", row=1)
+    async def previous_page(self, button: ui.Button[Any], interaction: Interaction[Any]) -> None:
+        await self._go_to_page(interaction, (self._page - 2) % self._paginator.page_count + 1)
+
+    @ui.button(style=ButtonStyle.red, emoji="⏹️", row=1)
+    async def stop_(self, button: ui.Button[Any], interaction: Interaction[Any]) -> None:
+        self.stop()
+        for item in self.children:
+            self.remove_item(item)
+        await interaction.response.edit_message(view=self)
+
+    @ui.button(style=ButtonStyle.blurple, emoji="▶️", row=1)
+    async def next_page(self, button: ui.Button[Any], interaction: Interaction[Any]) -> None:
+        await self._go_to_page(interaction, self._page % self._paginator.page_count + 1)
+
+    @ui.button(style=ButtonStyle.blurple, emoji="⏭️", row=1)
+    async def last_page(self, button: ui.Button[Any], interaction: Interaction[Any]) -> None:
+        await self._go_to_page(interaction, self._paginator.page_count)
+
+    async def _go_to_page(self, interaction: Interaction[Any], page: int) -> None:
+        self._page = page
+        await interaction.response.edit_message(embed=self.get_embed(), view=self)
+
+    def __update_page_buttons(self) -> None:
+        is_single_page = self._paginator.page_count == 1
+        for item in (self.first_page, self.previous_page, self.next_page, self.last_page):
+            item.disabled = is_single_page  # type: ignore
@@ -9,8 +9,6 @@ from fazbot.util import EmeraldUtil
 from . import Invoke
 
 if TYPE_CHECKING:
-    from nextcord import File
-
     from . import Asset
 
 
@@ -22,24 +20,21 @@ class InvokeConvertEmerald(Invoke):
         super().__init__(interaction)
         self._emerald_string = emerald_string
         self._emeralds = WynnEmeralds.from_string(emerald_string)
-        self._emeralds.simplify()
 
     # override
     @classmethod
-    def set_assets(cls, assets: dict[str, File]) -> None:
+    def set_assets(cls, assets: dict[str, bytes]) -> None:
         cls.ASSET_LIQUIDEMERALD = cls._get_from_assets(assets, "liquidemerald.png")
 
     async def run(self):
         embed_resp = self.__get_embed(self._interaction, self._emeralds)
-        await self._interaction.send(embed=embed_resp, file=self.ASSET_LIQUIDEMERALD.get_file_to_send())
+        await self._interaction.send(embed=embed_resp, files=self.ASSET_LIQUIDEMERALD.get_files_to_send())
 
     def __get_embed(self, interaction: Interaction[Any], emeralds: WynnEmeralds) -> Embed:
         set_price_tm, set_price_silverbull = EmeraldUtil.get_set_price(emeralds)
-        set_price_tm.simplify()
-        set_price_silverbull.simplify()
         embed_resp = Embed(title="Emerald Convertor", color=8894804)
 
-        self._set_embed_thumbnail_with_asset(embed_resp, self.ASSET_LIQUIDEMERALD.filename)
+        self._set_embed_thumbnail_with_asset(embed_resp, self.ASSET_LIQUIDEMERALD)
         embed_resp.description = (f"Converted: **{emeralds}**\n" f"Emeralds Total: **{emeralds.total}e**")
         embed_resp.add_field(name="TM Set Price", value=f"{set_price_tm}", inline=True)
         embed_resp.add_field(name="Silverbull Set Price", value=f"{set_price_silverbull}", inline=True)
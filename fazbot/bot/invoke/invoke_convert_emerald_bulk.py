@@ -0,0 +1,141 @@
+from __future__ import annotations
+import csv
+from io import BytesIO, StringIO
+import re
+from typing import Any, TYPE_CHECKING
+
+from nextcord import Embed, File, Interaction
+import numpy as np
+
+from fazbot.object import WynnEmeralds
+from fazbot.util import EmeraldUtil
+
+from . import Invoke
+
+if TYPE_CHECKING:
+    from nextcord import Attachment
+
+    from . import Asset
+
+
+class InvokeConvertEmeraldBulk(Invoke):
+
+    ASSET_LIQUIDEMERALD: Asset
+    MAX_PRICES = 5000
+    MAX_ATTACHMENT_BYTES = 1024 * 1024
+    TABLE_LIMIT = 3800
+    """Tables longer than this are sent as CSV instead."""
+    _SEPARATOR_PATTERN = re.compile(r"[;\n]")
+    _CSV_HEADER = ("input", "total", "stx", "le", "eb", "e", "tm_set_price", "silverbull_set_price")
+
+    def __init__(self, interaction: Interaction[Any], prices: str = "", attachment: Attachment | None = None, as_csv: bool = False) -> None:
+        super().__init__(interaction)
+        if not prices.strip() and attachment is None:
+            raise ValueError("Paste prices separated by ';' or attach a text file with one price per line.")
+        if attachment is not None and attachment.size > self.MAX_ATTACHMENT_BYTES:
+            raise ValueError(f"Attachment must be at most {self.MAX_ATTACHMENT_BYTES // 1024} KiB.")
+        self._prices = prices
+        self._attachment = attachment
+        self._as_csv = as_csv
+
+    # override
+    @classmethod
+    def set_assets(cls, assets: dict[str, bytes]) -> None:
+        cls.ASSET_LIQUIDEMERALD = cls._get_from_assets(assets, "liquidemerald.png")
+
+    async def run(self) -> None:
+        await self._interaction.response.defer()
+        price_strs = self._split_prices(self._prices)
+        attachment_price_strs: list[tuple[int, str]] = []
+        if self._attachment is not None:
+            attachment_price_strs = self._split_prices((await self._attachment.read()).decode(errors="replace"))
+        if len(price_strs) + len(attachment_price_strs) > self.MAX_PRICES:
+            raise ValueError(f"At most {self.MAX_PRICES} prices are allowed.")
+
+        inputs, totals, invalid_lines = self._parse_prices(price_strs)
+        attachment_inputs, attachment_totals, invalid_attachment_lines = self._parse_prices(attachment_price_strs)
+        inputs.extend(attachment_inputs)
+        totals = np.concatenate((totals, attachment_totals))
+        embed = self._get_embed(self._interaction, len(inputs), invalid_lines, invalid_attachment_lines)
+        table = self._get_table(inputs, totals)
+        if self._as_csv or len(table) > self.TABLE_LIMIT:
+            csv_file = File(BytesIO(self._get_csv(inputs, totals).encode()), filename="emeralds.csv")
+            await self._interaction.send(embed=embed, files=[csv_file, *self.ASSET_LIQUIDEMERALD.get_files_to_send()])
+        else:
+            embed.description = f"{embed.description}\n{table}"
+            await self._interaction.send(embed=embed, files=self.ASSET_LIQUIDEMERALD.get_files_to_send())
+
+    def _split_prices(self, prices: str) -> list[tuple[int, str]]:
+        """Returns non-blank prices with their 1-based line numbers, counted before blank lines are skipped."""
+        return [
+            (line, price_str.strip())
+            for line, price_str in enumerate(self._SEPARATOR_PATTERN.split(prices), start=1)
+            if price_str.strip()
+        ]
+
+    @staticmethod
+    def _parse_prices(price_strs: list[tuple[int, str]]) -> tuple[list[str], np.ndarray, list[int]]:
+        """Returns valid inputs, their emerald totals, and the line numbers of invalid inputs.
+        Totals too large for `EmeraldUtil`'s vectorized methods are invalid."""
+        inputs: list[str] = []
+        totals: list[int] = []
+        invalid_lines: list[int] = []
+        for line, price_str in price_strs:
+            try:
+                total = WynnEmeralds.from_string(price_str).total
+            except ValueError:
+                invalid_lines.append(line)
+                continue
+            if abs(total) > EmeraldUtil.MAX_VECTORIZED_TOTAL:
+                invalid_lines.append(line)
+                continue
+            inputs.append(price_str)
+            totals.append(total)
+        return inputs, np.array(totals, dtype=np.int64), invalid_lines
+
+    def _get_embed(
+            self,
+            interaction: Interaction[Any],
+            n_prices: int,
+            invalid_lines: list[int],
+            invalid_attachment_lines: list[int] | None = None
+        ) -> Embed:
+        embed = Embed(title="Emerald Convertor", color=8894804)
+        self._set_embed_thumbnail_with_asset(embed, self.ASSET_LIQUIDEMERALD)
+        embed_desc = [f"Converted **{n_prices}** prices"]
+        for label, lines in (("lines", invalid_lines), ("attachment lines", invalid_attachment_lines or [])):
+            if lines:
+                shown_lines = ", ".join(map(str, lines[:20]))
+                embed_desc.append(f"Skipped invalid {label}: {shown_lines}{', ...' if len(lines) > 20 else ''}")
+        embed.description = "\n".join(embed_desc)
+        if interaction.user:
+            embed.set_author(name=interaction.user.display_name, icon_url=interaction.user.display_avatar.url)
+        return embed
+
+    @staticmethod
+    def _get_table(inputs: list[str], totals: np.ndarray) -> str:
+        tm_prices, silverbull_prices = EmeraldUtil.get_set_prices(totals)
+        rows = [("Input", "Converted", "TM", "Silverbull")]
+        rows.extend(zip(
+            inputs,
+            InvokeConvertEmeraldBulk.__format_emeralds(totals),
+            InvokeConvertEmeraldBulk.__format_emeralds(tm_prices),
+            InvokeConvertEmeraldBulk.__format_emeralds(silverbull_prices),
+        ))
+        widths = [max(len(row[col]) for row in rows) for col in range(len(rows[0]))]
+        lines = ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows]
+        return "```\n" + "\n".join(lines) + "\n```"
+
+    @staticmethod
+    def _get_csv(inputs: list[str], totals: np.ndarray) -> str:
+        tm_prices, silverbull_prices = EmeraldUtil.get_set_prices(totals)
+        columns = np.column_stack((totals, EmeraldUtil.get_breakdowns(totals), tm_prices, silverbull_prices))
+        output = StringIO()
+        writer = csv.writer(output)
+        writer.writerow(InvokeConvertEmeraldBulk._CSV_HEADER)
+        writer.writerows([input_str, *row] for input_str, row in zip(inputs, columns.tolist()))
+        return output.getvalue()
+
+    @staticmethod
+    def __format_emeralds(totals: np.ndarray) -> list[str]:
+        return [f"{stx}stx {le}le {eb}eb {e}e" for stx, le, eb, e in EmeraldUtil.get_breakdowns(totals).tolist()]
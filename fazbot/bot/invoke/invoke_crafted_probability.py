@@ -1,17 +1,18 @@
 from __future__ import annotations
-from decimal import Decimal
 from typing import Any, Callable, TYPE_CHECKING
 
 from nextcord import ButtonStyle, Embed, Interaction, ui
+import numpy as np
 
-from fazbot.object import WynnIngredientValue
-from fazbot.util import CacheUtil, CraftedUtil
+from fazbot.object import WynnIngredientEffectiveness, WynnIngredientValue
+from fazbot.util import CacheUtil, CraftedSlotUtil, CraftedUtil
 
-from . import Invoke
+from . import Invoke, Paginator, PaginatorView
 
 if TYPE_CHECKING:
-    from nextcord import File
+    from fazbot.util.crafted_util import BinMethod
 
+    from .. import CraftedDistributionCache
     from . import Asset
 
 
@@ -19,153 +20,216 @@ class InvokeCraftedProbability(Invoke):
 
     ASSET_CRAFTINGTABLE: Asset
     INGSTR_DEFAULT = "0,0,0"
-
-    def __init__(self, interaction: Interaction[Any], ing_strs: list[str]) -> None:
+    EFFSTR_DEFAULT = ""
+    SUMMARY_THRESHOLD = 40
+    """Distributions with more possible rolls than this are shown as a summary by default."""
+    SUMMARY_BINS = 12
+    SUMMARY_QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+    _CRAFTUTIL_CACHE = CacheUtil(max_size=256, ttl=3600)
+    """Process-wide cache of `CraftedUtil`, shared by every invocation."""
+    _distribution_cache: CraftedDistributionCache | None = None
+    """Persistent cache consulted on `_CRAFTUTIL_CACHE` misses."""
+
+    def __init__(
+            self,
+            interaction: Interaction[Any],
+            ing_strs: list[str],
+            confidence: float | None = None,
+            eff_strs: list[str] | None = None,
+            target: int | None = None,
+            summary_bins: BinMethod = "mass"
+        ) -> None:
         super().__init__(interaction)
         self._ing_strs = ing_strs
-
-        self._cache = CacheUtil()
-        self._cache.register(self, [self._get_craftprobs_embed, self._get_atleast_embed, self._get_atmost_embed])
-
-        self._craftutil = CraftedUtil(self.__parse_ings_str(ing_strs))
-        self._view = self.__View(self)
+        self._ingredients = self.__parse_ings_str(ing_strs)
+        self._effectivenesses = self.__parse_effs_str(ing_strs, eff_strs) if eff_strs else None
+        if confidence is not None and not 0 < confidence <= 100:
+            raise ValueError("Confidence must be between 0 and 100.")
+        self._confidence = confidence
+        self._target = target
+        if summary_bins not in ("mass", "width"):
+            raise ValueError("Summary bins must be either 'mass' or 'width'.")
+        self._summary_bins: BinMethod = summary_bins
+        self._slotutil: CraftedSlotUtil | None = None
 
     # override
     @classmethod
-    def set_assets(cls, assets: dict[str, File]) -> None:
+    def set_assets(cls, assets: dict[str, bytes]) -> None:
         cls.ASSET_CRAFTINGTABLE = cls._get_from_assets(assets, "craftingtable.png")
 
     async def run(self) -> None:
-        embed = self._get_craftprobs_embed(self._interaction, self._craftutil)
-        await self._interaction.send(embed=embed, view=self._view, file=self.ASSET_CRAFTINGTABLE.get_file_to_send())
+        await self._interaction.response.defer()
+        if self._effectivenesses:
+            self._slotutil = await self._compute(CraftedSlotUtil, self._ingredients, self._effectivenesses, self._target)
+            self._ingredients = self._slotutil.get_arranged_ingredients()
+        self._craftutil = await self._get_craftutil(self._ingredients)
+        self._view = self.__View(self)
+        embed = self._view.get_embed()
+        await self._interaction.send(embed=embed, view=self._view, files=self.ASSET_CRAFTINGTABLE.get_files_to_send())
+
+    @classmethod
+    def set_distribution_cache(cls, distribution_cache: CraftedDistributionCache) -> None:
+        cls._distribution_cache = distribution_cache
+
+    @classmethod
+    def add_cached_craftutil(cls, craftutil: CraftedUtil) -> None:
+        """Adds a precomputed `CraftedUtil` of canonically ordered ingredients to the in-memory cache."""
+        cls._CRAFTUTIL_CACHE.set(cls.__get_cache_key(craftutil.ingredients), craftutil)
+
+    async def _get_craftutil(self, ingredients: list[WynnIngredientValue]) -> CraftedUtil:
+        # Crafted probabilities only depend on the multiset of ingredients
+        canonical_ings = sorted(ingredients, key=WynnIngredientValue.to_tuple)
+        key = self.__get_cache_key(canonical_ings)
+        return await self._CRAFTUTIL_CACHE.async_get_or_compute(key, lambda: self.__load_or_compute_craftutil(canonical_ings))
+
+    async def __load_or_compute_craftutil(self, canonical_ings: list[WynnIngredientValue]) -> CraftedUtil:
+        distribution_cache = self._distribution_cache
+        if distribution_cache and (craftutil := await distribution_cache.load(canonical_ings)):
+            return craftutil
+        craftutil = await self._compute(CraftedUtil, canonical_ings)
+        if distribution_cache:
+            await distribution_cache.save(canonical_ings, craftutil)
+        return craftutil
+
+    @staticmethod
+    def __get_cache_key(canonical_ings: list[WynnIngredientValue]) -> str:
+        return CacheUtil.make_key(CraftedUtil.__qualname__, canonical_ings)
 
     def __parse_ings_str(self, ing_strs: list[str]) -> list[WynnIngredientValue]:
-        res: list[WynnIngredientValue] = []
-        for ing_str in ing_strs:
-            if ing_str == InvokeCraftedProbability.INGSTR_DEFAULT:
-                continue
-            ing_str = ing_str.strip()
-            ing_vals = ing_str.split(",")
-            if len(ing_vals) not in {2, 3}:
-                raise ValueError("Invalid ingredient format. Must be in format of 'min,max[,efficiency]'")
-            parsed_ing_vals: list[int] = []
-            for val in ing_vals:
-                try:
-                    parsed_ing_vals.append(int(val))
-                except ValueError:
-                    raise ValueError(f"Exception occured while parsing ingredient value {val}")
-            res.append(WynnIngredientValue(*parsed_ing_vals))
-
-        return res
-
-    def __get_base_embed(self, interaction: Interaction[Any], craftutil: CraftedUtil) -> Embed:
+        return [
+            WynnIngredientValue.from_string(ing_str)
+            for ing_str in ing_strs
+            if ing_str != InvokeCraftedProbability.INGSTR_DEFAULT
+        ]
+
+    def __parse_effs_str(self, ing_strs: list[str], eff_strs: list[str]) -> list[WynnIngredientEffectiveness] | None:
+        """Parses effectiveness of each non-default ingredient. None if no effectiveness is given."""
+        if all(eff_str.strip() == self.EFFSTR_DEFAULT for eff_str in eff_strs):
+            return None
+        return [
+            WynnIngredientEffectiveness.from_string(eff_str)
+            for ing_str, eff_str in zip(ing_strs, eff_strs)
+            if ing_str != InvokeCraftedProbability.INGSTR_DEFAULT
+        ]
+
+    def __get_base_embed(self, interaction: Interaction[Any], craftutil: CraftedUtil, page: int, pages: int) -> Embed:
         embed = Embed(title="Crafteds Probabilites Calculator", color=8894804)
-        self._set_embed_thumbnail_with_asset(embed, self.ASSET_CRAFTINGTABLE.filename)
+        self._set_embed_thumbnail_with_asset(embed, self.ASSET_CRAFTINGTABLE)
         if interaction.user:
             embed.set_author(name=interaction.user.display_name, icon_url=interaction.user.display_avatar.url)
 
         # Embed descriptions
         embed_desc = [f"Ingredients:"]
-        for i, ing in enumerate(craftutil.ingredients, start=1):
+        for i, ing in enumerate(self._ingredients, start=1):
             ing_info = f"- `[{i}]`: {ing.min_value} to {ing.max_value}"  # -[nth]: min to max
             ing_info += f", {ing.boost}% boost" if ing.boost != 0 else ""  # Add boost to info if exist
             embed_desc.append(ing_info)
+        if self._slotutil:
+            embed_desc.extend(self.__get_arrangement_lines(self._slotutil))
+        embed_desc.append(f"Expected Roll: **{craftutil.expected_value:.2f}**")
+        if self._confidence is not None:
+            roll = craftutil.roll_at_confidence(self._confidence / 100)
+            embed_desc.append(
+                f"Roll at **{self._confidence:g}%** confidence: **atleast {roll}** "
+                f"(**{craftutil.prob_at_least(roll) * 100:.2f}%**)"
+            )
         embed.description = "\n".join(embed_desc)
+        if pages > 1:
+            embed.set_footer(text=f"Page {page}/{pages}")
         return embed
 
-    def _get_craftprobs_embed(self, interaction: Interaction[Any], craftutil: CraftedUtil) -> Embed:
-        embed = self.__get_base_embed(interaction, craftutil)
-        embed_fields_values = ""
-        is_first_embed = True
-        for value, probability in craftutil.craft_probs.items():
-            one_in_n = round(Decimal(1 / probability), 2)
-            result = f"Roll: **{value}**, Chance: **{probability * 100:.2f}%** (1 in {one_in_n:,})"
-            if len(embed_fields_values + f"{result}\n") > 1024:
-                embed.add_field(name="Probabilities" if is_first_embed else "", value=embed_fields_values, inline=False)
-                embed_fields_values = ""
-                is_first_embed = False
-            embed_fields_values += f"{result}\n"
-        embed.add_field(name="Probabilities" if is_first_embed else "", value=embed_fields_values, inline=False)
-        return embed
-
-    def _get_atleast_embed(self, interaction: Interaction[Any], craftutil: CraftedUtil) -> Embed:
-        embed = self.__get_base_embed(interaction, craftutil)
-        field_value = ""
-        cmlr_prob = 1
-        is_first_embed = True
-        for val, prob in craftutil.craft_probs.items():
-            one_in_n = round(Decimal(1 / cmlr_prob), 2)
-            line = f"Roll: **atleast {val}**, Chance: **{cmlr_prob * 100:.2f}%** (1 in {one_in_n:,})"
-            if len(field_value + f"{line}\n") > 1024:
-                embed.add_field(name="Probabilities" if is_first_embed else "", value=field_value, inline=False)
-                field_value = ""
-                is_first_embed = False
-
-            cmlr_prob -= prob
-            field_value += f"{line}\n"
-
-        embed.add_field(name="Probabilities" if is_first_embed else "", value=field_value, inline=False)
-        return embed
-
-    def _get_atmost_embed(self, interaction: Interaction[Any], craftutil: CraftedUtil) -> Embed:
-        embed = self.__get_base_embed(interaction, craftutil)
-        field_value = ""
-        cml_prob = 0
-        is_first_embed = True
-        for val, prob in craftutil.craft_probs.items():
-            cml_prob += prob
-            one_in_n = round(Decimal(1 / cml_prob), 2)
-            line = f"Roll: **atmost {val}**, Chance: **{cml_prob * 100:.2f}%** (1 in {one_in_n:,})"
-            if len(field_value + f"{line}\n") > 1024:
-                embed.add_field(name="Probabilities" if is_first_embed else "", value=field_value, inline=False)
-                field_value = ""
-                is_first_embed = False
-
-            field_value += f"{line}\n"
-
-        embed.add_field(name="Probabilities" if is_first_embed else "", value=field_value, inline=False)
-        return embed
-
-    class __View(ui.View):
+    def __get_arrangement_lines(self, slotutil: CraftedSlotUtil) -> list[str]:
+        grid = [["` `"] * CraftedSlotUtil.GRID_COLS for _ in range(CraftedSlotUtil.GRID_ROWS)]
+        for i, slot in enumerate(slotutil.slots, start=1):
+            row, col = divmod(slot, CraftedSlotUtil.GRID_COLS)
+            grid[row][col] = f"`{i}`"
+        lines = [
+            f"Best Arrangement ({slotutil.unique_arrangements} unique of {slotutil.arrangements} searched):"
+        ]
+        lines.extend(" ".join(row) for row in grid)
+        if self._target is not None and slotutil.probability is not None:
+            lines.append(f"Chance of atleast {self._target}: **{slotutil.probability * 100:.2f}%**")
+        return lines
+
+    def _get_summary_paginator(self, interaction: Interaction[Any], craftutil: CraftedUtil) -> Paginator:
+        paginator = Paginator(lambda page, pages: self.__get_base_embed(interaction, craftutil, page, pages))
+        quantiles = craftutil.quantile(np.array(self.SUMMARY_QUANTILES))
+        paginator.add_field(
+            name="Quantiles",
+            value=" ".join(f"`p{q * 100:g}` **{roll}**" for q, roll in zip(self.SUMMARY_QUANTILES, quantiles.tolist()))
+        )
+        lows, highs, probs = craftutil.bin(self.SUMMARY_BINS, self._summary_bins)
+        rolls = [f"{low} to {high}" if low != high else str(low) for low, high in zip(lows.tolist(), highs.tolist())]
+        paginator.add_lines(self.__get_probability_lines("Roll: **{}**", rolls, probs), f"Probabilities (equal {self._summary_bins})")
+        return paginator
+
+    def _get_craftprobs_paginator(self, interaction: Interaction[Any], craftutil: CraftedUtil) -> Paginator:
+        return self.__get_probability_paginator(interaction, craftutil, "Roll: **{}**", craftutil.pmf)
+
+    def _get_atleast_paginator(self, interaction: Interaction[Any], craftutil: CraftedUtil) -> Paginator:
+        return self.__get_probability_paginator(interaction, craftutil, "Roll: **atleast {}**", craftutil.sf)
+
+    def _get_atmost_paginator(self, interaction: Interaction[Any], craftutil: CraftedUtil) -> Paginator:
+        return self.__get_probability_paginator(interaction, craftutil, "Roll: **atmost {}**", craftutil.cdf)
+
+    def __get_probability_paginator(
+            self,
+            interaction: Interaction[Any],
+            craftutil: CraftedUtil,
+            roll_fmt: str,
+            probs: np.ndarray
+        ) -> Paginator:
+        paginator = Paginator(lambda page, pages: self.__get_base_embed(interaction, craftutil, page, pages))
+        paginator.add_lines(self.__get_probability_lines(roll_fmt, craftutil.rolls, probs), "Probabilities")
+        return paginator
+
+    @staticmethod
+    def __get_probability_lines(roll_fmt: str, rolls: np.ndarray | list[str], probs: np.ndarray) -> list[str]:
+        percents = probs * 100
+        one_in_ns = 1 / probs
+        rolls_ = rolls.tolist() if isinstance(rolls, np.ndarray) else rolls
+        return [
+            f"{roll_fmt.format(roll)}, Chance: **{percent:.2f}%** (1 in {one_in_n:,.2f})"
+            for roll, percent, one_in_n in zip(rolls_, percents.tolist(), one_in_ns.tolist())
+        ]
+
+    class __View(PaginatorView):
         def __init__(self, cmd: InvokeCraftedProbability):
-            super().__init__(timeout=60)
+            is_summary = len(cmd._craftutil.rolls) > cmd.SUMMARY_THRESHOLD
+            get_paginator = cmd._get_summary_paginator if is_summary else cmd._get_craftprobs_paginator
+            super().__init__(cmd._interaction, get_paginator(cmd._interaction, cmd._craftutil), timeout=60)
             self._cmd = cmd
-            self._interaction = cmd._interaction
             self._craftutil = cmd._craftutil
+            self._click_button(self.button_summary if is_summary else self.button_distribution)  # type: ignore
 
-        # override
-        async def on_timeout(self) -> None:
-            # Disable all items on timeout
-            for item in self.children:
-                self.remove_item(item)
-            await self._cmd._interaction.edit_original_message(view=self)
+        @ui.button(label="Summary", style=ButtonStyle.green, emoji="📊", row=0)
+        async def button_summary(self, button: ui.Button[Any], interaction: Interaction[Any]) -> None:
+            await self._do_button(button, interaction, self._cmd._get_summary_paginator)
 
-        @ui.button(label="Distribution", style=ButtonStyle.green, emoji="🎲", disabled=True)
+        @ui.button(label="Distribution", style=ButtonStyle.green, emoji="🎲", row=0)
         async def button_distribution(self, button: ui.Button[Any], interaction: Interaction[Any]) -> None:
-            await self._do_button(button, interaction, self._cmd._get_craftprobs_embed)
+            await self._do_button(button, interaction, self._cmd._get_craftprobs_paginator)
 
-        @ui.button(label="Atleast", style=ButtonStyle.green, emoji="📉")
+        @ui.button(label="Atleast", style=ButtonStyle.green, emoji="📉", row=0)
         async def button_atleast(self, button: ui.Button[Any], interaction: Interaction[Any]) -> None:
-            await self._do_button(button, interaction, self._cmd._get_atleast_embed)
+            await self._do_button(button, interaction, self._cmd._get_atleast_paginator)
 
-        @ui.button(label="Atmost", style=ButtonStyle.green, emoji="📈")
+        @ui.button(label="Atmost", style=ButtonStyle.green, emoji="📈", row=0)
         async def button_atmost_callback(self, button: ui.Button[Any], interaction: Interaction[Any]) -> None:
-            await self._do_button(button, interaction, self._cmd._get_atmost_embed)
+            await self._do_button(button, interaction, self._cmd._get_atmost_paginator)
 
         async def _do_button(
                 self,
                 button: ui.Button[Any],
                 interaction: Interaction[Any],
-                embed_strategy: Callable[[Interaction[Any], CraftedUtil], Embed] | None = None,
+                paginator_strategy: Callable[[Interaction[Any], CraftedUtil], Paginator],
             ) -> None:
-            await interaction.response.defer()
             self._click_button(button)
-            embed = embed_strategy(interaction, self._craftutil) if embed_strategy else None
-            await interaction.edit_original_message(embed=embed, view=self)
+            self.set_paginator(paginator_strategy(interaction, self._craftutil))
+            await interaction.response.edit_message(embed=self.get_embed(), view=self)
 
         def _click_button(self, button: ui.Button[InvokeCraftedProbability.__View]) -> None:
-            for item in self.children:
-                if isinstance(item, ui.Button):
-                    item.disabled = False
+            for item in (self.button_summary, self.button_distribution, self.button_atleast, self.button_atmost_callback):
+                item.disabled = False  # type: ignore
             button.disabled = True
-
@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+from nextcord import Embed, Interaction
+import numpy as np
+
+from fazbot.object import WynnIngredientValue
+from fazbot.util import CraftedUtil
+
+from . import Invoke
+
+if TYPE_CHECKING:
+    from fazbot.object import CraftedBatchResult
+
+    from . import Asset
+
+
+class InvokeCraftedRecipe(Invoke):
+
+    ASSET_CRAFTINGTABLE: Asset
+    INGSTR_DEFAULT = ""
+    STAT_SEPARATOR = ";"
+    MAX_STATS = 24
+
+    def __init__(self, interaction: Interaction[Any], ing_strs: list[str], stat_names: str = "") -> None:
+        super().__init__(interaction)
+        self._ing_strs = ing_strs
+        self._ingredients = self.__parse_ings_str(ing_strs)
+        self._n_stats = max((len(stats) for stats in self._ingredients), default=0)
+        if self._n_stats == 0:
+            raise ValueError("At least one ingredient is required.")
+        if self._n_stats > self.MAX_STATS:
+            raise ValueError(f"A recipe can have at most {self.MAX_STATS} stats.")
+        self._stat_names = [name.strip() for name in stat_names.split(",")] if stat_names else []
+
+    # override
+    @classmethod
+    def set_assets(cls, assets: dict[str, bytes]) -> None:
+        cls.ASSET_CRAFTINGTABLE = cls._get_from_assets(assets, "craftingtable.png")
+
+    async def run(self) -> None:
+        await self._interaction.response.defer()
+        batch = await self._compute(CraftedUtil.batch, self._get_recipes_array())
+        embed = self._get_embed(self._interaction, batch)
+        await self._interaction.send(embed=embed, files=self.ASSET_CRAFTINGTABLE.get_files_to_send())
+
+    def _get_recipes_array(self) -> np.ndarray:
+        """Shape (stats, ingredients, 3). Stats an ingredient doesn't have are (0, 0, 0)."""
+        recipes = np.zeros((self._n_stats, len(self._ingredients), 3), dtype=np.int64)
+        for slot, stats in enumerate(self._ingredients):
+            for stat, ing in enumerate(stats):
+                recipes[stat, slot] = ing.to_tuple()
+        return recipes
+
+    def _get_embed(self, interaction: Interaction[Any], batch: CraftedBatchResult) -> Embed:
+        embed = Embed(title="Crafted Recipe Calculator", color=8894804)
+        self._set_embed_thumbnail_with_asset(embed, self.ASSET_CRAFTINGTABLE)
+        if interaction.user:
+            embed.set_author(name=interaction.user.display_name, icon_url=interaction.user.display_avatar.url)
+        embed.description = f"{len(self._ingredients)} ingredients, {self._n_stats} stats"
+
+        medians = batch.quantile(0.5)
+        at_90s = batch.roll_at_confidence(0.9)
+        p_maxs = batch.prob_at_least(batch.roll_maxs)
+        for stat in range(len(batch)):
+            name = self._stat_names[stat] if stat < len(self._stat_names) and self._stat_names[stat] else f"Stat {stat + 1}"
+            embed.add_field(
+                name=name,
+                value=(
+                    f"Range: **{batch.roll_mins[stat]}** to **{batch.roll_maxs[stat]}**\n"
+                    f"Expected: **{batch.expected_values[stat]:.2f}**, Median: **{medians[stat]}**\n"
+                    f"90%: **atleast {at_90s[stat]}**\n"
+                    f"Max roll: **{p_maxs[stat] * 100:.2f}%**"
+                ),
+                inline=True
+            )
+        return embed
+
+    def __parse_ings_str(self, ing_strs: list[str]) -> list[list[WynnIngredientValue]]:
+        return [
+            [WynnIngredientValue.from_string(stat_str) for stat_str in ing_str.split(self.STAT_SEPARATOR)]
+            for ing_str in ing_strs
+            if ing_str.strip() != self.INGSTR_DEFAULT
+        ]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+from collections import Counter
+from typing import Any, TYPE_CHECKING
+
+from nextcord import Embed, Interaction
+
+from fazbot.object import WynnIngredientValue
+from fazbot.util import CacheUtil, CraftedSearchUtil
+
+from . import Invoke
+
+if TYPE_CHECKING:
+    from . import Asset
+
+
+class InvokeCraftedSearch(Invoke):
+
+    ASSET_CRAFTINGTABLE: Asset
+    CANDIDATE_SEPARATOR = ";"
+    MAX_CANDIDATES = 25
+    TIME_BUDGET = 5.0
+
+    _SEARCH_CACHE = CacheUtil(max_size=128, ttl=3600)
+    """Process-wide cache of complete `CraftedSearchUtil` results, shared by every invocation."""
+
+    def __init__(
+            self,
+            interaction: Interaction[Any],
+            candidates_str: str,
+            target: int,
+            confidence: float = 50,
+            costs_str: str = "",
+            max_ingredients: int = 6
+        ) -> None:
+        super().__init__(interaction)
+        self._candidates = self.__parse_candidates_str(candidates_str)
+        if not self._candidates:
+            raise ValueError("At least one candidate ingredient is required.")
+        if len(self._candidates) > self.MAX_CANDIDATES:
+            raise ValueError(f"At most {self.MAX_CANDIDATES} candidate ingredients are allowed.")
+        self._costs = self.__parse_costs_str(costs_str) if costs_str.strip() else None
+        if self._costs is not None and len(self._costs) != len(self._candidates):
+            raise ValueError("Every candidate ingredient must have a cost.")
+        if not 0 < confidence <= 100:
+            raise ValueError("Confidence must be between 0 and 100.")
+        if not 1 <= max_ingredients <= 6:
+            raise ValueError("Max ingredients must be between 1 and 6.")
+        self._target = target
+        self._confidence = confidence
+        self._max_ingredients = max_ingredients
+
+    # override
+    @classmethod
+    def set_assets(cls, assets: dict[str, bytes]) -> None:
+        cls.ASSET_CRAFTINGTABLE = cls._get_from_assets(assets, "craftingtable.png")
+
+    async def run(self) -> None:
+        await self._interaction.response.defer()
+        searchutil = await self._get_searchutil()
+        embed = self._get_embed(self._interaction, searchutil)
+        await self._interaction.send(embed=embed, files=self.ASSET_CRAFTINGTABLE.get_files_to_send())
+
+    async def _get_searchutil(self) -> CraftedSearchUtil:
+        key = CacheUtil.make_key(
+            CraftedSearchUtil.__qualname__,
+            self._candidates,
+            self._target,
+            self._confidence,
+            self._costs,
+            self._max_ingredients
+        )
+        searchutil: CraftedSearchUtil | None = self._SEARCH_CACHE.get(key)
+        if searchutil is None:
+            searchutil = await self._compute(
+                CraftedSearchUtil,
+                self._candidates,
+                self._target,
+                self._confidence / 100,
+                self._costs,
+                self._max_ingredients,
+                self.TIME_BUDGET
+            )
+            # Results cut off by the time budget may not be optimal, so they aren't cached
+            if searchutil.is_complete:
+                self._SEARCH_CACHE.set(key, searchutil)
+        return searchutil
+
+    def _get_embed(self, interaction: Interaction[Any], searchutil: CraftedSearchUtil) -> Embed:
+        embed = Embed(title="Crafted Ingredient Search", color=8894804)
+        self._set_embed_thumbnail_with_asset(embed, self.ASSET_CRAFTINGTABLE)
+        if interaction.user:
+            embed.set_author(name=interaction.user.display_name, icon_url=interaction.user.display_avatar.url)
+
+        embed_desc = [f"Target: **atleast {self._target}** with **{self._confidence:g}%** chance"]
+        if searchutil.ingredients:
+            embed_desc.append("Ingredients:")
+            for ing, count in Counter(searchutil.ingredients).items():
+                ing_info = f"- `{count}x` {ing.min_value} to {ing.max_value}"
+                ing_info += f", {ing.boost}% boost" if ing.boost != 0 else ""
+                embed_desc.append(ing_info)
+            if self._costs is not None:
+                embed_desc.append(f"Cost: **{searchutil.cost:g}**")
+            embed_desc.append(f"Chance: **{searchutil.probability * 100:.2f}%**")
+        else:
+            embed_desc.append(f"No set of up to {self._max_ingredients} ingredients reaches the target.")
+        if not searchutil.is_complete:
+            embed_desc.append(f"Search stopped after {self.TIME_BUDGET:g}s, so a better set may exist.")
+        embed.description = "\n".join(embed_desc)
+        embed.set_footer(text=f"Searched {searchutil.nodes:,} sets")
+        return embed
+
+    def __parse_candidates_str(self, candidates_str: str) -> list[WynnIngredientValue]:
+        return [
+            WynnIngredientValue.from_string(ing_str)
+            for ing_str in candidates_str.split(self.CANDIDATE_SEPARATOR)
+            if ing_str.strip()
+        ]
+
+    def __parse_costs_str(self, costs_str: str) -> list[float]:
+        costs: list[float] = []
+        for cost_str in costs_str.split(self.CANDIDATE_SEPARATOR):
+            try:
+                costs.append(float(cost_str))
+            except ValueError:
+                raise ValueError(f"Exception occured while parsing cost {cost_str}")
+        return costs
@@ -10,36 +10,51 @@ from fazbot.util import IngredientUtil
 from . import Asset, Invoke
 
 if TYPE_CHECKING:
-    from nextcord import File
-
     from . import Asset
 
 
 class InvokeIngredientProbability(Invoke):
 
     ASSET_DECAYINGHEART: Asset
-
-    def __init__(self, interaction: Interaction[Any], base_chance: str, loot_bonus: int, loot_quality: int) -> None:
+    CONFIDENCES = (50, 90, 99)
+
+    def __init__(
+            self,
+            interaction: Interaction[Any],
+            base_chance: str,
+            loot_bonus: int,
+            loot_quality: int,
+            drops: int = 1,
+            confidence: float | None = None
+        ) -> None:
         super().__init__(interaction)
         self._base_chance = self._parse_base_chance(base_chance)
         self._loot_bonus = loot_bonus
         self._loot_quality = loot_quality
+        if drops < 1:
+            raise ValueError("Drops must be at least 1.")
+        if drops > IngredientUtil.MAX_DROPS:
+            raise ValueError(f"Drops must be at most {IngredientUtil.MAX_DROPS}.")
+        if confidence is not None and not 0 < confidence < 100:
+            raise ValueError("Confidence must be between 0 and 100.")
+        self._drops = drops
+        self._confidence = confidence
         self._ing_util = IngredientUtil(self._base_chance, self._loot_quality, self._loot_bonus)
 
     # override
     @classmethod
-    def set_assets(cls, assets: dict[str, File]) -> None:
+    def set_assets(cls, assets: dict[str, bytes]) -> None:
         cls.ASSET_DECAYINGHEART = cls._get_from_assets(assets, "decayingheart.png")
 
     async def run(self) -> None:
         embed_resp = self.__get_embed(self._ing_util, self._interaction)
-        await self._interaction.send(embed=embed_resp, file=self.ASSET_DECAYINGHEART.get_file_to_send())
+        await self._interaction.send(embed=embed_resp, files=self.ASSET_DECAYINGHEART.get_files_to_send())
 
     def __get_embed(self, ing_util: IngredientUtil, interaction: Interaction[Any]) -> Embed:
         one_in_n = 1 / ing_util.boosted_probability
 
         embed_resp = Embed(title="Ingredient Chance Calculator", color=472931)
-        self._set_embed_thumbnail_with_asset(embed_resp, self.ASSET_DECAYINGHEART.filename)
+        self._set_embed_thumbnail_with_asset(embed_resp, self.ASSET_DECAYINGHEART)
         embed_resp.description = (
             f"Drop Chance: **{ing_util.base_probability:.2%}**\n"
             f"Loot Bonus: **{ing_util.loot_bonus}%**\n"
@@ -50,12 +65,24 @@ class InvokeIngredientProbability(Invoke):
             name="Boosted Drop Chance",
             value=f"Drop Chance: \n**{ing_util.boosted_probability:.2%}** OR **1 in {one_in_n:.2f}** mobs"
         )
+        if ing_util.boosted_probability > 0:
+            embed_resp.add_field(name="Kills Needed", value=self._get_kills_needed(ing_util), inline=False)
         if interaction.user:
             embed_resp.set_author(name=interaction.user.display_name, icon_url=interaction.user.display_avatar.url)
 
         return embed_resp
 
-    def _parse_base_chance(self, base_chance: str) -> Decimal:
+    def _get_kills_needed(self, ing_util: IngredientUtil) -> str:
+        drops_str = f"{self._drops} drop{'s' if self._drops > 1 else ''}"
+        lines = [f"Expected: **{ing_util.get_expected_kills(self._drops):,.1f}** mobs for {drops_str}"]
+        confidences = sorted({*self.CONFIDENCES, *([self._confidence] if self._confidence is not None else [])})
+        for confidence in confidences:
+            kills = ing_util.get_kills_for_confidence(confidence / 100, self._drops)
+            lines.append(f"**{confidence:g}%** chance of {drops_str}: **{kills:,}** mobs")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _parse_base_chance(base_chance: str) -> Decimal:
         if base_chance.endswith('%'):
             return Decimal(base_chance[:-1]) / 100
         elif '/' in base_chance:
@@ -0,0 +1,105 @@
+from __future__ import annotations
+from typing import Any, Callable, TYPE_CHECKING
+
+from nextcord import Embed, Interaction
+import numpy as np
+
+from fazbot.util import IngredientUtil
+
+from . import Invoke
+from .invoke_ingredient_probability import InvokeIngredientProbability
+
+if TYPE_CHECKING:
+    from . import Asset
+
+
+class InvokeIngredientSweep(Invoke):
+
+    ASSET_DECAYINGHEART: Asset
+    MAX_LOOT_BONUSES = 12
+    MAX_LOOT_QUALITIES = 8
+
+    def __init__(
+            self,
+            interaction: Interaction[Any],
+            base_chance: str,
+            loot_bonuses: str = "0:200:20",
+            loot_qualities: str = "0:100:20",
+            drops: int = 1
+        ) -> None:
+        """
+        Args:
+            loot_bonuses (str): Loot bonuses, either `start:stop:step` (stop inclusive) or
+                comma-separated values.
+            loot_qualities (str): Loot qualities, in the same format as `loot_bonuses`.
+        """
+        super().__init__(interaction)
+        self._base_chance = InvokeIngredientProbability._parse_base_chance(base_chance)
+        self._loot_bonuses = self._parse_range(loot_bonuses, self.MAX_LOOT_BONUSES)
+        self._loot_qualities = self._parse_range(loot_qualities, self.MAX_LOOT_QUALITIES)
+        if drops < 1:
+            raise ValueError("Drops must be at least 1.")
+        self._drops = drops
+
+    # override
+    @classmethod
+    def set_assets(cls, assets: dict[str, bytes]) -> None:
+        cls.ASSET_DECAYINGHEART = cls._get_from_assets(assets, "decayingheart.png")
+
+    async def run(self) -> None:
+        embed = self._get_embed(self._interaction)
+        await self._interaction.send(embed=embed, files=self.ASSET_DECAYINGHEART.get_files_to_send())
+
+    def _get_embed(self, interaction: Interaction[Any]) -> Embed:
+        probabilities, expected_kills = IngredientUtil.sweep(self._base_chance, self._loot_bonuses, self._loot_qualities, self._drops)
+
+        embed = Embed(title="Ingredient Chance Sweep", color=472931)
+        self._set_embed_thumbnail_with_asset(embed, self.ASSET_DECAYINGHEART)
+        drops_str = f"{self._drops} drop{'s' if self._drops > 1 else ''}"
+        embed.description = "\n".join((
+            f"Drop Chance: **{self._base_chance:.2%}**",
+            "Rows are loot bonus, columns are loot quality.",
+            "**Boosted Drop Chance**",
+            self._get_table(probabilities, lambda p: f"{p:.2%}"),
+            f"**Expected Mobs for {drops_str}**",
+            self._get_table(expected_kills, self.__format_kills),
+        ))
+        if interaction.user:
+            embed.set_author(name=interaction.user.display_name, icon_url=interaction.user.display_avatar.url)
+        return embed
+
+    def _get_table(self, values: np.ndarray, format_value: Callable[[float], str]) -> str:
+        rows = [["B\\Q", *(f"{quality}%" for quality in self._loot_qualities.tolist())]]
+        for bonus, row in zip(self._loot_bonuses.tolist(), values.tolist()):
+            rows.append([f"{bonus}%", *map(format_value, row)])
+        widths = [max(len(row[col]) for row in rows) for col in range(len(rows[0]))]
+        lines = [" ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows]
+        return "```\n" + "\n".join(lines) + "\n```"
+
+    @staticmethod
+    def _parse_range(range_str: str, max_values: int) -> np.ndarray:
+        try:
+            if ":" in range_str:
+                start, stop, step = (int(part) for part in range_str.split(":"))
+                if step <= 0:
+                    raise ValueError
+                values = np.arange(start, stop + 1, step)
+            else:
+                values = np.array([int(value) for value in range_str.split(",")])
+        except ValueError:
+            raise ValueError(f"Invalid range {range_str}, expected start:stop:step or comma-separated values.")
+        if len(values) == 0:
+            raise ValueError(f"Range {range_str} is empty.")
+        if len(values) > max_values:
+            raise ValueError(f"Range {range_str} has more than {max_values} values.")
+        return values
+
+    @staticmethod
+    def __format_kills(kills: float) -> str:
+        if kills == float("inf"):
+            return "-"
+        if kills >= 1e6:
+            return f"{kills / 1e6:.1f}M"
+        if kills >= 1e4:
+            return f"{kills / 1e3:.0f}k"
+        return f"{kills:,.0f}"
@@ -13,9 +13,17 @@ class Config:
 
     discord_log_webhook: str
     discord_status_webhook: str
+    asset_storage_channel_id: int | None
+    asset_watch_interval: float | None
 
     fazbot_db_max_retries: int
     fazdb_db_max_retries: int
+    fazbot_db_pool_size: int
+    fazbot_db_max_overflow: int
+    fazbot_db_pool_timeout: float
+    fazbot_db_pool_recycle: int
+    fazbot_db_pool_pre_ping: bool
+    fazbot_db_slow_query_threshold: float
 
     mysql_host: str
     mysql_port: int
@@ -34,9 +42,17 @@ class Config:
 
         cls.discord_log_webhook = cls.__must_get_env("DISCORD_LOG_WEBHOOK")
         cls.discord_status_webhook = cls.__must_get_env("DISCORD_STATUS_WEBHOOK")
+        cls.asset_storage_channel_id = cls.__get_env("ASSET_STORAGE_CHANNEL_ID", int)
+        cls.asset_watch_interval = cls.__get_env("ASSET_WATCH_INTERVAL", float)
 
         cls.fazbot_db_max_retries = cls.__must_get_env("FAZBOT_DB_MAX_RETRIES", int)
         cls.fazdb_db_max_retries = cls.__must_get_env("FAZDB_DB_MAX_RETRIES", int)
+        cls.fazbot_db_pool_size = cls.__get_env_or("FAZBOT_DB_POOL_SIZE", 5, int)
+        cls.fazbot_db_max_overflow = cls.__get_env_or("FAZBOT_DB_MAX_OVERFLOW", 10, int)
+        cls.fazbot_db_pool_timeout = cls.__get_env_or("FAZBOT_DB_POOL_TIMEOUT", 30.0, float)
+        cls.fazbot_db_pool_recycle = cls.__get_env_or("FAZBOT_DB_POOL_RECYCLE", 3600, int)
+        cls.fazbot_db_pool_pre_ping = cls.__get_env_or("FAZBOT_DB_POOL_PRE_PING", True, cls.__parse_bool)
+        cls.fazbot_db_slow_query_threshold = cls.__get_env_or("FAZBOT_DB_SLOW_QUERY_THRESHOLD", 0.5, float)
 
         cls.mysql_host = cls.__must_get_env("MYSQL_HOST")
         cls.mysql_port = cls.__must_get_env("MYSQL_PORT", int)
@@ -45,6 +61,27 @@ class Config:
         cls.fazbot_db_name = cls.__must_get_env("MYSQL_FAZBOT_DATABASE")
         cls.fazdb_db_name = cls.__must_get_env("MYSQL_FAZDB_DATABASE")
 
+    @staticmethod
+    def __get_env[T](key: str, type_strategy: Callable[[str], T] = str) -> T | None:
+        """Like `__must_get_env`, but returns None if the environment variable is unset or empty."""
+        if not os.getenv(key):
+            return None
+        return Config.__must_get_env(key, type_strategy)
+
+    @staticmethod
+    def __get_env_or[T](key: str, default: T, type_strategy: Callable[[str], T] = str) -> T:
+        """Like `__get_env`, but returns `default` if the environment variable is unset or empty."""
+        value = Config.__get_env(key, type_strategy)
+        return default if value is None else value
+
+    @staticmethod
+    def __parse_bool(value: str) -> bool:
+        if value.lower() in ("1", "true", "yes"):
+            return True
+        if value.lower() in ("0", "false", "no"):
+            return False
+        raise ValueError(f"{value} is not a boolean")
+
     @staticmethod
     def __must_get_env[T](key: str, type_strategy: Callable[[str], T] = str) -> T:
         try:
@@ -5,6 +5,7 @@ class Constants:
 
     # directories
     ASSET_DIR = "asset"
+    ASSET_CACHE_DIR = ".cache/asset"
 
     # filepaths
     CONFIG_FP = "config.yml"
@@ -1,11 +1,11 @@
 from __future__ import annotations
 from contextlib import contextmanager
-from threading import Lock
 from typing import Generator, TYPE_CHECKING
 
 from fazbot import Asset, Config
 from fazbot.bot import DiscordBot
 from fazbot.constants import Constants
+from fazbot.db import PoolProfile
 from fazbot.db.fazbot import FazBotDatabase
 from fazbot.logger import FazBotLogger
 
@@ -18,7 +18,6 @@ if TYPE_CHECKING:
 class FazBot(Core):
 
     def __init__(self) -> None:
-        self._locks: dict[str, Lock] = {}
         self._asset = Asset(Constants.ASSET_DIR)
         self._config = Config()
 
@@ -32,7 +31,15 @@ class FazBot(Core):
             conf.mysql_password,
             conf.mysql_host,
             conf.mysql_port,
-            conf.fazbot_db_name
+            conf.fazbot_db_name,
+            PoolProfile(
+                conf.fazbot_db_pool_size,
+                conf.fazbot_db_max_overflow,
+                conf.fazbot_db_pool_timeout,
+                conf.fazbot_db_pool_recycle,
+                conf.fazbot_db_pool_pre_ping
+            ),
+            conf.fazbot_db_slow_query_threshold
         )
         self._logger = FazBotLogger(conf.discord_log_webhook, conf.admin_discord_id)
         self._bot = DiscordBot(self)
@@ -57,18 +64,10 @@ class FazBot(Core):
 
     @contextmanager
     def enter_bot(self) -> Generator[Bot]:
-        with self._get_lock("bot"):
-            yield self._bot
+        yield self._bot
 
     @contextmanager
     def enter_fazbotdb(self) -> Generator[IFazBotDatabase]:
-        with self._get_lock("fazbotdb"):
-            yield self._fazbotdb
-
-    def _get_lock(self, key: str) -> Lock:
-        if key not in self._locks:
-            lock = Lock()
-            self._locks[key] = lock
-        else:
-            lock = self._locks[key]
-        return lock
+        """Not exclusive. Concurrent coroutines each check out their own connection from the
+        engine's pool, so they query in parallel."""
+        yield self._fazbotdb
@@ -1,2 +1,5 @@
 # type: ignore
+from ._pool_profile import PoolProfile
+from ._pool_statistics import PoolStatistics
+from ._query_statistics import LatencyHistogram, QueryStatistics
 from ._base_async_database import BaseAsyncDatabase
@@ -1,11 +1,17 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from time import perf_counter
 from typing import AsyncGenerator, TYPE_CHECKING
 
 from sqlalchemy import URL
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from ._pool_profile import PoolProfile
+from ._pool_statistics import PoolStatistics
+from ._query_statistics import QueryStatistics
+
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
     from sqlalchemy.orm import DeclarativeBase
@@ -21,6 +27,8 @@ class BaseAsyncDatabase[T: DeclarativeBase](ABC):
             host: str,
             port: int,
             database: str,
+            pool_profile: PoolProfile | None = None,
+            slow_query_threshold: float | None = None
         ) -> None:
         self._driver = driver
         self._user = user
@@ -37,18 +45,27 @@ class BaseAsyncDatabase[T: DeclarativeBase](ABC):
             port,
             database
         )
-        self._engine = create_async_engine(url)
+        self._pool_profile = pool_profile or PoolProfile()
+        self._engine = create_async_engine(url, **self._pool_profile.get_engine_kwargs())
+        self._sessionmaker = async_sessionmaker(self._engine, expire_on_commit=False)
+        self._pool_statistics = PoolStatistics(self._engine.pool)  # type: ignore
+        self._query_statistics = QueryStatistics(slow_query_threshold)
+        self._query_statistics.attach(self._engine)
 
     @asynccontextmanager
     async def enter_connection(self) -> AsyncGenerator[AsyncConnection, None]:
+        t1 = perf_counter()
         async with self.engine.connect() as conn:
+            self._pool_statistics.record_wait(perf_counter() - t1)
             yield conn
 
     @asynccontextmanager
     async def enter_session(self) -> AsyncGenerator[AsyncSession, None]:
-        async_session = async_sessionmaker(self.engine, expire_on_commit=False)
-        async with async_session.begin() as session:
-            yield session
+        # Binding the session to a connection checked out here, rather than letting it check one
+        # out lazily, is what lets the checkout wait be measured.
+        async with self.enter_connection() as conn:
+            async with self._sessionmaker(bind=conn) as session, session.begin():
+                yield session
 
     @asynccontextmanager
     async def must_enter_connection(self, connection: AsyncConnection | None = None) -> AsyncGenerator[AsyncConnection, None]:
@@ -66,6 +83,22 @@ class BaseAsyncDatabase[T: DeclarativeBase](ABC):
             async with self.enter_session() as session:
                 yield session
 
+    async def warm_pool(self, connections: int | None = None) -> int:
+        """Opens pool connections ahead of the first queries, so they don't pay for connecting.
+
+        Args:
+            connections (int | None, optional): Connections to open. Defaults to the pool size.
+
+        Returns:
+            int: Number of connections opened.
+        """
+        n = min(connections, self._pool_profile.size) if connections is not None else self._pool_profile.size
+        # Connections are held together until all are open, so each checkout opens a new one
+        # instead of reusing one just returned.
+        async with AsyncExitStack() as stack:
+            await asyncio.gather(*(stack.enter_async_context(self.engine.connect()) for _ in range(n)))
+        return n
+
     async def create_all(self) -> None:
         async with self.enter_connection() as connection:
             await connection.run_sync(self.base_model.metadata.create_all)
@@ -74,6 +107,18 @@ class BaseAsyncDatabase[T: DeclarativeBase](ABC):
     def engine(self) -> AsyncEngine:
         return self._engine
 
+    @property
+    def pool_profile(self) -> PoolProfile:
+        return self._pool_profile
+
+    @property
+    def pool_statistics(self) -> PoolStatistics:
+        return self._pool_statistics
+
+    @property
+    def query_statistics(self) -> QueryStatistics:
+        return self._query_statistics
+
     @property
     def driver(self) -> str:
         return self._driver
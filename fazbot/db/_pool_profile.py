@@ -0,0 +1,65 @@
+from __future__ import annotations
+from typing import Any
+
+
+class PoolProfile:
+    """Connection pool settings of a `BaseAsyncDatabase`."""
+
+    def __init__(
+            self,
+            size: int = 5,
+            max_overflow: int = 10,
+            timeout: float = 30,
+            recycle: int = 3600,
+            pre_ping: bool = True
+        ) -> None:
+        """
+        Args:
+            size (int, optional): Connections kept open in the pool. Defaults to 5.
+            max_overflow (int, optional): Extra connections opened when all pooled ones are checked out,
+                closed again once returned. Defaults to 10.
+            timeout (float, optional): Seconds to wait for a connection before raising. Defaults to 30.
+            recycle (int, optional): Seconds after which a connection is replaced, so it is never
+                closed server-side by MySQL's `wait_timeout`. -1 to never recycle. Defaults to 3600.
+            pre_ping (bool, optional): Tests connections on checkout, replacing dead ones. Defaults to True.
+        """
+        if size < 0 or max_overflow < 0:
+            raise ValueError("Pool size and max overflow must not be negative.")
+        if timeout <= 0:
+            raise ValueError("Pool timeout must be positive.")
+
+        self._size = size
+        self._max_overflow = max_overflow
+        self._timeout = timeout
+        self._recycle = recycle
+        self._pre_ping = pre_ping
+
+    def get_engine_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for `create_async_engine()`."""
+        return {
+            "pool_size": self._size,
+            "max_overflow": self._max_overflow,
+            "pool_timeout": self._timeout,
+            "pool_recycle": self._recycle,
+            "pool_pre_ping": self._pre_ping,
+        }
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def max_overflow(self) -> int:
+        return self._max_overflow
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @property
+    def recycle(self) -> int:
+        return self._recycle
+
+    @property
+    def pre_ping(self) -> bool:
+        return self._pre_ping
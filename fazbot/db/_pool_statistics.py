@@ -0,0 +1,65 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy.pool import QueuePool
+
+
+class PoolStatistics:
+    """Live usage of a connection pool, for sizing it against real load. Connection counts are read
+    from the pool when accessed; checkout waits are recorded by the database as they happen."""
+
+    def __init__(self, pool: QueuePool) -> None:
+        self._pool = pool
+        self._checkouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        """Records how long a checkout waited for a connection."""
+        self._checkouts += 1
+        self._total_wait += seconds
+        self._max_wait = max(self._max_wait, seconds)
+
+    def reset(self) -> None:
+        """Resets the recorded checkout waits."""
+        self._checkouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def size(self) -> int:
+        """Connections the pool keeps open, excluding overflow."""
+        return self._pool.size()
+
+    @property
+    def checked_out(self) -> int:
+        """Connections currently in use."""
+        return self._pool.checkedout()
+
+    @property
+    def checked_in(self) -> int:
+        """Open connections currently idle in the pool."""
+        return self._pool.checkedin()
+
+    @property
+    def overflow(self) -> int:
+        """Connections currently open beyond the pool size."""
+        return max(self._pool.overflow(), 0)
+
+    @property
+    def checkouts(self) -> int:
+        return self._checkouts
+
+    @property
+    def total_wait(self) -> float:
+        """Seconds spent waiting for connections, summed over every checkout."""
+        return self._total_wait
+
+    @property
+    def max_wait(self) -> float:
+        return self._max_wait
+
+    @property
+    def mean_wait(self) -> float:
+        return self._total_wait / self._checkouts if self._checkouts else 0.0
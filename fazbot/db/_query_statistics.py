@@ -0,0 +1,198 @@
+from __future__ import annotations
+from contextvars import ContextVar
+from functools import wraps
+import math
+import re
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Concatenate, TYPE_CHECKING
+
+from sqlalchemy import event
+
+from fazbot.logger import ConsoleLogger
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class LatencyHistogram:
+    """Latencies of one kind of query, counted into buckets growing by 2^(1/4), so percentiles are
+    accurate to about 19% in constant memory."""
+
+    _MIN_LATENCY = 0.0001
+    """Upper bound of the first bucket, in seconds."""
+    _BUCKETS_PER_DOUBLING = 4
+    _N_BUCKETS = 80
+    """Buckets up to ~75 seconds, plus a last one for anything slower."""
+
+    def __init__(self) -> None:
+        self._buckets = [0] * self._N_BUCKETS
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._rows = 0
+
+    def record(self, seconds: float, rows: int = 0) -> None:
+        self._buckets[self.__get_bucket_index(seconds)] += 1
+        self._count += 1
+        self._total += seconds
+        self._max = max(self._max, seconds)
+        self._rows += rows
+
+    def get_percentile(self, percent: float) -> float:
+        """Upper bound of the bucket holding the `percent`th percentile latency, in seconds.
+
+        Args:
+            percent (float): Percentile, from 0 to 100.
+
+        Returns:
+            float: The latency, never more than the slowest recorded one. 0 if nothing is recorded.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {percent}.")
+        if self._count == 0:
+            return 0.0
+
+        rank = max(math.ceil(self._count * percent / 100), 1)
+        seen = 0
+        for i, count in enumerate(self._buckets):
+            seen += count
+            if seen >= rank:
+                return min(self.__get_bucket_bound(i), self._max)
+        return self._max
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        """Seconds spent, summed over every query."""
+        return self._total
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count else 0.0
+
+    @property
+    def rows(self) -> int:
+        """Rows returned or affected, summed over every query."""
+        return self._rows
+
+    def __get_bucket_index(self, seconds: float) -> int:
+        if seconds <= self._MIN_LATENCY:
+            return 0
+        index = math.ceil(math.log2(seconds / self._MIN_LATENCY) * self._BUCKETS_PER_DOUBLING)
+        return min(index, self._N_BUCKETS - 1)
+
+    def __get_bucket_bound(self, index: int) -> float:
+        if index == self._N_BUCKETS - 1:
+            return math.inf
+        return self._MIN_LATENCY * 2 ** (index / self._BUCKETS_PER_DOUBLING)
+
+
+class QueryStatistics:
+    """Times every statement executed by an engine, keeping a `LatencyHistogram` per normalized
+    statement and per repository method. Statements slower than the threshold are logged."""
+
+    _operation: ContextVar[str | None] = ContextVar("operation", default=None)
+    """Repository method currently executing statements, set by `bind_operation()`."""
+
+    _NORMALIZE_PATTERNS = (
+        (re.compile(r"'(?:[^'\\]|\\.|'')*'"), "?"),
+        (re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|\b\d+(?:\.\d+)?\b"), "?"),
+        (re.compile(r"(\([?,\s]*\))(?:\s*,\s*\1)+"), r"\1"),
+        (re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE), "IN (?)"),
+        (re.compile(r"\s+"), " "),
+    )
+
+    def __init__(self, slow_query_threshold: float | None = None) -> None:
+        """
+        Args:
+            slow_query_threshold (float | None, optional): Statements taking longer than this many
+                seconds are logged. None to never log. Defaults to None.
+        """
+        self._slow_query_threshold = slow_query_threshold
+        self._by_statement: dict[str, LatencyHistogram] = {}
+        self._by_operation: dict[str, LatencyHistogram] = {}
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Starts timing statements executed by `engine`."""
+        event.listen(engine.sync_engine, "before_cursor_execute", self.__before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", self.__after_cursor_execute)
+        event.listen(engine.sync_engine, "handle_error", self.__handle_error)
+
+    def record(self, statement: str, seconds: float, rows: int = 0, operation: str | None = None) -> None:
+        """Records a statement execution.
+
+        Args:
+            statement (str): The executed SQL.
+            seconds (float): Time taken by the execution.
+            rows (int, optional): Rows returned or affected. Defaults to 0.
+            operation (str | None, optional): Repository method that executed it. Defaults to None.
+        """
+        shape = self.normalize(statement)
+        self._by_statement.setdefault(shape, LatencyHistogram()).record(seconds, rows)
+        if operation is not None:
+            self._by_operation.setdefault(operation, LatencyHistogram()).record(seconds, rows)
+
+        if self._slow_query_threshold is not None and seconds > self._slow_query_threshold:
+            ConsoleLogger.warning(f"Slow query ({seconds * 1000:.1f} ms, {rows} rows) in {operation or 'unknown'}: {shape}")
+
+    def reset(self) -> None:
+        self._by_statement.clear()
+        self._by_operation.clear()
+
+    @classmethod
+    def normalize(cls, statement: str) -> str:
+        """Replaces literals and bound parameters in `statement` with `?`, and collapses `IN` and
+        `VALUES` lists to one item, so executions differing only in parameters share one shape."""
+        for pattern, replacement in cls._NORMALIZE_PATTERNS:
+            statement = pattern.sub(replacement, statement)
+        return statement.strip()
+
+    @classmethod
+    def bind_operation[S, **P, T](
+            cls,
+            method: Callable[Concatenate[S, P], Awaitable[T]]
+        ) -> Callable[Concatenate[S, P], Awaitable[T]]:
+        """Decorator attributing statements executed by a repository method to
+        `<RepositoryClass>.<method>`."""
+
+        @wraps(method)
+        async def wrapped(self: S, *args: P.args, **kwargs: P.kwargs) -> T:
+            token = cls._operation.set(f"{type(self).__name__}.{method.__name__}")
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                cls._operation.reset(token)
+
+        return wrapped
+
+    @property
+    def by_statement(self) -> dict[str, LatencyHistogram]:
+        return self._by_statement.copy()
+
+    @property
+    def by_operation(self) -> dict[str, LatencyHistogram]:
+        return self._by_operation.copy()
+
+    @property
+    def slow_query_threshold(self) -> float | None:
+        return self._slow_query_threshold
+
+    def __before_cursor_execute(self, conn: Connection, *_: Any) -> None:
+        conn.info.setdefault("query_start", []).append(perf_counter())
+
+    def __after_cursor_execute(self, conn: Connection, cursor: Any, statement: str, *_: Any) -> None:
+        seconds = perf_counter() - conn.info["query_start"].pop()
+        self.record(statement, seconds, max(cursor.rowcount, 0), self._operation.get())
+
+    def __handle_error(self, context: Any) -> None:
+        starts = context.connection.info.get("query_start") if context.connection is not None else None
+        if starts:
+            starts.pop()
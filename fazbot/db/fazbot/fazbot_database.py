@@ -1,22 +1,37 @@
 from . import IFazBotDatabase
-from .. import BaseAsyncDatabase
+from .. import BaseAsyncDatabase, PoolProfile
 from .model import BaseModel
-from .repository import BannedUserRepository, WhitelistedGuildRepository
+from .repository import BannedUserRepository, CraftedDistributionRepository, WhitelistedGuildRepository
 
 
 class FazBotDatabase(BaseAsyncDatabase[BaseModel], IFazBotDatabase):
 
-    def __init__(self, driver: str, user: str, password: str, host: str, port: int, database: str) -> None:
-        super().__init__(driver, user, password, host, port, database)
+    def __init__(
+            self,
+            driver: str,
+            user: str,
+            password: str,
+            host: str,
+            port: int,
+            database: str,
+            pool_profile: PoolProfile | None = None,
+            slow_query_threshold: float | None = None
+        ) -> None:
+        super().__init__(driver, user, password, host, port, database, pool_profile, slow_query_threshold)
         self._base_model = BaseModel()
 
         self._banned_user_repository = BannedUserRepository(self)
+        self._crafted_distribution_repository = CraftedDistributionRepository(self)
         self._whitelisted_guild_repository = WhitelistedGuildRepository(self)
         
     @property
     def banned_user_repository(self) -> BannedUserRepository:
         return self._banned_user_repository
 
+    @property
+    def crafted_distribution_repository(self) -> CraftedDistributionRepository:
+        return self._crafted_distribution_repository
+
     @property
     def whitelisted_guild_repository(self) -> WhitelistedGuildRepository:
         return self._whitelisted_guild_repository 
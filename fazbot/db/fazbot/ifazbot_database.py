@@ -4,8 +4,9 @@ from typing import AsyncGenerator, Protocol, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection, AsyncSession
+    from .. import PoolProfile, PoolStatistics, QueryStatistics
     from .model import BaseModel
-    from .repository import BannedUserRepository, WhitelistedGuildRepository
+    from .repository import BannedUserRepository, CraftedDistributionRepository, WhitelistedGuildRepository
 
 
 class IFazBotDatabase(Protocol):
@@ -13,6 +14,8 @@ class IFazBotDatabase(Protocol):
     @property
     def banned_user_repository(self) -> BannedUserRepository: ...
     @property
+    def crafted_distribution_repository(self) -> CraftedDistributionRepository: ...
+    @property
     def whitelisted_guild_repository(self) -> WhitelistedGuildRepository: ...
     @asynccontextmanager
     async def enter_connection(self) -> AsyncGenerator[AsyncConnection, None]: ...
@@ -22,10 +25,17 @@ class IFazBotDatabase(Protocol):
     async def must_enter_connection(self, connection: AsyncConnection | None = None) -> AsyncGenerator[AsyncConnection, None]: ...
     @asynccontextmanager
     async def must_enter_session(self, session: AsyncSession | None = None) -> AsyncGenerator[AsyncSession, None]: ...
+    async def warm_pool(self, connections: int | None = None) -> int: ...
     async def create_all(self) -> None: ...
     @property
     def engine(self) -> AsyncEngine: ...
     @property
+    def pool_profile(self) -> PoolProfile: ...
+    @property
+    def pool_statistics(self) -> PoolStatistics: ...
+    @property
+    def query_statistics(self) -> QueryStatistics: ...
+    @property
     def driver(self) -> str: ...
     @property
     def user(self) -> str: ...
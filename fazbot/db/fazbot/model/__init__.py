@@ -1,5 +1,5 @@
 from ._base_model import BaseModel
 
 from .banned_user import BannedUser  # depends: BaseModel
+from .crafted_distribution import CraftedDistribution  # depends: BaseModel
 from .whitelisted_guild import WhitelistedGuild  # depends: BaseModel
-
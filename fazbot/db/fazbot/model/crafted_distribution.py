@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import Integer, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from . import BaseModel
+
+
+class CraftedDistribution(BaseModel):
+    __tablename__ = "crafted_distribution"
+
+    ingredients: Mapped[str] = mapped_column(String(255), primary_key=True)
+    data: Mapped[bytes] = mapped_column(LargeBinary(2**24 - 1))
+    size_bytes: Mapped[int] = mapped_column(Integer)
+    requests: Mapped[int] = mapped_column(Integer, default=1)
+    last_requested: Mapped[datetime] = mapped_column(index=True)
+
+    def __repr__(self) -> str:
+        return (
+            "<CraftedDistribution("
+            f"ingredients='{self.ingredients}',"
+            f"size_bytes={self.size_bytes},"
+            f"requests={self.requests},"
+            f"last_requested={self.last_requested}"
+            ")>"
+        )
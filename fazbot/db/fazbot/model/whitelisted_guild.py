@@ -13,7 +13,7 @@ class WhitelistedGuild(BaseModel):
     guild_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     guild_name: Mapped[str] = mapped_column(String(32))
     from_: Mapped[datetime] = mapped_column(name="from")
-    until: Mapped[Optional[datetime]] = mapped_column(default=None)
+    until: Mapped[Optional[datetime]] = mapped_column(default=None, index=True)
 
     def __repr__(self) -> str:
         return (
@@ -1,2 +1,3 @@
 from .banned_user_repository import BannedUserRepository
+from .crafted_distribution_repository import CraftedDistributionRepository
 from .whitelisted_guild_repository import WhitelistedGuildRepository
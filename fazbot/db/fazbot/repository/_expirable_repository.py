@@ -0,0 +1,64 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Sequence
+
+from sqlalchemy import delete, select
+
+from ... import QueryStatistics
+from ._repository import Repository
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from ..model import BaseModel
+
+
+class ExpirableRepository[T: BaseModel, ID](Repository[T, ID]):
+    """Repository of a model with a nullable `until` column, after which its entries expire."""
+
+    @QueryStatistics.bind_operation
+    async def get_expirations(self, session: None | AsyncSession = None) -> Sequence[tuple[ID, datetime]]:
+        """
+        Get the primary key and expiry of every entry that expires.
+
+        Parameters
+        ----------
+        session : AsyncSession, optional
+            Optional AsyncSession object to use for the database connection.
+            If not provided, a new session will be created.
+
+        Returns
+        -------
+        Sequence[tuple[ID, datetime]]
+            Primary key and `until` of every entry whose `until` is set.
+        """
+        model: Any = self.get_model_cls()
+        primary_key = model.__mapper__.primary_key[0]
+        async with self.database.must_enter_session(session) as session:
+            stmt = select(primary_key, model.until).where(model.until.is_not(None))
+            result = await session.execute(stmt)
+            expirations = result.tuples().all()
+        return expirations  # type: ignore
+
+    @QueryStatistics.bind_operation
+    async def delete_expired(self, now: datetime, session: None | AsyncSession = None) -> int:
+        """
+        Delete every entry whose `until` is at or before `now`, in one statement.
+
+        Parameters
+        ----------
+        now : datetime
+            Entries expiring at or before this are deleted.
+        session : AsyncSession, optional
+            Optional AsyncSession object to use for the database connection.
+            If not provided, a new session will be created.
+
+        Returns
+        -------
+        int
+            Number of deleted entries.
+        """
+        model: Any = self.get_model_cls()
+        async with self.database.must_enter_session(session) as session:
+            stmt = delete(model).where(model.until <= now)
+            result = await session.execute(stmt)
+            return result.rowcount  # type: ignore
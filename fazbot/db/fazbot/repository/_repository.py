@@ -6,6 +6,8 @@ from typing import Any, Iterable, TYPE_CHECKING
 from sqlalchemy import Column, Tuple, delete, exists, select, text, tuple_
 from sqlalchemy.schema import CreateTable
 
+from ... import QueryStatistics
+
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
     from ..model import BaseModel
@@ -18,6 +20,7 @@ class Repository[T: BaseModel, ID](ABC):
         self._database = database
         self._model_cls = model_cls
 
+    @QueryStatistics.bind_operation
     async def table_disk_usage(self, session: None | AsyncSession = None) -> Decimal:
         """
         Calculate the size of the table in bytes.
@@ -52,6 +55,7 @@ class Repository[T: BaseModel, ID](ABC):
             ret = Decimal(row["size_bytes"]) if (row and row["size_bytes"] is not None) else Decimal(0)  # type: ignore
             return ret
 
+    @QueryStatistics.bind_operation
     async def create_table(self, session: None | AsyncSession = None) -> None:
         """
         Create the table associated with the repository if it does not already exist.
@@ -67,6 +71,7 @@ class Repository[T: BaseModel, ID](ABC):
             stmt = CreateTable(table, if_not_exists=True)
             await session.execute(stmt)
 
+    @QueryStatistics.bind_operation
     async def insert(self, entity: Iterable[T] | T, session: None | AsyncSession = None) -> None:
         """
         Insert one or more entities into the database.
@@ -82,7 +87,9 @@ class Repository[T: BaseModel, ID](ABC):
         entities = self.__ensure_iterable(entity)
         async with self.database.must_enter_session(session) as session:
             session.add_all(entities)
+            await session.flush()
 
+    @QueryStatistics.bind_operation
     async def delete(self, id_: Iterable[ID] | ID, session: AsyncSession | None = None) -> None:
         """Deletes an entry from the repository based on `id_`
 
@@ -102,6 +109,7 @@ class Repository[T: BaseModel, ID](ABC):
             stmt = delete(model).where(self.__get_primary_key().in_(to_compare))
             await session.execute(stmt)
 
+    @QueryStatistics.bind_operation
     async def is_exists(self, id_: ID, session: None | AsyncSession = None) -> bool:
         """
         Check if an entry with the given primary key exists in the database.
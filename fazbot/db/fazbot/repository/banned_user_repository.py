@@ -1,14 +1,27 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Sequence
 
+from sqlalchemy import select
+
+from ... import QueryStatistics
 from ..model import BannedUser
-from ._repository import Repository
+from ._expirable_repository import ExpirableRepository
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
     from ... import BaseAsyncDatabase
 
 
-class BannedUserRepository(Repository[BannedUser, int]):
+class BannedUserRepository(ExpirableRepository[BannedUser, int]):
 
     def __init__(self, database: BaseAsyncDatabase[Any]) -> None:
         super().__init__(database, BannedUser)
+
+    @QueryStatistics.bind_operation
+    async def get_all_banned_user_ids(self, session: None | AsyncSession = None) -> Sequence[int]:
+        model = self.get_model_cls()
+        async with self.database.must_enter_session(session) as session:
+            stmt = select(model.user_id)
+            result = await session.execute(stmt)
+            banned_user_ids = result.scalars().all()
+        return banned_user_ids
@@ -0,0 +1,163 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Sequence
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.mysql import insert
+
+from ... import QueryStatistics
+from ..model import CraftedDistribution
+from ._repository import Repository
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from ... import BaseAsyncDatabase
+
+
+class CraftedDistributionRepository(Repository[CraftedDistribution, str]):
+
+    def __init__(self, database: BaseAsyncDatabase[Any]) -> None:
+        super().__init__(database, CraftedDistribution)
+
+    @QueryStatistics.bind_operation
+    async def get(self, ingredients: str, session: None | AsyncSession = None) -> CraftedDistribution | None:
+        """
+        Get the stored distribution of `ingredients`, and count it as a request.
+
+        Parameters
+        ----------
+        ingredients : str
+            Canonical ingredient string of the distribution.
+        session : AsyncSession, optional
+            Optional AsyncSession object to use for the database connection.
+            If not provided, a new session will be created.
+
+        Returns
+        -------
+        CraftedDistribution | None
+            The stored distribution, or None if it doesn't exist.
+        """
+        model = self.get_model_cls()
+        async with self.database.must_enter_session(session) as session:
+            result = await session.execute(select(model).where(model.ingredients == ingredients))
+            entity = result.scalar_one_or_none()
+            if entity is not None:
+                stmt = (
+                    update(model)
+                    .where(model.ingredients == ingredients)
+                    .values(requests=model.requests + 1, last_requested=datetime.now())
+                )
+                await session.execute(stmt)
+            return entity
+
+    @QueryStatistics.bind_operation
+    async def upsert(self, ingredients: str, data: bytes, session: None | AsyncSession = None) -> bool:
+        """
+        Store the distribution of `ingredients`, replacing its data if it already exists. The
+        request count of an existing distribution is kept.
+
+        Parameters
+        ----------
+        ingredients : str
+            Canonical ingredient string of the distribution.
+        data : bytes
+            Serialized distribution.
+        session : AsyncSession, optional
+            Optional AsyncSession object to use for the database connection.
+            If not provided, a new session will be created.
+
+        Returns
+        -------
+        bool
+            True if a new distribution was inserted, False if an existing one was updated.
+        """
+        model = self.get_model_cls()
+        now = datetime.now()
+        stmt = insert(model).values(ingredients=ingredients, data=data, size_bytes=len(data), requests=1, last_requested=now)
+        stmt = stmt.on_duplicate_key_update(data=stmt.inserted.data, size_bytes=stmt.inserted.size_bytes, last_requested=now)
+        async with self.database.must_enter_session(session) as session:
+            result = await session.execute(stmt)
+            # MySQL reports 1 affected row for an insert and 2 for an update. An update changing
+            # nothing can also report 1, which callers only use to estimate usage.
+            return result.rowcount == 1  # type: ignore
+
+    @QueryStatistics.bind_operation
+    async def get_usage(self, session: None | AsyncSession = None) -> tuple[int, int]:
+        """
+        Get the number of stored distributions and their total size.
+
+        Parameters
+        ----------
+        session : AsyncSession, optional
+            Optional AsyncSession object to use for the database connection.
+            If not provided, a new session will be created.
+
+        Returns
+        -------
+        tuple[int, int]
+            Number of entries, and total size of `data` in bytes.
+        """
+        model = self.get_model_cls()
+        async with self.database.must_enter_session(session) as session:
+            stmt = select(func.count(), func.coalesce(func.sum(model.size_bytes), 0))
+            result = await session.execute(stmt)
+            entries, total_bytes = result.one()
+            return int(entries), int(total_bytes)
+
+    @QueryStatistics.bind_operation
+    async def get_most_requested(self, limit: int, session: None | AsyncSession = None) -> Sequence[CraftedDistribution]:
+        """
+        Get the `limit` most requested distributions, most requested first.
+
+        Parameters
+        ----------
+        limit : int
+            Max number of distributions to get.
+        session : AsyncSession, optional
+            Optional AsyncSession object to use for the database connection.
+            If not provided, a new session will be created.
+        """
+        model = self.get_model_cls()
+        async with self.database.must_enter_session(session) as session:
+            stmt = select(model).order_by(model.requests.desc()).limit(limit)
+            result = await session.execute(stmt)
+            return result.scalars().all()
+
+    @QueryStatistics.bind_operation
+    async def evict(self, max_entries: int, max_bytes: int, session: None | AsyncSession = None) -> int:
+        """
+        Delete least recently requested distributions until at most `max_entries` entries
+        with a total of at most `max_bytes` bytes remain.
+
+        Parameters
+        ----------
+        max_entries : int
+            Max number of entries to keep.
+        max_bytes : int
+            Max total size of `data` to keep, in bytes.
+        session : AsyncSession, optional
+            Optional AsyncSession object to use for the database connection.
+            If not provided, a new session will be created.
+
+        Returns
+        -------
+        int
+            Number of evicted entries.
+        """
+        model = self.get_model_cls()
+        async with self.database.must_enter_session(session) as session:
+            stmt = select(model.ingredients, model.size_bytes).order_by(model.last_requested.desc())
+            result = await session.execute(stmt)
+
+            to_evict: list[str] = []
+            kept_entries = kept_bytes = 0
+            for ingredients, size_bytes in result.all():
+                if kept_entries < max_entries and kept_bytes + size_bytes <= max_bytes:
+                    kept_entries += 1
+                    kept_bytes += size_bytes
+                else:
+                    to_evict.append(ingredients)
+
+            if to_evict:
+                await session.execute(delete(model).where(model.ingredients.in_(to_evict)))
+            return len(to_evict)
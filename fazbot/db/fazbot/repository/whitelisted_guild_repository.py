@@ -3,19 +3,21 @@ from typing import TYPE_CHECKING, Any, Sequence
 
 from sqlalchemy import select
 
+from ... import QueryStatistics
 from ..model import WhitelistedGuild
-from ._repository import Repository
+from ._expirable_repository import ExpirableRepository
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
     from ... import BaseAsyncDatabase
 
 
-class WhitelistedGuildRepository(Repository[WhitelistedGuild, int]):
+class WhitelistedGuildRepository(ExpirableRepository[WhitelistedGuild, int]):
 
     def __init__(self, database: BaseAsyncDatabase[Any]) -> None:
         super().__init__(database, WhitelistedGuild)
 
+    @QueryStatistics.bind_operation
     async def get_all_whitelisted_guild_ids(self, session: None | AsyncSession = None) -> Sequence[int]:
         model = self.get_model_cls()
         async with self.database.must_enter_session(session) as session:
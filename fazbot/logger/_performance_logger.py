@@ -26,15 +26,7 @@ class PerformanceLogger:
         async def wrapped(*args: P.args, **kwargs: P.kwargs) -> T:
             t1 = perf_counter()
             res = await callable(*args, **kwargs)
-            td = timedelta(seconds=perf_counter() - t1)
-            now = datetime.now()
-
-            with self._lock:
-                list_ = self._data[name]  # get reference
-                list_.append((now, td))
-                if len(list_) > self._MAX_CACHE:
-                    # NOTE: List is ordered by oldest to newest. list.pop(0) removes the oldest data
-                    list_.pop(0)
+            self.record(name, timedelta(seconds=perf_counter() - t1))
             return res
 
         return wrapped
@@ -50,19 +42,21 @@ class PerformanceLogger:
         def wrapped(*args: P.args, **kwargs: P.kwargs) -> T:
             t1 = perf_counter()
             res = callable(*args, **kwargs)
-            td = timedelta(seconds=perf_counter() - t1)
-            now = datetime.now()
-
-            with self._lock:
-                list_ = self._data[name]  # get reference
-                list_.append((now, td))
-                if len(list_) > self._MAX_CACHE:
-                    # NOTE: List is ordered by oldest to newest. list.pop(0) removes the oldest data
-                    list_.pop(0)
+            self.record(name, timedelta(seconds=perf_counter() - t1))
             return res
 
         return wrapped
 
+    def record(self, name: str, duration: timedelta) -> None:
+        """Records a duration measured outside of the bind decorators."""
+        now = datetime.now()
+        with self._lock:
+            list_ = self._data.setdefault(name, [])  # get reference
+            list_.append((now, duration))
+            if len(list_) > self._MAX_CACHE:
+                # NOTE: List is ordered by oldest to newest. list.pop(0) removes the oldest data
+                list_.pop(0)
+
     def get_average(self, name: str) -> float:
         """Get average duration of calls in seconds. If no data, return 0."""
         with self._lock:
@@ -1,3 +1,5 @@
 # type: ignore
+from .crafted_batch_result import CraftedBatchResult
 from .wynn_emeralds import WynnEmeralds
+from .wynn_ingredient_effectiveness import WynnIngredientEffectiveness
 from .wynn_ingredient_value import WynnIngredientValue
@@ -0,0 +1,92 @@
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false
+from __future__ import annotations
+
+import numpy as np
+
+
+class CraftedBatchResult:
+
+    _EPSILON = 1e-12
+
+    def __init__(self, roll_mins: np.ndarray, pmfs: np.ndarray) -> None:
+        """ Crafted roll distributions of many recipes, stored as one padded 2D array.
+
+        Args:
+            roll_mins (np.ndarray): Shape (recipes,). Lowest possible crafted roll of each recipe.
+            pmfs (np.ndarray): Shape (recipes, width). `pmfs[r, i]` is the probability of recipe `r`
+                rolling `roll_mins[r] + i`. Padding past a recipe's highest roll is 0.
+        """
+        self._roll_mins = roll_mins
+        self._pmfs = pmfs
+        self._cdfs = np.minimum(np.cumsum(pmfs, axis=1), 1.0)
+        self._sfs = np.minimum(np.cumsum(pmfs[:, ::-1], axis=1)[:, ::-1], 1.0)
+
+        offsets = np.arange(pmfs.shape[1])
+        is_possible = pmfs > 0
+        self._roll_maxs = roll_mins + np.where(is_possible, offsets, 0).max(axis=1, initial=0)
+        self._expected_values = roll_mins + pmfs @ offsets
+
+    def __len__(self) -> int:
+        return len(self._roll_mins)
+
+    @property
+    def roll_mins(self) -> np.ndarray:
+        """ Shape (recipes,). Lowest possible crafted roll of each recipe. """
+        return self._roll_mins
+
+    @property
+    def roll_maxs(self) -> np.ndarray:
+        """ Shape (recipes,). Highest possible crafted roll of each recipe. """
+        return self._roll_maxs
+
+    @property
+    def pmfs(self) -> np.ndarray:
+        """ Shape (recipes, width). Probability of each roll offset from `roll_mins`. """
+        return self._pmfs
+
+    @property
+    def cdfs(self) -> np.ndarray:
+        """ Shape (recipes, width). P(roll <= roll_mins + offset). """
+        return self._cdfs
+
+    @property
+    def sfs(self) -> np.ndarray:
+        """ Shape (recipes, width). P(roll >= roll_mins + offset). """
+        return self._sfs
+
+    @property
+    def expected_values(self) -> np.ndarray:
+        """ Shape (recipes,). Expected crafted roll of each recipe. """
+        return self._expected_values
+
+    def get_distribution(self, recipe: int) -> dict[int, float]:
+        """ {roll: probability} of one recipe, excluding impossible rolls. """
+        offsets = np.flatnonzero(self._pmfs[recipe])
+        rolls = (self._roll_mins[recipe] + offsets).tolist()
+        return dict(zip(rolls, self._pmfs[recipe, offsets].tolist()))
+
+    def prob_at_least(self, roll: int | np.ndarray) -> np.ndarray:
+        """ Shape (recipes,). P(roll >= `roll`) of each recipe. `roll` may be a scalar or one roll per recipe. """
+        offsets = np.asarray(roll) - self._roll_mins
+        padded = np.pad(self._sfs, ((0, 0), (1, 1)), constant_values=((0, 0), (1, 0)))
+        idxs = np.clip(offsets + 1, 0, padded.shape[1] - 1)
+        return padded[np.arange(len(self)), idxs]
+
+    def prob_at_most(self, roll: int | np.ndarray) -> np.ndarray:
+        """ Shape (recipes,). P(roll <= `roll`) of each recipe. `roll` may be a scalar or one roll per recipe. """
+        offsets = np.asarray(roll) - self._roll_mins
+        padded = np.pad(self._cdfs, ((0, 0), (1, 1)), constant_values=((0, 0), (0, 1)))
+        idxs = np.clip(offsets + 1, 0, padded.shape[1] - 1)
+        return padded[np.arange(len(self)), idxs]
+
+    def quantile(self, q: float) -> np.ndarray:
+        """ Shape (recipes,). Smallest roll `r` of each recipe where P(roll <= r) >= `q`. """
+        offsets = np.argmax(self._cdfs >= q - self._EPSILON, axis=1)
+        return self._roll_mins + offsets
+
+    def roll_at_confidence(self, confidence: float) -> np.ndarray:
+        """ Shape (recipes,). Largest roll `r` of each recipe where P(roll >= r) >= `confidence`. """
+        is_reached = self._sfs >= confidence - self._EPSILON
+        # Index of the last True of each row. sf is non-increasing, so it is the count of True minus one
+        offsets = np.maximum(is_reached.sum(axis=1) - 1, 0)
+        return self._roll_mins + offsets
@@ -1,61 +1,114 @@
 from __future__ import annotations
-from math import floor
+from functools import lru_cache
+from operator import index
 import re
+from typing import Any, Iterable
 
 
 class WynnEmeralds:
+    """ Immutable amount of emeralds. Only the total is stored, denominations are derived from it. """
+
+    __slots__ = ("_total",)
+
+    _UNIT_VALUES = {"e": 1, "eb": 64, "le": 64 * 64, "stx": 64 * 64 * 64}
+    _TOKEN_PATTERN = re.compile(r"(?P<amount>-?\d+(?:\.\d+)?(?:/\d+(?:\.\d+)?)?%?)(?P<unit>[A-Za-z]*)(?:\s+|$)")
+    """An amount, either a decimal, a fraction or a percentage, optionally negative, followed by its unit."""
+    _INTERN_LIMIT = 64 * 64
+    """Totals from 0 up to this are shared instances."""
+    _INTERNED: tuple[WynnEmeralds, ...] = ()
+
+    _total: int
+
+    def __new__(cls, emeralds: int = 0, blocks: int = 0, liquids: int = 0, stacks: int = 0) -> WynnEmeralds:
+        if type(emeralds) is int and not (blocks or liquids or stacks):
+            # Fast path, most instances are made from a total
+            total = emeralds
+        else:
+            total = cls._get_total(index(emeralds), index(blocks), index(liquids), index(stacks))
+        if 0 <= total < cls._INTERN_LIMIT and cls is WynnEmeralds and cls._INTERNED:
+            return cls._INTERNED[total]
+        obj = object.__new__(cls)
+        _set_total(obj, total)
+        return obj
 
-    def __init__(self, emeralds: int = 0, blocks: int = 0, liquids: int = 0, stacks: int = 0) -> None:
-        self._emeralds = emeralds
-        self._blocks = blocks
-        self._liquids = liquids
-        self._stacks = stacks
-        self._total = self._get_total(emeralds, blocks, liquids, stacks)
-
-    def simplify(self) -> None:
-        if self._emeralds >= 64:
-            self._blocks += self._emeralds // 64
-            self._emeralds %= 64
-
-        if self._blocks >= 64:
-            self._liquids += self._blocks // 64
-            self._blocks %= 64
+    @classmethod
+    def _from_total(cls, total: int) -> WynnEmeralds:
+        obj = object.__new__(cls)
+        _set_total(obj, total)
+        return obj
 
-        if self._liquids >= 64:
-            self._stacks += self._liquids // 64
-            self._liquids %= 64
+    def simplify(self) -> WynnEmeralds:
+        """ Kept for compatibility. Denominations are always derived from the total, so every instance
+        is already simplified and is returned as is. """
+        return self
 
     @classmethod
     def from_string(cls, emerald_string: str) -> WynnEmeralds:
-        strings = emerald_string.split()
-        if len(strings) == 1 and strings[0].isnumeric():
-            return cls(emeralds=int(strings[0]))
-
-        e = eb = le = stx = 0
-        multiplier = 1
-        for str_ in strings:
-            input_split = re.match(r'^(.*?)([A-Za-z]+)$', str_)
-            if not input_split:
+        """ Parses an emerald string, e.g. "2x 1stx 1le 1eb 1e", "2.5stx 100.5le", "1/3x 1000eb", "50%le" or
+        "1stx -1le". A single number without unit is emeralds. The total is rounded down to whole emeralds. """
+        return cls(emeralds=cls._parse_total(emerald_string))
+
+    @classmethod
+    def parse_many(cls, emerald_strings: Iterable[str]) -> list[WynnEmeralds]:
+        """ Parses many emerald strings. Repeated strings are only parsed once. """
+        return [cls(emeralds=cls._parse_total(emerald_string)) for emerald_string in emerald_strings]
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _parse_total(emerald_string: str) -> int:
+        """ Tokenizes `emerald_string` in one pass. Amounts are summed as exact integer ratios. """
+        string = emerald_string.strip()
+        total_num, total_den = 0, 1
+        mult_num, mult_den = 1, 1
+        pos = 0
+        n_tokens = 0
+        has_unitless = False
+        while pos < len(string):
+            match = WynnEmeralds._TOKEN_PATTERN.match(string, pos)
+            if not match:
                 raise ValueError("Invalid emerald string.")
-            amount = input_split.group(1)
-            unit = input_split.group(2)
-
-            parsed_amount = cls._parse_number_string(amount)
-            if unit == 'e':
-                e += int(parsed_amount)
-            elif unit == 'eb':
-                eb += int(parsed_amount)
-            elif unit == 'le':
-                le  += int(parsed_amount)
-            elif unit == 'stx':
-                stx += int(parsed_amount)
-            elif unit == 'x':
-                multiplier = parsed_amount
+            pos = match.end()
+            n_tokens += 1
+
+            num, den = WynnEmeralds._parse_amount(match.group("amount"))
+            unit = match.group("unit").lower()
+            if unit == "x":
+                mult_num *= num
+                mult_den *= den
+                continue
+            if unit in WynnEmeralds._UNIT_VALUES:
+                num *= WynnEmeralds._UNIT_VALUES[unit]
+            elif not unit:
+                has_unitless = True
             else:
                 raise ValueError(f"Invalid unit {unit} in emerald string.")
+            total_num = total_num * den + num * total_den
+            total_den *= den
+
+        if has_unitless and n_tokens > 1:
+            raise ValueError("Invalid emerald string.")
+        return (total_num * mult_num) // (total_den * mult_den)
 
-        total = floor(cls._get_total(e, eb, le, stx) * multiplier)
-        return cls(emeralds=total)
+    @staticmethod
+    def _parse_amount(amount_string: str) -> tuple[int, int]:
+        """ Parses a decimal, fraction or percentage amount into (numerator, denominator). """
+        if amount_string.isdigit():
+            # Fast path, most amounts are whole numbers
+            return int(amount_string), 1
+        is_percentage = amount_string.endswith("%")
+        num_string, _, den_string = amount_string.rstrip("%").partition("/")
+        num, den = WynnEmeralds._parse_decimal(num_string)
+        if den_string:
+            den_num, den_den = WynnEmeralds._parse_decimal(den_string)
+            if den_num == 0:
+                raise ValueError("Invalid emerald string.")
+            num, den = num * den_den, den * den_num
+        return (num, den * 100) if is_percentage else (num, den)
+
+    @staticmethod
+    def _parse_decimal(decimal_string: str) -> tuple[int, int]:
+        whole, _, frac = decimal_string.partition(".")
+        return int(whole + frac), 10 ** len(frac)
 
     @property
     def total(self) -> int:
@@ -63,47 +116,103 @@ class WynnEmeralds:
 
     @property
     def emeralds(self) -> int:
-        return self._emeralds
+        return self.__get_denomination(1)
 
     @property
     def blocks(self) -> int:
-        return self._blocks
+        return self.__get_denomination(64)
 
     @property
     def liquids(self) -> int:
-        return self._liquids
+        return self.__get_denomination(64 * 64)
 
     @property
     def stacks(self) -> int:
-        return self._stacks
+        # Stacks are the largest unit, so they aren't wrapped at 64
+        return self._total // (64 * 64 * 64) if self._total >= 0 else -(-self._total // (64 * 64 * 64))
 
+    def __get_denomination(self, unit_value: int) -> int:
+        # Negative totals are broken down by magnitude, e.g. -65 is -1eb -1e
+        if self._total >= 0:
+            return self._total // unit_value % 64
+        return -(-self._total // unit_value % 64)
 
     @staticmethod
     def _get_total(emeralds: int, blocks: int, liquids: int, stacks: int) -> int:
         return emeralds + blocks * 64 + liquids * 64 * 64 + stacks * 64 * 64 * 64
 
-    @staticmethod
-    def _parse_number_string(number_string: str) -> float:
-        if '/' in number_string:
-            num, den = number_string.split('/')
-            return int(num) / int(den)
-        if '%' in number_string:
-            return float(number_string.strip('%')) / 100
-        return float(number_string)
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> tuple[type[WynnEmeralds], tuple[int]]:
+        return type(self), (self._total,)
 
     def __repr__(self) -> str:
-        return f"{self._stacks}stx {self._liquids}le {self._blocks}eb {self._emeralds}e"
+        return f"{self.stacks}stx {self.liquids}le {self.blocks}eb {self.emeralds}e"
+
+    def __hash__(self) -> int:
+        return hash(self._total)
 
     def __eq__(self, other: WynnEmeralds | int | str | object) -> bool:
         if isinstance(other, WynnEmeralds):
-            return self._total == other.total
+            return self._total == other._total
         elif isinstance(other, int):
             return self._total == other
         elif isinstance(other, str):
             return str(self) == other
         return False
 
+    def __lt__(self, other: WynnEmeralds | int) -> bool:
+        total = self.__get_other_total(other)
+        return NotImplemented if total is None else self._total < total
+
+    def __le__(self, other: WynnEmeralds | int) -> bool:
+        total = self.__get_other_total(other)
+        return NotImplemented if total is None else self._total <= total
+
+    def __gt__(self, other: WynnEmeralds | int) -> bool:
+        total = self.__get_other_total(other)
+        return NotImplemented if total is None else self._total > total
+
+    def __ge__(self, other: WynnEmeralds | int) -> bool:
+        total = self.__get_other_total(other)
+        return NotImplemented if total is None else self._total >= total
+
     def __add__(self, other: WynnEmeralds | int) -> WynnEmeralds:
+        total = self.__get_other_total(other)
+        return NotImplemented if total is None else WynnEmeralds(self._total + total)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: WynnEmeralds | int) -> WynnEmeralds:
+        total = self.__get_other_total(other)
+        return NotImplemented if total is None else WynnEmeralds(self._total - total)
+
+    def __rsub__(self, other: int) -> WynnEmeralds:
+        total = self.__get_other_total(other)
+        return NotImplemented if total is None else WynnEmeralds(total - self._total)
+
+    def __mul__(self, other: int) -> WynnEmeralds:
         if isinstance(other, int):
-            return WynnEmeralds(emeralds=self._emeralds + other)
-        return WynnEmeralds(emeralds=self._emeralds + other.total)
+            return WynnEmeralds(self._total * other)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> WynnEmeralds:
+        return WynnEmeralds(-self._total)
+
+    @staticmethod
+    def __get_other_total(other: object) -> int | None:
+        if isinstance(other, WynnEmeralds):
+            return other._total
+        if isinstance(other, int):
+            return other
+        return None
+
+
+_set_total = WynnEmeralds._total.__set__  # type: ignore
+WynnEmeralds._INTERNED = tuple(WynnEmeralds._from_total(total) for total in range(WynnEmeralds._INTERN_LIMIT))
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+
+class WynnIngredientEffectiveness:
+
+    KEYS = ("left", "right", "above", "under", "touching", "not_touching")
+
+    def __init__(
+            self,
+            left: int = 0,
+            right: int = 0,
+            above: int = 0,
+            under: int = 0,
+            touching: int = 0,
+            not_touching: int = 0
+        ) -> None:
+        """ Positional effectiveness modifiers of an ingredient. Each value is the effectiveness in %
+        the ingredient adds to the ingredients in that position relative to its slot.
+
+        Args:
+            left (int, optional): Ingredient to the left, in the same row. Defaults to 0.
+            right (int, optional): Ingredient to the right, in the same row. Defaults to 0.
+            above (int, optional): Ingredients above, in the same column. Defaults to 0.
+            under (int, optional): Ingredients under, in the same column. Defaults to 0.
+            touching (int, optional): Ingredients directly next to, above or under. Defaults to 0.
+            not_touching (int, optional): Every other ingredient not touching. Defaults to 0.
+        """
+        self._left = left
+        self._right = right
+        self._above = above
+        self._under = under
+        self._touching = touching
+        self._not_touching = not_touching
+
+    @property
+    def left(self) -> int:
+        return self._left
+
+    @property
+    def right(self) -> int:
+        return self._right
+
+    @property
+    def above(self) -> int:
+        return self._above
+
+    @property
+    def under(self) -> int:
+        return self._under
+
+    @property
+    def touching(self) -> int:
+        return self._touching
+
+    @property
+    def not_touching(self) -> int:
+        return self._not_touching
+
+    @classmethod
+    def from_string(cls, effectiveness_string: str) -> WynnIngredientEffectiveness:
+        """ Parses an effectiveness string in format of 'position=value[,position=value...]',
+        e.g. 'touching=-10,under=20'. Omitted positions are 0. """
+        kwargs: dict[str, int] = {}
+        for pair in effectiveness_string.split(","):
+            if not pair.strip():
+                continue
+            key, sep, val = pair.partition("=")
+            key = key.strip().lower()
+            if not sep or key not in cls.KEYS:
+                raise ValueError(
+                    f"Invalid effectiveness {pair.strip()}. Must be in format of 'position=value', "
+                    f"where position is one of {', '.join(cls.KEYS)}"
+                )
+            try:
+                kwargs[key] = int(val)
+            except ValueError:
+                raise ValueError(f"Exception occured while parsing effectiveness value {val}")
+        return cls(**kwargs)
+
+    def to_tuple(self) -> tuple[int, int, int, int, int, int]:
+        """ Effectiveness values in the order of `KEYS`. """
+        return self._left, self._right, self._above, self._under, self._touching, self._not_touching
+
+    def __repr__(self) -> str:
+        return f"WynnIngredientEffectiveness({', '.join(f'{k}={v}' for k, v in zip(self.KEYS, self.to_tuple()))})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, WynnIngredientEffectiveness):
+            return self.to_tuple() == other.to_tuple()
+        return False
+
+    def __hash__(self) -> int:
+        return hash(self.to_tuple())
@@ -1,3 +1,6 @@
+from __future__ import annotations
+
+
 class WynnIngredientValue:
 
     def __init__(self, min_value: int, max_value: int, boost: int = 0) -> None:
@@ -6,7 +9,8 @@ class WynnIngredientValue:
         Args:
             min_value (int): Ingredient minimum value
             max_value (int): Ingredient maximum value
-            boost (int, optional): Ingredient boost value. Defaults to 0.
+            boost (int, optional): Ingredient boost value. Can be negative down to -100 (0% effectiveness).
+                Defaults to 0.
         """
         self._boost = boost
         self._min_value = min_value
@@ -28,6 +32,24 @@ class WynnIngredientValue:
         """ Ingredient boost value """
         return self._boost
 
+    @classmethod
+    def from_string(cls, ingredient_string: str) -> WynnIngredientValue:
+        """ Parses an ingredient string in format of 'min,max[,efficiency]' """
+        ing_vals = ingredient_string.strip().split(",")
+        if len(ing_vals) not in {2, 3}:
+            raise ValueError("Invalid ingredient format. Must be in format of 'min,max[,efficiency]'")
+        parsed_ing_vals: list[int] = []
+        for val in ing_vals:
+            try:
+                parsed_ing_vals.append(int(val))
+            except ValueError:
+                raise ValueError(f"Exception occured while parsing ingredient value {val}")
+        return cls(*parsed_ing_vals)
+
+    def to_tuple(self) -> tuple[int, int, int]:
+        """ Ingredient values as `(min_value, max_value, boost)`. Also used as the canonical sort key. """
+        return self._min_value, self._max_value, self._boost
+
     def _check_params(self) -> None:
         """ Check if the parameters are valid
 
@@ -37,7 +59,20 @@ class WynnIngredientValue:
             boost (int): Ingredient boost value
 
         Raises:
-            ValueError: If minimum value is greater than maximum value or boost is negative
+            ValueError: If minimum value is greater than maximum value or boost is below -100
         """
-        if self._min_value > self._max_value or self._boost < 0:
+        if self._min_value > self._max_value:
             raise ValueError("Minimum value cannot be greater than maximum value")
+        if self._boost < -100:
+            raise ValueError("Boost cannot be below -100")
+
+    def __repr__(self) -> str:
+        return f"WynnIngredientValue(min_value={self._min_value}, max_value={self._max_value}, boost={self._boost})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, WynnIngredientValue):
+            return self.to_tuple() == other.to_tuple()
+        return False
+
+    def __hash__(self) -> int:
+        return hash(self.to_tuple())
@@ -1,6 +1,11 @@
 # type: ignore
 from .cache_util import CacheUtil
+from .convolution_util import ConvolutionUtil
 from .crafted_util import CraftedUtil
+from .crafted_search_util import CraftedSearchUtil
+from .crafted_simulation_util import CraftedSimulationUtil
+from .crafted_slot_util import CraftedSlotUtil
 from .emerald_util import EmeraldUtil
+from .image_util import ImageUtil
 from .retry_handler import RetryHandler
 from .ingredient_util import IngredientUtil
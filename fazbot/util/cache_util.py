@@ -1,28 +1,57 @@
+from __future__ import annotations
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Future
+from decimal import Decimal
+from enum import Enum
 from functools import wraps
+from hashlib import blake2b
+from threading import Lock
+from time import monotonic
 from typing import Any, Awaitable, Callable
 
+import numpy as np
+
 
 class CacheUtil:
+    """Memoization cache keyed by hashed, canonicalized arguments.
+
+    Entries are evicted least-recently-used first once `max_size` is exceeded, and expire after
+    `ttl` seconds if set. Concurrent calls with the same key are deduplicated, so only the first
+    caller computes the value and the others wait for it. Instances are meant to be shared
+    process-wide, e.g. as a class attribute."""
+
+    def __init__(self, max_size: int = 128, ttl: float | None = None) -> None:
+        """
+        Args:
+            max_size (int, optional): Max number of entries. Defaults to 128.
+            ttl (float | None, optional): Seconds until an entry expires. Defaults to None (never).
+        """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._cache: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        """{key: (value, expires_at)}"""
+        self._lock = Lock()
 
-    def __init__(self) -> None:
-        self._cache: dict[str, Any] = {}
+        self._inflight: dict[str, Future[Any]] = {}
+        self._async_inflight: dict[str, asyncio.Task[Any]] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def decorator[T, **P](self, func: Callable[P, T]) -> Callable[P, T]:
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            key = func.__name__
-            if key not in self._cache:
-                self._cache[key] = func(*args, **kwargs)
-            return self._cache[key]
+            key = self.make_key(func.__qualname__, *args, **kwargs)
+            return self.get_or_compute(key, lambda: func(*args, **kwargs))
         return wrapper
 
     def async_decorator[T, **P](self, func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            key = func.__name__
-            if key not in self._cache:
-                self._cache[key] = await func(*args, **kwargs)
-            return self._cache[key]
+            key = self.make_key(func.__qualname__, *args, **kwargs)
+            return await self.async_get_or_compute(key, lambda: func(*args, **kwargs))
         return wrapper
 
     def register(self, obj: object, func: Callable[..., Any | Awaitable[Any]] | list[Callable[..., Any | Awaitable[Any]]]) -> None:
@@ -32,4 +61,135 @@ class CacheUtil:
             return
         if not hasattr(obj, func.__name__):
             raise AttributeError(f"{obj.__class__.__name__} has no attribute '{func.__name__}'")
-        setattr(obj, func.__name__, self.decorator(func))
+        if asyncio.iscoroutinefunction(func):
+            setattr(obj, func.__name__, self.async_decorator(func))
+        else:
+            setattr(obj, func.__name__, self.decorator(func))
+
+    def get_or_compute[T](self, key: str, factory: Callable[[], T]) -> T:
+        """Gets the value of `key`, computing it with `factory` on a miss."""
+        with self._lock:
+            found, value = self.__get(key)
+            if found:
+                return value
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            value = factory()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    async def async_get_or_compute[T](self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Gets the value of `key`, computing it with `factory` on a miss.
+
+        The computation runs in its own task that every caller awaits through `asyncio.shield()`,
+        so cancelling one caller, including the one that started it, doesn't cancel it for the others."""
+        with self._lock:
+            found, value = self.__get(key)
+        if found:
+            return value
+
+        task = self._async_inflight.get(key)
+        if task is None:
+            task = self._async_inflight[key] = asyncio.create_task(self.__async_compute(key, factory))
+            # Marks the exception as retrieved in case every caller was cancelled
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return await asyncio.shield(task)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            found, value = self.__get(key)
+        return value if found else default
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = monotonic() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            self._cache[key] = (value, expires_at)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def make_key(*args: Any, **kwargs: Any) -> str:
+        """Builds a cache key from the hash of the canonical form of the arguments. Equal arguments
+        produce equal keys regardless of object identity, dict ordering or set ordering."""
+        canonical = (CacheUtil.__canonicalize(args), CacheUtil.__canonicalize(kwargs))
+        return blake2b(repr(canonical).encode(), digest_size=16).hexdigest()
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def size(self) -> int:
+        return len(self._cache)
+
+    async def __async_compute[T](self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        try:
+            value = await factory()
+            self.set(key, value)
+            return value
+        finally:
+            del self._async_inflight[key]
+
+    def __get(self, key: str) -> tuple[bool, Any]:
+        """Must be called while holding `_lock`."""
+        entry = self._cache.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at is None or monotonic() < expires_at:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return True, value
+            del self._cache[key]
+        self._misses += 1
+        return False, None
+
+    @staticmethod
+    def __canonicalize(obj: Any) -> Any:
+        canonicalize = CacheUtil.__canonicalize
+        if obj is None or isinstance(obj, (bool, int, float, str, bytes, Decimal, Enum)):
+            return obj
+        if isinstance(obj, (list, tuple)):
+            return tuple(canonicalize(item) for item in obj)
+        if isinstance(obj, dict):
+            return tuple(sorted((repr(canonicalize(k)), canonicalize(v)) for k, v in obj.items()))
+        if isinstance(obj, (set, frozenset)):
+            return tuple(sorted(repr(canonicalize(item)) for item in obj))
+        if isinstance(obj, np.ndarray):
+            return (str(obj.dtype), obj.shape, obj.tobytes())
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if hasattr(obj, "__dict__"):
+            return (type(obj).__qualname__, canonicalize(vars(obj)))
+        if hasattr(type(obj), "__slots__"):
+            slots = getattr(type(obj), "__slots__")
+            return (type(obj).__qualname__, tuple(canonicalize(getattr(obj, slot, None)) for slot in slots))
+        return (type(obj).__qualname__, repr(obj))
@@ -0,0 +1,96 @@
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false
+from __future__ import annotations
+from typing import Iterable, Literal
+
+import numpy as np
+
+ConvolutionMethod = Literal["auto", "direct", "fft"]
+
+
+class ConvolutionUtil:
+    """Convolution backend for discrete probability distributions."""
+
+    FFT_THRESHOLD = 50_000
+    """Estimated direct convolution cost (multiply-adds) above which `auto` picks FFT."""
+    FFT_MIN_LENGTH = 32
+    """Direct convolution is always faster when every input is shorter than this."""
+    FFT_TOLERANCE = 1e-13
+    """FFT round-off noise floor, relative to the largest output value. Values below it are zeroed.
+    Six ingredients have a smallest non-zero probability of 101^-6 (~9.4e-13), which stays above it."""
+
+    @staticmethod
+    def convolve_many(arrays: Iterable[np.ndarray], method: ConvolutionMethod = "auto") -> np.ndarray:
+        """Convolves all `arrays` together.
+
+        Args:
+            arrays (Iterable[np.ndarray]): Float arrays to convolve.
+            method (ConvolutionMethod, optional): `direct`, `fft`, or `auto` to pick
+                based on the support sizes. Defaults to "auto".
+
+        Returns:
+            np.ndarray: The convolution of all arrays. `[1.0]` if `arrays` is empty.
+        """
+        arrays_ = [np.asarray(arr, dtype=np.float64) for arr in arrays]
+        if not arrays_:
+            return np.ones(1)
+        if method == "auto":
+            method = ConvolutionUtil.choose_method([len(arr) for arr in arrays_])
+
+        if method == "direct":
+            res = np.ones(1)
+            for arr in arrays_:
+                res = np.convolve(res, arr)
+            return res
+        elif method == "fft":
+            return ConvolutionUtil._fft_convolve_many(arrays_)
+        raise ValueError(f"Unknown convolution method {method}")
+
+    @staticmethod
+    def convolve_many_exact(arrays: Iterable[np.ndarray]) -> np.ndarray:
+        """Convolves integer arrays together without any rounding.
+
+        Uses `int64` while the total mass is guaranteed to fit, and falls back to Python
+        integers (object arrays) otherwise.
+
+        Args:
+            arrays (Iterable[np.ndarray]): Non-negative integer arrays to convolve.
+
+        Returns:
+            np.ndarray: The exact integer convolution of all arrays. `[1]` if `arrays` is empty.
+        """
+        arrays_ = [np.asarray(arr) for arr in arrays]
+        total_mass = 1
+        for arr in arrays_:
+            total_mass *= int(arr.sum(dtype=object))
+
+        dtype = np.int64 if total_mass < 2**62 else object
+        res = np.ones(1, dtype=dtype)
+        for arr in arrays_:
+            res = np.convolve(res, arr.astype(dtype))
+        return res
+
+    @staticmethod
+    def choose_method(lengths: list[int]) -> ConvolutionMethod:
+        """Picks the cheaper convolution method for inputs of `lengths`."""
+        if max(lengths, default=0) < ConvolutionUtil.FFT_MIN_LENGTH:
+            return "direct"
+        direct_cost = 0
+        acc_length = 1
+        for length in lengths:
+            direct_cost += acc_length * length
+            acc_length += length - 1
+        return "fft" if direct_cost >= ConvolutionUtil.FFT_THRESHOLD else "direct"
+
+    @staticmethod
+    def _fft_convolve_many(arrays: list[np.ndarray]) -> np.ndarray:
+        out_length = sum(len(arr) for arr in arrays) - len(arrays) + 1
+        fft_length = 1 << (out_length - 1).bit_length()
+
+        spectrum = np.ones(fft_length // 2 + 1, dtype=np.complex128)
+        for arr in arrays:
+            spectrum *= np.fft.rfft(arr, fft_length)
+        res = np.fft.irfft(spectrum, fft_length)[:out_length]
+
+        # Remove round-off noise so that impossible values stay exactly 0
+        res[res < res.max() * ConvolutionUtil.FFT_TOLERANCE] = 0
+        return res
@@ -0,0 +1,155 @@
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false
+from __future__ import annotations
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .crafted_util import CraftedUtil
+
+if TYPE_CHECKING:
+    from fazbot.object import WynnIngredientValue
+
+
+class CraftedSearchUtil:
+
+    _EPSILON = 1e-12
+
+    def __init__(
+            self,
+            candidates: list[WynnIngredientValue],
+            target: int,
+            confidence: float,
+            costs: list[float] | None = None,
+            max_ingredients: int = 6,
+            time_budget: float = 5.0
+        ) -> None:
+        """Finds the cheapest multiset of candidate ingredients where P(crafted roll >= `target`) >= `confidence`.
+        Without costs, the smallest set is found. Ties are broken by the higher probability.
+
+        Sets are searched depth-first with branch-and-bound. A branch is pruned once it can't be
+        cheaper than the best set found, or once it can't reach `confidence` even if every remaining
+        slot rolls the highest roll of the remaining candidates.
+
+        Args:
+            candidates (list[WynnIngredientValue]): Ingredients to pick from. Each can be picked more than once.
+            target (int): Crafted roll to reach.
+            confidence (float): Required P(crafted roll >= `target`), from 0 to 1.
+            costs (list[float] | None, optional): Non-negative cost of each candidate.
+                Defaults to None, which costs 1 each.
+            max_ingredients (int, optional): Max number of ingredients in a set. Defaults to 6.
+            time_budget (float, optional): Seconds to search before returning the best set found
+                so far. Defaults to 5.0.
+        """
+        if not candidates:
+            raise ValueError("At least one candidate ingredient is required.")
+        if costs is None:
+            costs = [1.0] * len(candidates)
+        if len(costs) != len(candidates):
+            raise ValueError("Every candidate ingredient must have a cost.")
+        if any(cost < 0 for cost in costs):
+            raise ValueError("Costs cannot be negative.")
+        if not 0 < confidence <= 1:
+            raise ValueError("Confidence must be between 0 and 1.")
+
+        self._candidates = candidates
+        self._target = target
+        self._confidence = confidence
+        self._costs = costs
+        self._max_ingredients = max_ingredients
+        self._time_budget = time_budget
+
+        self._ingredients: list[WynnIngredientValue] = []
+        self._cost = float("inf")
+        self._probability = 0.0
+        self._is_complete = True
+        self._nodes = 0
+        self._search()
+
+    @property
+    def ingredients(self) -> list[WynnIngredientValue]:
+        """Best set found. Empty if no set reaches `confidence`."""
+        return self._ingredients
+
+    @property
+    def cost(self) -> float:
+        """Total cost of the best set. inf if no set is found."""
+        return self._cost
+
+    @property
+    def probability(self) -> float:
+        """P(crafted roll >= `target`) of the best set."""
+        return self._probability
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether the search finished within the time budget, i.e. the best set is optimal."""
+        return self._is_complete
+
+    @property
+    def nodes(self) -> int:
+        """Number of sets evaluated."""
+        return self._nodes
+
+    def _search(self) -> None:
+        # Precomputed distribution of every candidate, as its lowest roll and PMF of consecutive rolls
+        craftutils = [CraftedUtil([ing]) for ing in self._candidates]
+        self._roll_mins = [int(craftutil.crafted_roll_min) for craftutil in craftutils]
+        self._roll_maxs = [int(craftutil.crafted_roll_max) for craftutil in craftutils]
+        self._pmfs: list[np.ndarray] = []
+        for craftutil, roll_min, roll_max in zip(craftutils, self._roll_mins, self._roll_maxs):
+            pmf = np.zeros(roll_max - roll_min + 1)
+            pmf[craftutil.rolls - roll_min] = craftutil.pmf
+            self._pmfs.append(pmf)
+
+        # Visiting high rolling candidates first finds a good incumbent early, which prunes more
+        self._order = sorted(range(len(self._candidates)), key=lambda i: (-self._roll_maxs[i], self._costs[i]))
+        # Highest roll among order[i:]
+        self._suffix_roll_maxs = np.maximum.accumulate([self._roll_maxs[i] for i in self._order][::-1])[::-1].tolist()
+
+        self._deadline = perf_counter() + self._time_budget
+        self._best_idxs: list[int] = []
+        self._dfs(0, [], 0, np.ones(1), 0.0)
+        self._ingredients = [self._candidates[i] for i in self._best_idxs]
+
+    def _dfs(self, start: int, idxs: list[int], roll_min: int, pmf: np.ndarray, cost: float) -> None:
+        for pos in range(start, len(self._order)):
+            if perf_counter() > self._deadline:
+                self._is_complete = False
+                return
+            i = self._order[pos]
+            new_cost = cost + self._costs[i]
+            if new_cost > self._cost:
+                continue
+
+            self._nodes += 1
+            new_idxs = idxs + [i]
+            new_roll_min = roll_min + self._roll_mins[i]
+            new_pmf = np.convolve(pmf, self._pmfs[i])
+            prob = self.__prob_at_least(new_roll_min, new_pmf, self._target)
+            if prob >= self._confidence - self._EPSILON:
+                if new_cost < self._cost or prob > self._probability:
+                    self._best_idxs = new_idxs
+                    self._cost = new_cost
+                    self._probability = prob
+                # A superset is never cheaper, so stop extending this set
+                continue
+
+            slots_left = self._max_ingredients - len(new_idxs)
+            if slots_left == 0:
+                continue
+            # Upper bound of P(roll >= target) of any superset
+            max_gain = slots_left * max(self._suffix_roll_maxs[pos], 0)
+            prob_bound = self.__prob_at_least(new_roll_min, new_pmf, self._target - max_gain)
+            if prob_bound < self._confidence - self._EPSILON:
+                continue
+            if new_cost == self._cost and prob_bound <= self._probability:
+                continue
+            self._dfs(pos, new_idxs, new_roll_min, new_pmf, new_cost)
+
+    @staticmethod
+    def __prob_at_least(roll_min: int, pmf: np.ndarray, roll: int) -> float:
+        offset = roll - roll_min
+        if offset <= 0:
+            return 1.0
+        return float(min(pmf[offset:].sum(), 1.0))
@@ -0,0 +1,74 @@
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .crafted_util import CraftedUtil
+
+if TYPE_CHECKING:
+    from fazbot.object import WynnIngredientValue
+
+
+class CraftedSimulationUtil:
+    """Monte Carlo simulation of crafted rolls, used to validate `CraftedUtil` numerically."""
+
+    @staticmethod
+    def simulate(
+            ingredients: list[WynnIngredientValue],
+            n_samples: int,
+            seed: int | None = None,
+            chunk_size: int = 1_000_000
+        ) -> tuple[np.ndarray, np.ndarray]:
+        """Draws `n_samples` crafts, each with an independent base roll per ingredient, and applies
+        the same rounding and boost rules as `CraftedUtil`.
+
+        Args:
+            ingredients (list[WynnIngredientValue]): Ingredients used in the craft.
+            n_samples (int): Number of crafts to draw.
+            seed (int | None, optional): Seed of the random generator. Defaults to None.
+            chunk_size (int, optional): Crafts drawn at once, bounds peak memory. Defaults to 1_000_000.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Every drawn crafted roll in ascending order, and how many
+                times each was drawn.
+        """
+        rng = np.random.default_rng(seed)
+        # Boosted roll of every base roll of every ingredient. Shape (ingredients, 101)
+        roll_table = np.array([
+            np.floor(
+                np.round(np.linspace(ing.min_value, ing.max_value, CraftedUtil.ROLL_OUTCOMES)) * ((ing.boost + 100) * 0.01)
+            ).astype(np.int64)
+            for ing in ingredients
+        ]).reshape(len(ingredients), CraftedUtil.ROLL_OUTCOMES)
+        roll_min = int(roll_table.min(axis=1).sum())
+        width = int(roll_table.max(axis=1).sum()) - roll_min + 1
+
+        counts = np.zeros(width, dtype=np.int64)
+        ing_idxs = np.arange(len(ingredients))
+        for start in range(0, n_samples, chunk_size):
+            size = min(chunk_size, n_samples - start)
+            base_rolls = rng.integers(0, CraftedUtil.ROLL_OUTCOMES, size=(size, len(ingredients)))
+            crafted_rolls = roll_table[ing_idxs, base_rolls].sum(axis=1)
+            counts += np.bincount(crafted_rolls - roll_min, minlength=width)
+
+        is_drawn = counts != 0
+        return roll_min + np.flatnonzero(is_drawn), counts[is_drawn]
+
+    @staticmethod
+    def max_z_score(craftutil: CraftedUtil, n_samples: int, seed: int | None = None) -> float:
+        """Largest difference between the simulated and computed probability of any roll, in
+        standard errors of the simulated probability. Below ~5 means they agree."""
+        rolls, counts = CraftedSimulationUtil.simulate(craftutil.ingredients, n_samples, seed)
+        drawn_idxs = np.searchsorted(craftutil.rolls, rolls)
+        is_possible = (drawn_idxs < len(craftutil.rolls)) & (craftutil.rolls[np.minimum(drawn_idxs, len(craftutil.rolls) - 1)] == rolls)
+        if not is_possible.all():
+            # A drawn roll is impossible according to craftutil
+            return float("inf")
+        expected = craftutil.pmf
+        observed = np.zeros(len(craftutil.rolls))
+        observed[drawn_idxs] = counts / n_samples
+
+        # Floor of 1 / n_samples keeps rolls too rare to be drawn from dividing by ~0
+        std_errors = np.sqrt(np.maximum(expected * (1 - expected), 1 / n_samples) / n_samples)
+        return float(np.max(np.abs(observed - expected) / std_errors))
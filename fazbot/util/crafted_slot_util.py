@@ -0,0 +1,174 @@
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false
+from __future__ import annotations
+from itertools import permutations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from fazbot.object import WynnIngredientValue
+
+from .crafted_util import CraftedUtil
+
+if TYPE_CHECKING:
+    from fazbot.object import WynnIngredientEffectiveness
+
+
+class CraftedSlotUtil:
+
+    GRID_ROWS = 3
+    GRID_COLS = 2
+    SLOTS = GRID_ROWS * GRID_COLS
+    _BATCH_SIZE = 64
+    """Max recipes convolved per `CraftedUtil.batch` call, bounds peak memory in target mode."""
+
+    def __init__(
+            self,
+            ingredients: list[WynnIngredientValue],
+            effectivenesses: list[WynnIngredientEffectiveness],
+            target: int | None = None
+        ) -> None:
+        """Finds the slot arrangement of ingredients in the crafting grid that maximises the expected
+        crafted roll, or P(crafted roll >= `target`) if given. Every arrangement is searched.
+
+        Args:
+            ingredients (list[WynnIngredientValue]): Ingredients used in the craft. Their boost is
+                added to the effectiveness they receive from other ingredients.
+            effectivenesses (list[WynnIngredientEffectiveness]): Positional effectiveness modifiers
+                of each ingredient.
+            target (int | None, optional): Roll to maximise the probability of reaching. Ties are
+                broken by expected roll. Defaults to None, which maximises expected roll.
+        """
+        if len(ingredients) != len(effectivenesses):
+            raise ValueError("Every ingredient must have an effectiveness.")
+        if not 0 < len(ingredients) <= self.SLOTS:
+            raise ValueError(f"Between 1 and {self.SLOTS} ingredients are required.")
+        self._ingredients = ingredients
+        self._effectivenesses = effectivenesses
+        self._target = target
+
+        self._slots: tuple[int, ...] = ()
+        self._boosts: list[int] = []
+        self._expected_value = 0.0
+        self._probability: float | None = None
+        self._arrangements = 0
+        self._unique_arrangements = 0
+        self._search()
+
+    @property
+    def slots(self) -> tuple[int, ...]:
+        """Slot of each ingredient in the best arrangement. Slots are numbered left to right, top to bottom."""
+        return self._slots
+
+    @property
+    def boosts(self) -> list[int]:
+        """Total boost of each ingredient in the best arrangement."""
+        return self._boosts
+
+    @property
+    def expected_value(self) -> float:
+        """Expected crafted roll of the best arrangement."""
+        return self._expected_value
+
+    @property
+    def probability(self) -> float | None:
+        """P(crafted roll >= `target`) of the best arrangement. None if no target is given."""
+        return self._probability
+
+    @property
+    def arrangements(self) -> int:
+        """Number of arrangements searched."""
+        return self._arrangements
+
+    @property
+    def unique_arrangements(self) -> int:
+        """Number of arrangements with distinct crafted roll distributions."""
+        return self._unique_arrangements
+
+    def get_arranged_ingredients(self) -> list[WynnIngredientValue]:
+        """Ingredients with their boost in the best arrangement."""
+        return [
+            WynnIngredientValue(ing.min_value, ing.max_value, boost)
+            for ing, boost in zip(self._ingredients, self._boosts)
+        ]
+
+    @classmethod
+    def get_relations(cls) -> np.ndarray:
+        """Shape (slots, slots, 6). `relations[a, b, k]` is whether an ingredient in slot `a` applies
+        its `WynnIngredientEffectiveness.KEYS[k]` modifier to the ingredient in slot `b`."""
+        relations = np.zeros((cls.SLOTS, cls.SLOTS, 6), dtype=np.int64)
+        for a in range(cls.SLOTS):
+            row_a, col_a = divmod(a, cls.GRID_COLS)
+            for b in range(cls.SLOTS):
+                if a == b:
+                    continue
+                row_b, col_b = divmod(b, cls.GRID_COLS)
+                is_touching = abs(row_a - row_b) + abs(col_a - col_b) == 1
+                relations[a, b] = (
+                    row_a == row_b and col_b < col_a,
+                    row_a == row_b and col_b > col_a,
+                    col_a == col_b and row_b < row_a,
+                    col_a == col_b and row_b > row_a,
+                    is_touching,
+                    not is_touching,
+                )
+        return relations
+
+    def _search(self) -> None:
+        n_ings = len(self._ingredients)
+        # Shape (arrangements, ingredients). Slot of each ingredient
+        arrangements = np.array(list(permutations(range(self.SLOTS), n_ings)), dtype=np.int64)
+        boosts = self._get_boosts(arrangements)
+
+        # Shape (arrangements, ingredients, 3)
+        recipes = np.empty((len(arrangements), n_ings, 3), dtype=np.int64)
+        recipes[...] = [ing.to_tuple()[:2] + (0,) for ing in self._ingredients]
+        recipes[..., 2] = boosts
+
+        # Crafted rolls only depend on the multiset of (min, max, boost), so grid symmetries and
+        # identical ingredients collapse into one recipe
+        as_records = recipes.view([("min", np.int64), ("max", np.int64), ("boost", np.int64)])
+        canonical = np.sort(as_records, axis=1).view(np.int64).reshape(len(arrangements), n_ings * 3)
+        unique_recipes, inverse = np.unique(canonical, axis=0, return_inverse=True)
+        unique_recipes = unique_recipes.reshape(-1, n_ings, 3)
+        inverse = inverse.ravel()
+
+        expected_values = self._get_expected_values(unique_recipes)
+        if self._target is None:
+            best = int(np.argmax(expected_values))
+        else:
+            probabilities = np.concatenate([
+                CraftedUtil.batch(unique_recipes[i:i + self._BATCH_SIZE]).prob_at_least(self._target)
+                for i in range(0, len(unique_recipes), self._BATCH_SIZE)
+            ])
+            # Sorts by probability, then expected roll
+            best = int(np.lexsort((expected_values, probabilities))[-1])
+            self._probability = float(probabilities[best])
+
+        best_arrangement = int(np.flatnonzero(inverse == best)[0])
+        self._slots = tuple(arrangements[best_arrangement].tolist())
+        self._boosts = boosts[best_arrangement].tolist()
+        self._expected_value = float(expected_values[best])
+        self._arrangements = len(arrangements)
+        self._unique_arrangements = len(unique_recipes)
+
+    def _get_boosts(self, arrangements: np.ndarray) -> np.ndarray:
+        """Shape (arrangements, ingredients). Total boost of each ingredient in every arrangement."""
+        n_ings = len(self._ingredients)
+        modifiers = np.array([eff.to_tuple() for eff in self._effectivenesses], dtype=np.int64)
+        # effects[i, a, b] is the effectiveness ingredient i in slot a gives to slot b
+        effects = np.einsum("ik,abk->iab", modifiers, self.get_relations())
+        src = np.arange(n_ings)[None, :, None]
+        received = effects[src, arrangements[:, :, None], arrangements[:, None, :]].sum(axis=1)
+        own_boosts = np.array([ing.boost for ing in self._ingredients], dtype=np.int64)
+        # Effectiveness can't go below 0%
+        return np.maximum(own_boosts + received, -100)
+
+    @staticmethod
+    def _get_expected_values(recipes: np.ndarray) -> np.ndarray:
+        """Shape (recipes,). Expected crafted roll of each recipe of shape (recipes, slots, 3)."""
+        # Expected roll is the sum of every ingredient's, so each distinct ingredient is computed once
+        ings, ing_idxs = np.unique(recipes.reshape(-1, 3), axis=0, return_inverse=True)
+        mins, maxs, boosts = ings[:, 0], ings[:, 1], ings[:, 2]
+        base_values = np.round(np.linspace(mins, maxs, CraftedUtil.ROLL_OUTCOMES, axis=-1))
+        ing_expected_values = np.floor(base_values * ((boosts + 100) * 0.01)[:, None]).mean(axis=1)
+        return ing_expected_values[ing_idxs.ravel()].reshape(recipes.shape[:2]).sum(axis=1)
@@ -1,26 +1,82 @@
 # pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false
 from __future__ import annotations
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import Literal, TYPE_CHECKING, overload
 
 import numpy as np
 
+from fazbot.object import CraftedBatchResult
+
+from .convolution_util import ConvolutionUtil
+
 if TYPE_CHECKING:
     from fazbot.object import WynnIngredientValue
+    from .convolution_util import ConvolutionMethod
+
+BinMethod = Literal["mass", "width"]
 
 
 class CraftedUtil:
 
-    def __init__(self, ingredients: list[WynnIngredientValue]):
+    ROLL_OUTCOMES = 101
+    """Number of equally likely base rolls of an ingredient (0% to 100% of its range)."""
+    _EPSILON = 1e-12
+    """Tolerance for float round-off in cumulative probabilities."""
+
+    def __init__(self, ingredients: list[WynnIngredientValue], exact: bool = False, method: ConvolutionMethod = "auto"):
+        """Computes crafted roll probabilities from ingredient values.
+
+        Args:
+            ingredients (list[WynnIngredientValue]): Ingredients used in the craft.
+            exact (bool, optional): Convolve integer occurrence counts out of 101^n instead of
+                float probabilities, so no precision is lost. Defaults to False.
+            method (ConvolutionMethod, optional): Convolution method for float mode.
+                Defaults to "auto".
+        """
+        self.__init_fields(ingredients, exact, method)
+        self._calculate_ingredient_probabilities()
+        self._calculate_crafted_probabilities()
+
+    @classmethod
+    def from_bytes(cls, ingredients: list[WynnIngredientValue], data: bytes) -> CraftedUtil:
+        """Restores a distribution serialized with `to_bytes()` without recomputing it."""
+        craftutil = cls.__new__(cls)
+        craftutil.__init_fields(ingredients, False, "auto")
+        roll_min = int.from_bytes(data[:8], "little", signed=True)
+        pmf = np.frombuffer(data, dtype="<f8", offset=8).astype(np.float64)
+        craftutil._crafted_roll_min = np.int32(roll_min)
+        craftutil._crafted_roll_max = np.int32(roll_min + len(pmf) - 1)
+        craftutil._set_distribution(pmf)
+        return craftutil
+
+    def to_bytes(self) -> bytes:
+        """Serializes the distribution as the lowest roll (int64) followed by the PMF of every
+        consecutive roll (float64), both little-endian."""
+        pmf = np.zeros(int(self.crafted_roll_max - self.crafted_roll_min) + 1, dtype="<f8")
+        pmf[self._rolls - int(self.crafted_roll_min)] = self._pmf
+        return int(self.crafted_roll_min).to_bytes(8, "little", signed=True) + pmf.tobytes()
+
+    def __init_fields(self, ingredients: list[WynnIngredientValue], exact: bool, method: ConvolutionMethod) -> None:
         self._ingredients = ingredients
+        self._exact = exact
+        self._method: ConvolutionMethod = method
 
+        self._ing_roll_occurrences = []
         self._ing_prob_dists = []
         self._crafted_roll_min = np.int32(0)
         self._crafted_roll_max = np.int32(0)
-        self._craft_probs = {}
+        self._craft_probs: dict[int, Decimal] | None = None
 
-        self._calculate_ingredient_probabilities()
-        self._calculate_crafted_probabilities()
+        self._rolls = np.empty(0, dtype=np.int64)
+        """Possible crafted rolls in ascending order. Rolls with 0 probability are excluded."""
+        self._occurrences: np.ndarray | None = None
+        """Exact mode only. Number of occurrences of each roll, out of 101^n."""
+        self._pmf = np.empty(0)
+        """P(roll == rolls[i])"""
+        self._cdf = np.empty(0)
+        """P(roll <= rolls[i])"""
+        self._sf = np.empty(0)
+        """P(roll >= rolls[i])"""
 
     @property
     def crafted_roll_min(self) -> np.int32:
@@ -34,13 +90,159 @@ class CraftedUtil:
 
     @property
     def craft_probs(self) -> dict[int, Decimal]:
-        assert isinstance(self._craft_probs, dict)
+        """{roll: probability}, built on first access from the distribution arrays."""
+        if self._craft_probs is None:
+            self._craft_probs = self._build_craft_probs()
         return self._craft_probs
 
+    @property
+    def rolls(self) -> np.ndarray:
+        return self._rolls
+
+    @property
+    def pmf(self) -> np.ndarray:
+        return self._pmf
+
+    @property
+    def cdf(self) -> np.ndarray:
+        return self._cdf
+
+    @property
+    def sf(self) -> np.ndarray:
+        return self._sf
+
+    @property
+    def expected_value(self) -> float:
+        return float(self._rolls @ self._pmf)
+
     @property
     def ingredients(self) -> list[WynnIngredientValue]:
         return self._ingredients
 
+    @property
+    def exact(self) -> bool:
+        return self._exact
+
+    @staticmethod
+    def batch(recipes: np.ndarray) -> CraftedBatchResult:
+        """Computes crafted roll distributions of many recipes in one vectorized pass.
+
+        Args:
+            recipes (np.ndarray): Integer array of shape (recipes, slots, 3), where the last axis is
+                (min, max, boost) of the ingredient in that slot. Empty slots should be (0, 0, 0).
+
+        Returns:
+            CraftedBatchResult: Distributions of every recipe.
+        """
+        recipes = np.asarray(recipes, dtype=np.int64)
+        if recipes.ndim != 3 or recipes.shape[2] != 3:
+            raise ValueError(f"recipes must be of shape (recipes, slots, 3), got {recipes.shape}")
+        if np.any(recipes[..., 0] > recipes[..., 1]):
+            raise ValueError("Minimum value cannot be greater than maximum value")
+        if np.any(recipes[..., 2] < -100):
+            raise ValueError("Boost cannot be below -100")
+        n_recipes, n_slots, _ = recipes.shape
+        mins, maxs, boosts = recipes[..., 0], recipes[..., 1], recipes[..., 2]
+        stat_effs = (boosts + 100) * 0.01
+
+        # Same as np.linspace(min, max, 101) for every slot. Shape (recipes, slots, 101)
+        steps = (maxs - mins) / (CraftedUtil.ROLL_OUTCOMES - 1)
+        base_values = np.arange(CraftedUtil.ROLL_OUTCOMES) * steps[..., None] + mins[..., None]
+        base_values[..., -1] = maxs
+        slot_roll_mins = np.floor(mins * stat_effs).astype(np.int64)
+        rolls_boosted = np.floor(np.round(base_values) * stat_effs[..., None]).astype(np.int64) - slot_roll_mins[..., None]
+
+        # Occurrences of every roll offset of every slot. Shape (recipes, slots, width)
+        width = int(rolls_boosted.max(initial=0)) + 1
+        slot_idxs = np.arange(n_recipes * n_slots).reshape(n_recipes, n_slots, 1)
+        occurrences = np.bincount((slot_idxs * width + rolls_boosted).ravel(), minlength=n_recipes * n_slots * width)
+        occurrences = occurrences.reshape(n_recipes, n_slots, width)
+
+        # Convolve all slots of every recipe at once
+        out_length = n_slots * (width - 1) + 1
+        fft_length = 1 << (out_length - 1).bit_length()
+        spectra = np.fft.rfft(occurrences, fft_length, axis=-1)
+        convolution = np.fft.irfft(np.prod(spectra, axis=1), fft_length, axis=-1)[:, :out_length]
+        total_occurrences = float(CraftedUtil.ROLL_OUTCOMES) ** n_slots
+        if total_occurrences < 2**45:
+            # Round-off error is far below 0.5 occurrence here, so rounding recovers exact counts
+            convolution = np.rint(convolution)
+        else:
+            convolution[convolution < convolution.max() * ConvolutionUtil.FFT_TOLERANCE] = 0
+
+        return CraftedBatchResult(slot_roll_mins.sum(axis=1), convolution / total_occurrences)
+
+    @overload
+    def prob_at_least(self, roll: int) -> float: ...
+    @overload
+    def prob_at_least(self, roll: np.ndarray) -> np.ndarray: ...
+    def prob_at_least(self, roll: int | np.ndarray) -> float | np.ndarray:
+        """P(crafted roll >= `roll`). Accepts a scalar or an array of rolls."""
+        idx = np.searchsorted(self._rolls, roll, side="left")
+        res = np.append(self._sf, 0.0)[idx]
+        return float(res) if np.ndim(res) == 0 else res
+
+    @overload
+    def prob_at_most(self, roll: int) -> float: ...
+    @overload
+    def prob_at_most(self, roll: np.ndarray) -> np.ndarray: ...
+    def prob_at_most(self, roll: int | np.ndarray) -> float | np.ndarray:
+        """P(crafted roll <= `roll`). Accepts a scalar or an array of rolls."""
+        idx = np.searchsorted(self._rolls, roll, side="right")
+        res = np.insert(self._cdf, 0, 0.0)[idx]
+        return float(res) if np.ndim(res) == 0 else res
+
+    @overload
+    def quantile(self, q: float) -> int: ...
+    @overload
+    def quantile(self, q: np.ndarray) -> np.ndarray: ...
+    def quantile(self, q: float | np.ndarray) -> int | np.ndarray:
+        """Smallest roll `r` where P(crafted roll <= r) >= `q`. Accepts a scalar or an array of `q`."""
+        idx = np.searchsorted(self._cdf, np.asarray(q) - self._EPSILON, side="left")
+        res = self._rolls[np.minimum(idx, len(self._rolls) - 1)]
+        return int(res) if np.ndim(res) == 0 else res
+
+    @overload
+    def roll_at_confidence(self, confidence: float) -> int: ...
+    @overload
+    def roll_at_confidence(self, confidence: np.ndarray) -> np.ndarray: ...
+    def roll_at_confidence(self, confidence: float | np.ndarray) -> int | np.ndarray:
+        """Largest roll `r` where P(crafted roll >= r) >= `confidence`, i.e. the roll hit with
+        `confidence` probability. Accepts a scalar or an array of confidences."""
+        # sf is non-increasing, so search on its negation
+        idx = np.searchsorted(-self._sf, -(np.asarray(confidence) - self._EPSILON), side="right") - 1
+        res = self._rolls[np.maximum(idx, 0)]
+        return int(res) if np.ndim(res) == 0 else res
+
+    def bin(self, n_bins: int, method: BinMethod = "mass") -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Groups consecutive possible rolls into at most `n_bins` ranges.
+
+        Args:
+            n_bins (int): Max number of bins.
+            method (BinMethod, optional): `mass` for bins of roughly equal probability, where a
+                single roll more likely than 1/`n_bins` gets its own bin, or `width` for bins
+                spanning equal roll ranges. Defaults to "mass".
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Lowest roll, highest roll and probability of each non-empty bin.
+        """
+        if n_bins < 1:
+            raise ValueError("Number of bins must be at least 1.")
+        if method == "mass":
+            # Bin of each roll from the probability mass before it
+            bin_idxs = np.floor((self._cdf - self._pmf) * n_bins).astype(np.int64)
+        elif method == "width":
+            width = int(self._rolls[-1] - self._rolls[0]) + 1
+            bin_idxs = (self._rolls - self._rolls[0]) * n_bins // width
+        else:
+            raise ValueError(f"Unknown bin method {method}")
+        bin_idxs = np.minimum(bin_idxs, n_bins - 1)
+
+        # rolls are sorted, so every bin is a run of consecutive rolls
+        starts = np.flatnonzero(np.diff(bin_idxs, prepend=-1))
+        ends = np.append(starts[1:], len(self._rolls)) - 1
+        return self._rolls[starts], self._rolls[ends], np.add.reduceat(self._pmf, starts)
+
 
     def _calculate_ingredient_probabilities(self):
         """ Gets ingredient_rolls_list and ingredient_probDist_list from command arguments """
@@ -53,23 +255,47 @@ class CraftedUtil:
                 np.floor(np.round(ing_base_values) * ing_stat_eff).astype(int) - \
                 np.floor(ing.min_value * ing_stat_eff).astype(int)
             ingredient_rolls_occurrences = np.bincount(ing_rolls_boosted)
-            ingredient_prob_dist = ingredient_rolls_occurrences / 101
+            ingredient_prob_dist = ingredient_rolls_occurrences / self.ROLL_OUTCOMES
 
             # Assign values into class attributes
+            self._ing_roll_occurrences.append(ingredient_rolls_occurrences)
             self._ing_prob_dists.append(ingredient_prob_dist)
-            self._crafted_roll_min += np.floor(ing.min_value * ing_stat_eff)
-            self._crafted_roll_max += np.floor(ing.max_value * ing_stat_eff)
+            self._crafted_roll_min += np.int32(np.floor(ing.min_value * ing_stat_eff))
+            self._crafted_roll_max += np.int32(np.floor(ing.max_value * ing_stat_eff))
 
     def _calculate_crafted_probabilities(self):
         # Calculate crafted roll probabilities
-        convolution = [1]
-        for prob_dist in self._ing_prob_dists:
-            convolution = np.convolve(convolution, prob_dist)
-
-        # Build ingredients_probabilities dictionary
-        crafted_rolls = np.linspace(self.crafted_roll_min, self.crafted_roll_max, len(convolution))
-        for roll, crafted_roll_chance in zip(crafted_rolls, convolution):
-            if crafted_roll_chance == 0:
-                continue
-            self.craft_probs[int(roll)] = Decimal(crafted_roll_chance)
+        if self._exact:
+            self._set_exact_distribution(ConvolutionUtil.convolve_many_exact(self._ing_roll_occurrences))
+        else:
+            self._set_distribution(ConvolutionUtil.convolve_many(self._ing_prob_dists, self._method))
+
+    def _set_distribution(self, pmf: np.ndarray) -> None:
+        """Sets distribution arrays from the PMF of consecutive rolls starting from `crafted_roll_min`."""
+        is_possible = pmf != 0
+        self._rolls = int(self.crafted_roll_min) + np.flatnonzero(is_possible)
+        pmf = pmf[is_possible]
+        self._pmf = pmf
+        self._cdf = np.minimum(np.cumsum(pmf), 1.0)
+        self._sf = np.minimum(np.cumsum(pmf[::-1])[::-1], 1.0)
+
+    def _set_exact_distribution(self, occurrences: np.ndarray) -> None:
+        """Sets distribution arrays from the occurrences of consecutive rolls starting from `crafted_roll_min`."""
+        is_possible = occurrences != 0
+        self._rolls = int(self.crafted_roll_min) + np.flatnonzero(is_possible)
+        occurrences = occurrences[is_possible]
+        total_occurrences = self.ROLL_OUTCOMES ** len(self._ingredients)
+        self._occurrences = occurrences
+        self._pmf = (occurrences / total_occurrences).astype(np.float64)
+        self._cdf = (np.cumsum(occurrences) / total_occurrences).astype(np.float64)
+        self._sf = (np.cumsum(occurrences[::-1])[::-1] / total_occurrences).astype(np.float64)
+
+    def _build_craft_probs(self) -> dict[int, Decimal]:
+        if self._occurrences is not None:
+            total_occurrences = Decimal(self.ROLL_OUTCOMES) ** len(self._ingredients)
+            return {
+                int(roll): Decimal(int(occurrences)) / total_occurrences
+                for roll, occurrences in zip(self._rolls, self._occurrences)
+            }
+        return {int(roll): Decimal(float(prob)) for roll, prob in zip(self._rolls, self._pmf)}
 
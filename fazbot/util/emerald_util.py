@@ -1,14 +1,55 @@
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false
 from __future__ import annotations
-from decimal import Decimal
-from math import floor
+
+import numpy as np
 
 from fazbot.object import WynnEmeralds
 
 
 class EmeraldUtil:
 
+    TM_FEE_PERCENT = 5
+    SILVERBULL_FEE_PERCENT = 3
+    UNIT_VALUES = (64 * 64 * 64, 64 * 64, 64, 1)
+    """Emeralds per stx, le, eb and e."""
+    MAX_VECTORIZED_TOTAL = np.iinfo(np.int64).max // 100
+    """Largest absolute emerald total the vectorized methods accept. Set prices multiply totals by
+    100, which would overflow int64 above it."""
+
     @staticmethod
     def get_set_price(emerald: WynnEmeralds) -> tuple[WynnEmeralds, WynnEmeralds]:
-        set_price_tm = floor(emerald.total * Decimal(100 / 105)) - 1
-        set_price_silverbull = floor(emerald.total * Decimal(100 / 103)) - 1
+        set_price_tm = EmeraldUtil.__get_set_price(emerald.total, EmeraldUtil.TM_FEE_PERCENT)
+        set_price_silverbull = EmeraldUtil.__get_set_price(emerald.total, EmeraldUtil.SILVERBULL_FEE_PERCENT)
         return WynnEmeralds(set_price_tm), WynnEmeralds(set_price_silverbull)
+
+    @staticmethod
+    def get_set_prices(totals: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """ Vectorized `get_set_price()`. Returns TM and Silverbull set prices of every emerald total. """
+        totals = EmeraldUtil.__as_int64(totals)
+        return (
+            EmeraldUtil.__get_set_price(totals, EmeraldUtil.TM_FEE_PERCENT),
+            EmeraldUtil.__get_set_price(totals, EmeraldUtil.SILVERBULL_FEE_PERCENT)
+        )
+
+    @staticmethod
+    def get_breakdowns(totals: np.ndarray) -> np.ndarray:
+        """ Vectorized `WynnEmeralds` denominations. Shape (totals, 4), the stx, le, eb and e of every emerald total. """
+        totals = EmeraldUtil.__as_int64(totals)
+        # Negative totals are broken down by magnitude, like WynnEmeralds, e.g. -65 is -1eb -1e
+        magnitudes = np.abs(totals)
+        breakdowns = np.empty((len(totals), 4), dtype=np.int64)
+        breakdowns[:, 0] = magnitudes // EmeraldUtil.UNIT_VALUES[0]
+        breakdowns[:, 1:] = (magnitudes[:, None] // EmeraldUtil.UNIT_VALUES[1:]) % 64
+        return breakdowns * np.sign(totals)[:, None]
+
+    @staticmethod
+    def __as_int64(totals: np.ndarray) -> np.ndarray:
+        totals = np.asarray(totals, dtype=np.int64)
+        if np.any(np.abs(totals) > EmeraldUtil.MAX_VECTORIZED_TOTAL):
+            raise ValueError(f"Emerald totals must be at most {EmeraldUtil.MAX_VECTORIZED_TOTAL} in absolute value.")
+        return totals
+
+    @staticmethod
+    def __get_set_price[T: (int, np.ndarray)](total: T, fee_percent: int) -> T:
+        # Highest price that still receives `total` after the fee, minus 1 to stay below it
+        return total * 100 // (100 + fee_percent) - 1  # type: ignore
@@ -0,0 +1,38 @@
+from __future__ import annotations
+from io import BytesIO
+
+from PIL import Image, UnidentifiedImageError
+
+
+class ImageUtil:
+
+    MAX_COLORS = 256
+
+    @staticmethod
+    def get_thumbnail(data: bytes, max_size: int) -> bytes:
+        """Downscales an image to fit in `max_size` x `max_size`, reduced to a 256 color PNG.
+        Returns `data` itself if it is already smaller.
+
+        Args:
+            data (bytes): The image file.
+            max_size (int): Max width and height in pixels.
+
+        Raises:
+            ValueError: `data` isn't an image.
+
+        Returns:
+            bytes: The smaller of the downscaled PNG and `data`.
+        """
+        try:
+            with Image.open(BytesIO(data)) as image:
+                thumbnail = image.convert("RGBA")
+        except UnidentifiedImageError:
+            raise ValueError("Data is not an image.")
+        thumbnail.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        # Fast octree is the only quantizer that keeps the alpha channel
+        thumbnail = thumbnail.quantize(ImageUtil.MAX_COLORS, method=Image.Quantize.FASTOCTREE)
+
+        output = BytesIO()
+        thumbnail.save(output, format="PNG", optimize=True)
+        thumbnail_data = output.getvalue()
+        return thumbnail_data if len(thumbnail_data) < len(data) else data
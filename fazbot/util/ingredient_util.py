@@ -1,8 +1,14 @@
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false
 from decimal import Decimal
 
+import numpy as np
+
 
 class IngredientUtil:
 
+    MAX_DROPS = 1000
+    """Max number of drops. The cost of `get_drop_chances()` grows linearly with it."""
+
     def __init__(self, base_probability: Decimal | float, loot_quality: int = 0, loot_bonus: int = 0):
         self._base_probability = Decimal(base_probability) if isinstance(base_probability, (float, int)) else base_probability
         self._loot_quality = loot_quality
@@ -30,6 +36,110 @@ class IngredientUtil:
     def loot_boost(self) -> int:
         return self._loot_boost
 
+    def get_drop_chances(self, kills: np.ndarray | int, drops: int = 1) -> np.ndarray:
+        """P(at least `drops` drops) after each number of `kills`, i.e. the CDF of the kills needed
+        for `drops` drops. Computed from the binomial PMF in log space, so tiny drop chances and
+        large kill counts don't underflow.
+
+        Args:
+            kills (np.ndarray | int): Numbers of kills.
+            drops (int, optional): Number of drops. Defaults to 1.
+
+        Returns:
+            np.ndarray: Probability of each number of kills, in the shape of `kills`.
+        """
+        self.__validate_drops(drops)
+        kills_ = np.asarray(kills, dtype=np.float64)
+        p = self.__get_drop_probability()
+        if p >= 1:
+            return (kills_ >= drops).astype(np.float64)
+        if p <= 0:
+            return np.zeros(kills_.shape)
+
+        # log P(X = i) for i < drops, from log P(X = 0) and the ratio of consecutive binomial terms
+        i = np.arange(drops - 1, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            log_ratios = np.log(np.maximum(kills_[..., None] - i, 0)) - np.log(i + 1) + np.log(p) - np.log1p(-p)
+        log_pmf0 = kills_[..., None] * np.log1p(-p)
+        log_pmfs = np.concatenate((log_pmf0, log_pmf0 + np.cumsum(log_ratios, axis=-1)), axis=-1)
+
+        # P(X >= drops) = 1 - P(X < drops), where P(X < drops) is summed with log-sum-exp
+        max_log_pmfs = log_pmfs.max(axis=-1, keepdims=True)
+        log_cdf = (max_log_pmfs + np.log(np.exp(log_pmfs - max_log_pmfs).sum(axis=-1, keepdims=True)))[..., 0]
+        return np.clip(-np.expm1(log_cdf), 0.0, 1.0)
+
+    def get_kills_for_confidence(self, confidence: float, drops: int = 1) -> int:
+        """Fewest kills where P(at least `drops` drops) >= `confidence`."""
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence must be between 0 and 1.")
+        self.__validate_drops(drops)
+        p = self.__get_drop_probability()
+        if p <= 0:
+            raise ValueError("Drop chance must be above 0.")
+        if p >= 1:
+            return drops
+        if drops == 1:
+            # Closed form of the geometric distribution, checked below against float round-off
+            low = max(int(np.ceil(np.log1p(-confidence) / np.log1p(-p))) - 2, 1)
+        else:
+            low = drops
+
+        # Double the upper bound until it is reached, then binary search
+        high = max(low, int(drops / p))
+        while self.get_drop_chances(high, drops) < confidence:
+            low, high = high, high * 2
+        while low < high:
+            mid = (low + high) // 2
+            if self.get_drop_chances(mid, drops) >= confidence:
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+    def get_expected_kills(self, drops: int = 1) -> float:
+        """Expected kills for `drops` drops. Mean of the negative binomial distribution."""
+        p = self.__get_drop_probability()
+        return drops / p if p > 0 else float("inf")
+
+    @staticmethod
+    def sweep(
+            base_probability: Decimal | float,
+            loot_bonuses: np.ndarray,
+            loot_qualities: np.ndarray,
+            drops: int = 1
+        ) -> tuple[np.ndarray, np.ndarray]:
+        """Boosted drop chance and expected kills of every combination of loot bonus and loot
+        quality, in one broadcast.
+
+        Args:
+            base_probability (Decimal | float): Base drop chance.
+            loot_bonuses (np.ndarray): Loot bonuses, the rows of the result.
+            loot_qualities (np.ndarray): Loot qualities, the columns of the result.
+            drops (int, optional): Number of drops for the expected kills. Defaults to 1.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Boosted drop chances and expected kills, both in the
+                shape (len(loot_bonuses), len(loot_qualities)).
+        """
+        if drops < 1:
+            raise ValueError("Drops must be at least 1.")
+        loot_boosts = np.asarray(loot_bonuses, dtype=np.float64)[:, None] + np.asarray(loot_qualities, dtype=np.float64)[None, :]
+        probabilities = float(base_probability) * (loot_boosts + 100) / 100
+        drop_probabilities = np.minimum(probabilities, 1.0)
+        with np.errstate(divide="ignore"):
+            expected_kills = np.where(drop_probabilities > 0, drops / drop_probabilities, np.inf)
+        return probabilities, expected_kills
+
+    @classmethod
+    def __validate_drops(cls, drops: int) -> None:
+        if drops < 1:
+            raise ValueError("Drops must be at least 1.")
+        if drops > cls.MAX_DROPS:
+            raise ValueError(f"Drops must be at most {cls.MAX_DROPS}.")
+
+    def __get_drop_probability(self) -> float:
+        return min(float(self._boosted_probability), 1.0)
+
     @staticmethod
     def _compute_boosted_probability(base_probability: Decimal, loot_boost: int) -> Decimal:
         return base_probability * Decimal((loot_boost + 100) / 100)
@@ -0,0 +1,21 @@
+# pyright: basic
+from unittest import TestCase
+
+from fazbot.bot.invoke import Asset
+
+
+class TestAsset(TestCase):
+
+    def test_get_file_to_send(self) -> None:
+        # PREPARE
+        asset = Asset(b"data", "foo.png")
+
+        # ACT
+        file1 = asset.get_file_to_send()
+        file2 = asset.get_file_to_send()
+
+        # ASSERT
+        self.assertIsNot(file1.fp, file2.fp)
+        self.assertEqual(file1.fp.read(), b"data")
+        self.assertEqual(file2.fp.read(), b"data")
+        self.assertEqual(file1.filename, "foo.png")
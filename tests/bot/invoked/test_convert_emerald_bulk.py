@@ -0,0 +1,102 @@
+# pyright: basic
+import csv
+from io import StringIO
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from fazbot.bot.invoke import InvokeConvertEmeraldBulk
+from fazbot.util import EmeraldUtil
+
+
+class TestConvertEmeraldBulk(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        InvokeConvertEmeraldBulk.ASSET_LIQUIDEMERALD = MagicMock()
+        self.interaction = MagicMock()
+        self.interaction.response.defer = AsyncMock()
+        self.interaction.send = AsyncMock()
+        return super().setUp()
+
+    def test_parse_prices(self) -> None:
+        # PREPARE
+        obj = InvokeConvertEmeraldBulk(self.interaction, "1le; 10eb;bad\n2x 1stx")
+
+        # ACT
+        inputs, totals, invalid_lines = obj._parse_prices(obj._split_prices(obj._prices))
+
+        # ASSERT
+        self.assertListEqual(inputs, ["1le", "10eb", "2x 1stx"])
+        self.assertListEqual(totals.tolist(), [4096, 640, 524288])
+        self.assertListEqual(invalid_lines, [3])
+
+    def test_parse_prices_counts_blank_lines(self) -> None:
+        # PREPARE
+        obj = InvokeConvertEmeraldBulk(self.interaction, "1le\n\n;bad\n\n10eb\nworse")
+
+        # ACT
+        inputs, _, invalid_lines = obj._parse_prices(obj._split_prices(obj._prices))
+
+        # ASSERT
+        self.assertListEqual(inputs, ["1le", "10eb"])
+        self.assertListEqual(invalid_lines, [4, 7])
+
+    def test_parse_prices_rejects_oversized_totals(self) -> None:
+        # PREPARE
+        max_total = EmeraldUtil.MAX_VECTORIZED_TOTAL
+        obj = InvokeConvertEmeraldBulk(self.interaction, f"{max_total}e;{max_total + 1}e;99999999999999999stx;1eb")
+
+        # ACT
+        inputs, totals, invalid_lines = obj._parse_prices(obj._split_prices(obj._prices))
+
+        # ASSERT
+        self.assertListEqual(inputs, [f"{max_total}e", "1eb"])
+        self.assertListEqual(totals.tolist(), [max_total, 64])
+        self.assertListEqual(invalid_lines, [2, 3])
+
+    async def test_run_reports_attachment_lines_separately(self) -> None:
+        # PREPARE
+        attachment = MagicMock(size=100)
+        attachment.read = AsyncMock(return_value=b"1le\n\nbad\n")
+        obj = InvokeConvertEmeraldBulk(self.interaction, "oops;1eb", attachment=attachment)
+
+        # ACT
+        await obj.run()
+
+        # ASSERT
+        embed = self.interaction.send.call_args.kwargs["embed"]
+        self.assertIn("Converted **2** prices", embed.description)
+        self.assertIn("Skipped invalid lines: 1\n", embed.description)
+        self.assertIn("Skipped invalid attachment lines: 3", embed.description)
+
+    async def test_run_table(self) -> None:
+        # PREPARE
+        obj = InvokeConvertEmeraldBulk(self.interaction, "1le;100eb")
+
+        # ACT
+        await obj.run()
+
+        # ASSERT
+        embed = self.interaction.send.call_args.kwargs["embed"]
+        self.assertIn("100eb  0stx 1le 36eb 0e  0stx 1le 31eb 14e  0stx 1le 33eb 4e", embed.description)
+
+    async def test_run_csv_from_attachment(self) -> None:
+        # PREPARE
+        attachment = MagicMock(size=100)
+        attachment.read = AsyncMock(return_value=b"1le\n100eb\n")
+        obj = InvokeConvertEmeraldBulk(self.interaction, attachment=attachment, as_csv=True)
+
+        # ACT
+        await obj.run()
+
+        # ASSERT
+        csv_file = self.interaction.send.call_args.kwargs["files"][0]
+        rows = list(csv.reader(StringIO(csv_file.fp.read().decode())))
+        self.assertListEqual(rows[0], list(InvokeConvertEmeraldBulk._CSV_HEADER))
+        self.assertListEqual(rows[2], ["100eb", "6400", "0", "1", "36", "0", "6094", "6212"])
+
+    def test_invalid_params(self) -> None:
+        # ASSERT
+        with self.assertRaises(ValueError):
+            InvokeConvertEmeraldBulk(self.interaction)
+        with self.assertRaises(ValueError):
+            InvokeConvertEmeraldBulk(self.interaction, attachment=MagicMock(size=10**9))
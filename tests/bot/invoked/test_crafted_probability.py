@@ -1,11 +1,12 @@
 # pyright: basic
-from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
 
 from fazbot.bot.invoke import InvokeCraftedProbability
+from fazbot.util import CraftedUtil
 
 
-class TestCraftedProbability(TestCase):
+class TestCraftedProbability(IsolatedAsyncioTestCase):
 
     def setUp(self) -> None:
         self.image_asset = MagicMock()
@@ -22,8 +23,73 @@ class TestCraftedProbability(TestCase):
             "1,2,50"
         ]
         craftedprob = InvokeCraftedProbability(interaction, ing_strs)
-        for ing in craftedprob._craftutil.ingredients:
+        for ing in craftedprob._ingredients:
             self.assertEqual(ing.min_value, 1)
             self.assertEqual(ing.max_value, 2)
             self.assertEqual(ing.boost, 50)
 
+
+    async def test_get_craftutil_cached_across_invocations(self) -> None:
+        # PREPARE
+        InvokeCraftedProbability._CRAFTUTIL_CACHE.clear()
+        craftedprob1 = InvokeCraftedProbability(MagicMock(), ["1,2,50", "3,4"])
+        craftedprob2 = InvokeCraftedProbability(MagicMock(), ["3,4", "1,2,50"])
+        for craftedprob in (craftedprob1, craftedprob2):
+            craftedprob._compute = AsyncMock(side_effect=lambda func, *args: func(*args))
+
+        # ACT
+        craftutil1 = await craftedprob1._get_craftutil(craftedprob1._ingredients)
+        craftutil2 = await craftedprob2._get_craftutil(craftedprob2._ingredients)
+
+        # ASSERT
+        self.assertIs(craftutil1, craftutil2)
+        craftedprob1._compute.assert_awaited_once()
+        craftedprob2._compute.assert_not_awaited()
+
+    def test_get_atleast_embed(self) -> None:
+        # PREPARE
+        craftedprob = InvokeCraftedProbability(MagicMock(), ["1,2,50"] * 4, confidence=50)
+        craftutil = CraftedUtil(craftedprob._ingredients)
+
+        # ACT
+        embed = craftedprob._get_atleast_paginator(MagicMock(), craftutil).get_page(1)
+
+        # ASSERT
+        lines = embed.fields[0].value.split("\n")  # type: ignore
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[0], "Roll: **atleast 4**, Chance: **100.00%** (1 in 1.00)")
+        self.assertIn("Roll at **50%** confidence: **atleast 8**", embed.description)  # type: ignore
+
+    async def test_run_with_effectiveness(self) -> None:
+        # PREPARE
+        interaction = MagicMock()
+        interaction.response.defer = AsyncMock()
+        interaction.send = AsyncMock()
+        craftedprob = InvokeCraftedProbability(
+            interaction, ["10,20", "0,0,0", "10,20"], eff_strs=["touching=50", "", ""]
+        )
+        craftedprob._compute = AsyncMock(side_effect=lambda func, *args: func(*args))
+
+        # ACT
+        await craftedprob.run()
+
+        # ASSERT
+        self.assertEqual(len(craftedprob._ingredients), 2)
+        self.assertListEqual([ing.boost for ing in craftedprob._ingredients], [0, 50])
+        embed = interaction.send.call_args.kwargs["embed"]
+        self.assertIn("Best Arrangement", embed.description)
+
+    def test_get_summary_paginator(self) -> None:
+        # PREPARE
+        craftedprob = InvokeCraftedProbability(MagicMock(), ["-200,200,80"] * 3, summary_bins="width")
+        craftutil = CraftedUtil(craftedprob._ingredients)
+
+        # ACT
+        embed = craftedprob._get_summary_paginator(MagicMock(), craftutil).get_page(1)
+
+        # ASSERT
+        self.assertEqual(embed.fields[0].name, "Quantiles")
+        self.assertIn(f"`p50` **{craftutil.quantile(0.5)}**", embed.fields[0].value)  # type: ignore
+        lines = embed.fields[1].value.split("\n")  # type: ignore
+        self.assertLessEqual(len(lines), InvokeCraftedProbability.SUMMARY_BINS)
+        self.assertTrue(lines[0].startswith(f"Roll: **{craftutil.rolls[0]} to "))
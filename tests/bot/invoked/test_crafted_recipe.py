@@ -0,0 +1,49 @@
+# pyright: basic
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from fazbot.bot.invoke import InvokeCraftedRecipe
+from fazbot.util import CraftedUtil
+
+
+class TestCraftedRecipe(TestCase):
+
+    def setUp(self) -> None:
+        InvokeCraftedRecipe.ASSET_CRAFTINGTABLE = MagicMock()
+        return super().setUp()
+
+    def test_get_recipes_array(self) -> None:
+        # PREPARE
+        obj = InvokeCraftedRecipe(MagicMock(), ["1,2,50;3,4", "", "5,6"], "Damage")
+
+        # ACT
+        recipes = obj._get_recipes_array()
+
+        # ASSERT
+        np.testing.assert_array_equal(recipes, [
+            [[1, 2, 50], [5, 6, 0]],
+            [[3, 4, 0], [0, 0, 0]],
+        ])
+
+    def test_get_embed(self) -> None:
+        # PREPARE
+        obj = InvokeCraftedRecipe(MagicMock(), ["1,2,50;3,4"] * 4, "Damage")
+        batch = CraftedUtil.batch(obj._get_recipes_array())
+
+        # ACT
+        embed = obj._get_embed(MagicMock(), batch)
+
+        # ASSERT
+        self.assertEqual(len(embed.fields), 2)
+        self.assertEqual(embed.fields[0].name, "Damage")
+        self.assertEqual(embed.fields[1].name, "Stat 2")
+        self.assertTrue(embed.fields[0].value.startswith("Range: **4** to **12**"))  # type: ignore
+
+    def test_invalid_recipe(self) -> None:
+        # ASSERT
+        with self.assertRaises(ValueError):
+            InvokeCraftedRecipe(MagicMock(), ["", ""])
+        with self.assertRaises(ValueError):
+            InvokeCraftedRecipe(MagicMock(), [";".join(["1,2"] * 25)])
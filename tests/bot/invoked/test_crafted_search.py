@@ -0,0 +1,49 @@
+# pyright: basic
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from fazbot.bot.invoke import InvokeCraftedSearch
+
+
+class TestCraftedSearch(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        InvokeCraftedSearch.ASSET_CRAFTINGTABLE = MagicMock()
+        InvokeCraftedSearch._SEARCH_CACHE.clear()
+        return super().setUp()
+
+    async def test_get_searchutil_cached_across_invocations(self) -> None:
+        # PREPARE
+        search1 = InvokeCraftedSearch(MagicMock(), "1,10;5,8,20", 20, 50)
+        search2 = InvokeCraftedSearch(MagicMock(), "1,10; 5,8,20", 20, 50)
+        for search in (search1, search2):
+            search._compute = AsyncMock(side_effect=lambda func, *args: func(*args))
+
+        # ACT
+        searchutil1 = await search1._get_searchutil()
+        searchutil2 = await search2._get_searchutil()
+
+        # ASSERT
+        self.assertIs(searchutil1, searchutil2)
+        search2._compute.assert_not_awaited()
+
+    def test_get_embed(self) -> None:
+        # PREPARE
+        search = InvokeCraftedSearch(MagicMock(), "1,10;5,8,20", 20, 50, "1;2")
+        searchutil = MagicMock(ingredients=[search._candidates[1]] * 3, cost=6, probability=0.6, is_complete=True, nodes=4)
+
+        # ACT
+        embed = search._get_embed(MagicMock(), searchutil)
+
+        # ASSERT
+        self.assertIn("- `3x` 5 to 8, 20% boost", embed.description)  # type: ignore
+        self.assertIn("Cost: **6**", embed.description)  # type: ignore
+
+    def test_invalid_params(self) -> None:
+        # ASSERT
+        with self.assertRaises(ValueError):
+            InvokeCraftedSearch(MagicMock(), "", 20)
+        with self.assertRaises(ValueError):
+            InvokeCraftedSearch(MagicMock(), "1,10;5,8", 20, costs_str="1")
+        with self.assertRaises(ValueError):
+            InvokeCraftedSearch(MagicMock(), "1,10", 20, confidence=0)
@@ -38,5 +38,25 @@ class TestIngredientProbability(TestCase):
         test6 = self.obj._parse_base_chance("0.1")
         self.assertAlmostEqual(test6, Decimal("0.1"))
 
+    def test_get_kills_needed(self) -> None:
+        # PREPARE
+        obj = InvokeIngredientProbability(self.interaction, "1%", 0, 0, drops=2, confidence=95)
+
+        # ACT
+        kills_needed = obj._get_kills_needed(obj._ing_util)
+
+        # ASSERT
+        lines = kills_needed.split("\n")
+        self.assertEqual(lines[0], "Expected: **200.0** mobs for 2 drops")
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[3].startswith("**95%** chance of 2 drops: "))
+
+    def test_drops_out_of_range(self) -> None:
+        # ACT, ASSERT
+        with self.assertRaises(ValueError):
+            InvokeIngredientProbability(self.interaction, "1%", 0, 0, drops=0)
+        with self.assertRaises(ValueError):
+            InvokeIngredientProbability(self.interaction, "1%", 0, 0, drops=1001)
+
     def tearDown(self) -> None:
         pass
@@ -0,0 +1,37 @@
+# pyright: basic
+from unittest import TestCase
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from fazbot.bot.invoke import InvokeIngredientSweep
+
+
+class TestIngredientSweep(TestCase):
+
+    def setUp(self) -> None:
+        self.interaction = AsyncMock()
+        self.obj = InvokeIngredientSweep(self.interaction, "1%", "0:100:50", "0,20")
+        self.obj.ASSET_DECAYINGHEART = MagicMock()
+        return super().setUp()
+
+    def test_parse_range(self) -> None:
+        # ASSERT
+        np.testing.assert_array_equal(self.obj._parse_range("0:200:50", 12), [0, 50, 100, 150, 200])
+        np.testing.assert_array_equal(self.obj._parse_range("10, 30", 12), [10, 30])
+        for range_str in ("0:100", "0:100:0", "a,b", "10:0:5", "0:200:10"):
+            with self.assertRaises(ValueError):
+                self.obj._parse_range(range_str, 12)
+
+    def test_get_embed(self) -> None:
+        # ACT
+        embed = self.obj._get_embed(self.interaction)
+
+        # ASSERT
+        desc = embed.description or ""
+        self.assertIn(" B\\Q    0%   20%", desc)
+        self.assertIn("100% 2.00% 2.20%", desc)
+        self.assertIn("100%  50  45", desc)
+
+    def tearDown(self) -> None:
+        pass
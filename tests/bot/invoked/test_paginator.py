@@ -0,0 +1,72 @@
+# pyright: basic
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from nextcord import Embed
+
+from fazbot.bot.invoke import Paginator, PaginatorView
+
+
+class TestPaginator(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.get_base_embed = MagicMock(side_effect=lambda page, pages: Embed(title=f"Page {page}/{pages}"))
+        return super().setUp()
+
+    def test_add_lines(self) -> None:
+        # PREPARE
+        paginator = Paginator(self.get_base_embed)
+        lines = [f"Roll: **{i}**, Chance: **0.10%** (1 in 1,000.00)" for i in range(1000)]
+
+        # ACT
+        paginator.add_lines(lines, "Probabilities")
+
+        # ASSERT
+        self.assertGreater(paginator.page_count, 1)
+        rendered_lines: list[str] = []
+        for page in range(1, paginator.page_count + 1):
+            embed = paginator.get_page(page)
+            self.assertLessEqual(len(embed), Paginator.EMBED_LIMIT)
+            self.assertLessEqual(len(embed.fields), Paginator.FIELDS_LIMIT)
+            for field in embed.fields:
+                self.assertLessEqual(len(field.value), Paginator.FIELD_VALUE_LIMIT)  # type: ignore
+                rendered_lines.extend(field.value.split("\n"))  # type: ignore
+        self.assertListEqual(rendered_lines, lines)
+        self.assertEqual(paginator.get_page(1).fields[0].name, "Probabilities")
+        self.assertEqual(paginator.get_page(2).fields[0].name, "")
+
+    def test_get_page_renders_only_requested_page(self) -> None:
+        # PREPARE
+        paginator = Paginator(self.get_base_embed, max_fields=2)
+        for i in range(5):
+            paginator.add_field(f"name{i}", f"value{i}")
+        self.get_base_embed.reset_mock()
+
+        # ACT
+        embed = paginator.get_page(3)
+
+        # ASSERT
+        self.assertEqual(paginator.page_count, 3)
+        self.get_base_embed.assert_called_once_with(3, 3)
+        self.assertEqual(embed.title, "Page 3/3")
+        self.assertListEqual([field.name for field in embed.fields], ["name4"])
+        with self.assertRaises(ValueError):
+            paginator.get_page(4)
+
+    async def test_view_wraps_around(self) -> None:
+        # PREPARE
+        paginator = Paginator(self.get_base_embed, max_fields=1)
+        for i in range(3):
+            paginator.add_field(f"name{i}", f"value{i}")
+        view = PaginatorView(MagicMock(), paginator)
+        interaction = MagicMock()
+        interaction.response.edit_message = AsyncMock()
+
+        # ACT
+        await view._go_to_page(interaction, 3)
+        await view.next_page.callback(interaction)  # type: ignore
+
+        # ASSERT
+        self.assertEqual(view.page, 1)
+        embed = interaction.response.edit_message.call_args.kwargs["embed"]
+        self.assertEqual(embed.fields[0].name, "name0")
@@ -0,0 +1,81 @@
+# pyright: basic
+from pathlib import Path
+import time
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from nextcord import NotFound
+
+from fazbot.bot import AssetCdnCache
+from fazbot.bot.invoke import Asset
+
+
+class TestAssetCdnCache(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.bot = MagicMock()
+        self.bot.core.asset.files = {Path("asset/foo.png"): b"foo", Path("asset/bar.png"): b"bar"}
+        self.bot.asset_manager.get_sendable = lambda file_name: self.bot.core.asset.files[Path("asset", file_name)]
+        self.channel = MagicMock()
+        self.channel.send = AsyncMock(side_effect=lambda content, file: self._get_message(content, file.filename))
+        self.channel.history = lambda limit: self._iter_messages([])
+        self.cache = AssetCdnCache(self.bot)
+        self.cache._channel = self.channel
+        self.expires_at = int(time.time()) + 24 * 3600
+
+    def _get_message(self, content: str, filename: str) -> MagicMock:
+        message = MagicMock()
+        message.id = hash(content)
+        message.author = self.bot.client.user
+        message.content = content
+        message.attachments = [MagicMock(url=f"https://cdn.discordapp.com/{filename}?ex={self.expires_at:x}&is=0&hm=0")]
+        return message
+
+    async def _iter_messages(self, messages: list[MagicMock]):
+        for message in messages:
+            yield message
+
+    async def test_sync_uploads_once(self) -> None:
+        # PREPARE
+        uploaded_foo = self._get_message(AssetCdnCache.get_tag(Path("foo.png"), b"foo"), "foo.png")
+        outdated_bar = self._get_message(AssetCdnCache.get_tag(Path("bar.png"), b"old bar"), "bar.png")
+        self.channel.history = lambda limit: self._iter_messages([uploaded_foo, outdated_bar])
+
+        # ACT
+        await self.cache.sync()
+
+        # ASSERT
+        self.channel.send.assert_awaited_once()
+        self.assertEqual(self.channel.send.await_args.kwargs["content"], AssetCdnCache.get_tag(Path("bar.png"), b"bar"))
+        asset = Asset(b"", "foo.png")
+        self.assertEqual(asset.thumbnail_url, uploaded_foo.attachments[0].url)
+        self.assertEqual(asset.get_files_to_send(), [])
+
+    async def test_refresh_falls_back_and_reuploads_deleted(self) -> None:
+        # PREPARE
+        await self.cache.sync()
+        self.channel.fetch_message = AsyncMock(side_effect=NotFound(MagicMock(status=404), "Unknown Message"))
+        self.channel.send.reset_mock()
+
+        # ACT
+        await self.cache.refresh()
+
+        # ASSERT
+        self.assertEqual(self.channel.send.await_count, 2)
+        self.assertIsNotNone(Asset(b"", "bar.png").url)
+
+    def test_asset_url_expiry(self) -> None:
+        # PREPARE
+        asset = Asset(b"", "baz.png")
+
+        # ACT
+        Asset.set_url("baz.png", f"https://cdn.discordapp.com/baz.png?ex={int(time.time()) + 60:x}")
+
+        # ASSERT
+        self.assertIsNone(asset.url)
+        self.assertEqual(asset.thumbnail_url, "attachment://baz.png")
+        self.assertEqual(len(asset.get_files_to_send()), 1)
+
+    def tearDown(self) -> None:
+        for file_name in ("foo.png", "bar.png", "baz.png"):
+            Asset.set_url(file_name, None)
@@ -0,0 +1,46 @@
+# pyright: basic
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from fazbot import Asset
+from fazbot.bot import AssetManager
+from fazbot.bot.invoke import InvokeCraftedProbability
+from fazbot.constants import Constants
+
+
+class TestAssetManager(TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = TemporaryDirectory()
+        self.bot = MagicMock()
+        self.bot.core.asset = Asset(Constants.ASSET_DIR)
+        self.bot.core.asset.read_all()
+        self.manager = AssetManager(self.bot, self.tmpdir.name)
+
+    def test_load_assets(self) -> None:
+        # ACT
+        self.manager.load_assets()
+
+        # ASSERT
+        original = self.bot.core.asset.get("craftingtable")
+        thumbnail = self.manager.get_sendable("craftingtable.png")
+        self.assertLess(len(thumbnail), len(original))
+        self.assertEqual(InvokeCraftedProbability.ASSET_CRAFTINGTABLE.data, thumbnail)
+        self.assertEqual(InvokeCraftedProbability.ASSET_CRAFTINGTABLE.filename, "craftingtable.png")
+        self.assertTrue(any(Path(self.tmpdir.name).glob("*.craftingtable.thumbnail.png")))
+
+    def test_load_assets_reads_cached_variants(self) -> None:
+        # PREPARE
+        self.manager.load_assets()
+
+        # ACT
+        with patch("fazbot.bot._asset_manager.ImageUtil.get_thumbnail") as get_thumbnail:
+            AssetManager(self.bot, self.tmpdir.name).load_assets()
+
+        # ASSERT
+        get_thumbnail.assert_not_called()
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
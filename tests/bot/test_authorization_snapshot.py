@@ -0,0 +1,98 @@
+# pyright: basic
+from contextlib import contextmanager
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from fazbot.bot import AuthorizationSnapshot, Checks
+
+
+class TestAuthorizationSnapshot(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.db = MagicMock()
+        self.db.banned_user_repository.get_all_banned_user_ids = AsyncMock(return_value=[1, 2])
+        self.db.banned_user_repository.is_exists = AsyncMock(return_value=True)
+        self.db.whitelisted_guild_repository.get_all_whitelisted_guild_ids = AsyncMock(return_value=[10])
+        self.db.whitelisted_guild_repository.is_exists = AsyncMock(return_value=True)
+
+        @contextmanager
+        def enter_fazbotdb():
+            yield self.db
+
+        self.bot = MagicMock()
+        self.bot.core.enter_fazbotdb = enter_fazbotdb
+        self.bot.logger.discord.warning = AsyncMock()
+        self.snapshot = AuthorizationSnapshot(self.bot)
+        self.bot.authorization_snapshot = self.snapshot
+
+    async def test_load(self) -> None:
+        # ACT
+        await self.snapshot.load()
+
+        # ASSERT
+        self.assertTrue(self.snapshot.is_loaded)
+        self.assertTrue(self.snapshot.is_banned(1))
+        self.assertFalse(self.snapshot.is_banned(3))
+        self.assertTrue(self.snapshot.is_whitelisted(10))
+        self.assertLess(self.snapshot.staleness, 60)
+
+    async def test_write_through_and_reconcile(self) -> None:
+        # PREPARE
+        await self.snapshot.load()
+
+        # ACT
+        self.snapshot.ban(3)
+        self.snapshot.unwhitelist(10)
+
+        # ASSERT
+        self.assertTrue(self.snapshot.is_banned(3))
+        self.assertFalse(self.snapshot.is_whitelisted(10))
+
+        # ACT
+        await self.snapshot.load()
+
+        # ASSERT
+        self.assertEqual(self.snapshot.last_drift, 2)
+        self.assertFalse(self.snapshot.is_banned(3))
+        self.assertTrue(self.snapshot.is_whitelisted(10))
+
+    async def test_write_through_during_load(self) -> None:
+        # PREPARE
+        await self.snapshot.load()
+
+        async def get_all_banned_user_ids():
+            # Admin commands commit after the tables are read, but before the snapshot is replaced
+            self.snapshot.ban(3)
+            self.snapshot.unban(1)
+            self.snapshot.whitelist(11)
+            return [1, 2]
+
+        self.db.banned_user_repository.get_all_banned_user_ids = get_all_banned_user_ids
+
+        # ACT
+        await self.snapshot.load()
+
+        # ASSERT
+        self.assertEqual(self.snapshot.banned_user_ids, {2, 3})
+        self.assertEqual(self.snapshot.whitelisted_guild_ids, {10, 11})
+        self.assertEqual(self.snapshot.last_drift, 0)
+
+    async def test_checks_use_snapshot(self) -> None:
+        # PREPARE
+        checks = Checks(self.bot)
+        interaction = MagicMock()
+        interaction.user.id = 2
+        interaction.guild.id = 11
+
+        # ACT
+        is_banned_before_load = await checks.is_banned(interaction)
+        await self.snapshot.load()
+        is_banned = await checks.is_banned(interaction)
+        is_whitelisted = await checks.is_whitelisted(interaction)
+
+        # ASSERT
+        self.assertTrue(is_banned_before_load)
+        self.db.banned_user_repository.is_exists.assert_awaited_once_with(2)
+        self.assertTrue(is_banned)
+        self.assertFalse(is_whitelisted)
+        self.db.whitelisted_guild_repository.is_exists.assert_not_awaited()
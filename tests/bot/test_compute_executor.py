@@ -0,0 +1,64 @@
+# pyright: basic
+import asyncio
+from datetime import datetime, timedelta, timezone
+from math import factorial
+from time import sleep
+from unittest import IsolatedAsyncioTestCase
+
+from fazbot.bot import ComputeExecutor
+from fazbot.logger import PerformanceLogger
+
+
+class TestComputeExecutor(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.perf = PerformanceLogger()
+        self.executor = ComputeExecutor(self.perf, max_workers=1, max_queue=0, timeout=5)
+        self.executor.start()
+
+    async def test_submit_returns_result_and_records_timings(self) -> None:
+        # ACT
+        res = await self.executor.submit(factorial, 20)
+
+        # ASSERT
+        self.assertEqual(res, factorial(20))
+        self.assertEqual(self.executor.pending, 0)
+        self.assertEqual(len(self.perf.get_recent(timedelta(minutes=1), "compute.factorial.run")), 1)
+        self.assertEqual(len(self.perf.get_recent(timedelta(minutes=1), "compute.factorial.queue_wait")), 1)
+
+    async def test_submit_timeout(self) -> None:
+        # ASSERT
+        with self.assertRaises(TimeoutError):
+            await self.executor.submit(sleep, 1, timeout=0.1)
+
+    async def test_submit_expired_deadline(self) -> None:
+        # ASSERT
+        with self.assertRaises(TimeoutError):
+            await self.executor.submit(factorial, 5, deadline=datetime.now(timezone.utc) - timedelta(seconds=1))
+
+    async def test_submit_queue_full(self) -> None:
+        # PREPARE
+        running = asyncio.create_task(self.executor.submit(sleep, 0.2))
+        await asyncio.sleep(0)
+
+        # ASSERT
+        with self.assertRaises(RuntimeError):
+            await self.executor.submit(factorial, 5)
+        await running
+
+    async def test_submit_timeout_keeps_running_job_pending(self) -> None:
+        # PREPARE
+        with self.assertRaises(TimeoutError):
+            await self.executor.submit(sleep, 0.5, timeout=0.1)
+
+        # ASSERT
+        self.assertEqual(self.executor.pending, 1)
+        with self.assertRaises(RuntimeError):
+            await self.executor.submit(factorial, 5)
+
+        await asyncio.sleep(0.6)
+        self.assertEqual(self.executor.pending, 0)
+        self.assertEqual(await self.executor.submit(factorial, 5), 120)
+
+    def tearDown(self) -> None:
+        self.executor.shutdown()
@@ -0,0 +1,57 @@
+# pyright: basic
+from contextlib import contextmanager
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from fazbot.bot import CraftedDistributionCache
+
+
+class TestCraftedDistributionCache(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.repo = MagicMock()
+        self.repo.upsert = AsyncMock(return_value=True)
+        self.repo.get_usage = AsyncMock(return_value=(8, 800))
+        self.repo.evict = AsyncMock(return_value=2)
+        db = MagicMock()
+        db.crafted_distribution_repository = self.repo
+
+        @contextmanager
+        def enter_fazbotdb():
+            yield db
+
+        self.bot = MagicMock()
+        self.bot.core.enter_fazbotdb = enter_fazbotdb
+        self.cache = CraftedDistributionCache(self.bot, max_entries=10, max_bytes=10_000)
+        self.craftutil = MagicMock()
+        self.craftutil.to_bytes.return_value = b"\x00" * 100
+
+    async def test_save_evicts_only_beyond_limits(self) -> None:
+        # ACT
+        await self.cache.save([], self.craftutil)
+        await self.cache.save([], self.craftutil)
+        await self.cache.save([], self.craftutil)
+
+        # ASSERT
+        self.assertEqual(self.repo.upsert.await_count, 3)
+        self.repo.evict.assert_not_awaited()
+        self.assertEqual(self.repo.get_usage.await_count, 1)
+
+        # ACT
+        await self.cache.save([], self.craftutil)
+
+        # ASSERT
+        self.repo.evict.assert_awaited_once_with(9, 9_000)
+        self.assertEqual(self.repo.get_usage.await_count, 2)
+
+    async def test_save_existing_does_not_count(self) -> None:
+        # PREPARE
+        self.repo.upsert.return_value = False
+        self.repo.get_usage.return_value = (10, 1000)
+
+        # ACT
+        for _ in range(5):
+            await self.cache.save([], self.craftutil)
+
+        # ASSERT
+        self.repo.evict.assert_not_awaited()
@@ -0,0 +1,116 @@
+# pyright: basic
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.exc import OperationalError
+
+from fazbot.bot import ExpiryScheduler
+
+
+class TestExpiryScheduler(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.now = datetime(2024, 1, 1)
+        self.repo = MagicMock()
+        self.repo.get_expirations = AsyncMock(return_value=[
+            (1, self.now - timedelta(minutes=1)),
+            (2, self.now + timedelta(hours=1)),
+            (3, self.now - timedelta(days=1)),
+        ])
+        self.repo.delete_expired = AsyncMock(return_value=2)
+        db = MagicMock()
+        db.banned_user_repository = self.repo
+
+        @contextmanager
+        def enter_fazbotdb():
+            yield db
+
+        self.bot = MagicMock()
+        self.bot.core.enter_fazbotdb = enter_fazbotdb
+        self.on_expire = MagicMock()
+        self.scheduler = ExpiryScheduler(self.bot)
+        self.scheduler.register("banned_user", lambda db: db.banned_user_repository, self.on_expire)
+
+    async def test_expire_due(self) -> None:
+        # PREPARE
+        await self.scheduler.load()
+
+        # ACT
+        expired = await self.scheduler.expire_due(self.now)
+
+        # ASSERT
+        self.assertEqual(expired, {"banned_user": [3, 1]})
+        self.repo.delete_expired.assert_awaited_once_with(self.now)
+        self.on_expire.assert_called_once_with(3, 1)
+        self.assertEqual(self.scheduler.pending, 1)
+
+    async def test_expire_due_nothing_due(self) -> None:
+        # PREPARE
+        self.scheduler.schedule("banned_user", 4, self.now + timedelta(days=1))
+
+        # ACT
+        expired = await self.scheduler.expire_due(self.now)
+
+        # ASSERT
+        self.assertEqual(expired, {})
+        self.repo.delete_expired.assert_not_awaited()
+
+    async def test_reschedule_and_unschedule(self) -> None:
+        # PREPARE
+        await self.scheduler.load()
+        self.scheduler.schedule("banned_user", 1, self.now + timedelta(days=1))
+        self.scheduler.unschedule("banned_user", 3)
+
+        # ACT
+        expired = await self.scheduler.expire_due(self.now)
+
+        # ASSERT
+        self.assertEqual(expired, {})
+        self.assertEqual(self.scheduler.pending, 2)
+
+    async def test_failed_delete_is_retried(self) -> None:
+        # PREPARE
+        self.scheduler.schedule("banned_user", 1, self.now)
+        self.repo.delete_expired.side_effect = OperationalError("DELETE", {}, Exception())
+
+        # ACT
+        expired = await self.scheduler.expire_due(self.now)
+
+        # ASSERT
+        self.assertEqual(expired, {})
+        self.on_expire.assert_not_called()
+        self.assertEqual(self.scheduler.pending, 1)
+
+    def test_schedule_unregistered(self) -> None:
+        # ASSERT
+        with self.assertRaises(KeyError):
+            self.scheduler.schedule("whitelisted_guild", 1, self.now)
+
+    async def test_schedule_timezone_aware(self) -> None:
+        # PREPARE
+        until = datetime(2024, 1, 2, 12, tzinfo=timezone(timedelta(hours=2)))
+        local_until = until.astimezone().replace(tzinfo=None)
+        self.scheduler.schedule("banned_user", 1, self.now)
+        self.scheduler.schedule("banned_user", 2, until)
+
+        # ACT
+        expired = await self.scheduler.expire_due(local_until)
+
+        # ASSERT
+        self.assertEqual(expired, {"banned_user": [1, 2]})
+        self.assertEqual(ExpiryScheduler.to_column_time(until), local_until)
+        self.assertIsNone(ExpiryScheduler.to_column_time(until).tzinfo)
+
+    async def test_schedule_truncates_microseconds(self) -> None:
+        # PREPARE
+        until = self.now + timedelta(microseconds=600000)
+        self.scheduler.schedule("banned_user", 1, until)
+
+        # ACT
+        expired = await self.scheduler.expire_due(self.now)
+
+        # ASSERT
+        self.assertEqual(ExpiryScheduler.to_column_time(until), self.now)
+        self.assertEqual(expired, {"banned_user": [1]})
@@ -7,6 +7,27 @@ from ._common_repository_test import CommonRepositoryTest
 
 class TestBannedUserRepository(CommonRepositoryTest.Test[BannedUser, int]):
 
+    async def test_get_all_banned_user_ids_return_value(self) -> None:
+        test_user_ids = set([user.user_id for user in self.test_data])
+
+        await self.repo.insert(self.test_data)
+
+        user_ids = set(await self.repo.get_all_banned_user_ids())
+        self.assertSetEqual(user_ids, test_user_ids)
+
+    async def test_get_expirations_return_value(self) -> None:
+        await self.repo.insert(self.test_data)
+
+        expirations = set(await self.repo.get_expirations())
+        self.assertSetEqual(expirations, {(user.user_id, user.until) for user in self.test_data})
+
+    async def test_delete_expired(self) -> None:
+        await self.repo.insert(self.test_data)
+
+        deleted = await self.repo.delete_expired(self.until)
+        self.assertEqual(deleted, len(self.test_data))
+        self.assertFalse(await self.repo.is_exists(self.user_id1))
+
     # override
     def get_data(self):
         self.reason = "test"
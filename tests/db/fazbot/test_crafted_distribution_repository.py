@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+from fazbot.db.fazbot.model import CraftedDistribution
+
+from ._common_repository_test import CommonRepositoryTest
+
+
+class TestCraftedDistributionRepository(CommonRepositoryTest.Test[CraftedDistribution, str]):
+
+    async def test_get_counts_request(self) -> None:
+        test_data0 = self.test_data[0]
+        await self.repo.insert(test_data0)
+
+        entity = await self.repo.get(test_data0.ingredients)
+        self.assertIsNotNone(entity)
+
+        entity = await self.repo.get(test_data0.ingredients)
+        self.assertEqual(entity.requests, 2)  # type: ignore
+        self.assertIsNone(await self.repo.get("doesn't exist"))
+
+    async def test_get_most_requested_order(self) -> None:
+        await self.repo.insert(self.test_data)
+
+        entities = await self.repo.get_most_requested(2)
+        self.assertListEqual([entity.ingredients for entity in entities], ["3,4,0", "1,2,50"])
+
+    async def test_evict_least_recently_requested(self) -> None:
+        await self.repo.insert(self.test_data)
+
+        evicted = await self.repo.evict(max_entries=2, max_bytes=1024)
+        self.assertEqual(evicted, 1)
+        self.assertIsNone(await self.repo.get("5,6,0"))
+
+        evicted = await self.repo.evict(max_entries=2, max_bytes=16)
+        self.assertEqual(evicted, 1)
+
+    async def test_upsert_keeps_request_count(self) -> None:
+        test_data0 = self.test_data[0]
+        await self.repo.insert(test_data0)
+
+        is_inserted = await self.repo.upsert(test_data0.ingredients, b"\x01" * 32)
+        self.assertFalse(is_inserted)
+        self.assertTrue(await self.repo.upsert("7,8,0", b"\x01" * 8))
+
+        entity = await self.repo.get(test_data0.ingredients)
+        self.assertEqual(entity.requests, 5)  # type: ignore
+        self.assertEqual(entity.size_bytes, 32)  # type: ignore
+
+    async def test_get_usage(self) -> None:
+        self.assertEqual(await self.repo.get_usage(), (0, 0))
+
+        await self.repo.insert(self.test_data)
+        self.assertEqual(await self.repo.get_usage(), (3, 48))
+
+    # override
+    def get_data(self):
+        self.now = datetime.now().replace(microsecond=0)
+        data = b"\x00" * 16
+
+        test_data1 = self.model_cls(ingredients="1,2,50", data=data, size_bytes=16, requests=5, last_requested=self.now)
+        test_data2 = self.model_cls(ingredients="3,4,0", data=data, size_bytes=16, requests=10, last_requested=self.now - timedelta(days=1))
+        test_data3 = self.model_cls(ingredients="5,6,0", data=data, size_bytes=16, requests=1, last_requested=self.now - timedelta(days=2))
+
+        test_data = (test_data1, test_data2, test_data3)
+        return test_data
+
+    # override
+    @property
+    def repo(self):
+        return self.database.crafted_distribution_repository
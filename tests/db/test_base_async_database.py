@@ -0,0 +1,84 @@
+# pyright: basic
+import asyncio
+from contextlib import asynccontextmanager
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, patch
+
+from fazbot.db import PoolProfile
+from fazbot.db.fazbot import FazBotDatabase
+
+
+class TestBaseAsyncDatabase(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        # Creating the engine doesn't connect, so no server is needed
+        self.database = FazBotDatabase(
+            "mysql+aiomysql", "user", "password", "localhost", 3306, "fazbot_test",
+            PoolProfile(size=3, max_overflow=2, timeout=5, recycle=600, pre_ping=False)
+        )
+        self.open_connections = 0
+        self.max_open_connections = 0
+
+    @asynccontextmanager
+    async def _connect(self):
+        self.open_connections += 1
+        self.max_open_connections = max(self.max_open_connections, self.open_connections)
+        await asyncio.sleep(0)
+        try:
+            yield MagicMock()
+        finally:
+            self.open_connections -= 1
+
+    def test_pool_profile_applied(self) -> None:
+        # ACT
+        pool = self.database.engine.pool
+
+        # ASSERT
+        self.assertEqual(pool.size(), 3)  # type: ignore
+        self.assertEqual(pool.timeout(), 5)  # type: ignore
+        self.assertEqual(pool._max_overflow, 2)  # type: ignore
+        self.assertEqual(pool._recycle, 600)
+        self.assertFalse(pool._pre_ping)
+        self.assertEqual(self.database.pool_statistics.size, 3)
+        self.assertEqual(self.database.pool_statistics.checked_out, 0)
+        self.assertEqual(self.database.pool_statistics.overflow, 0)
+
+    def test_pool_profile_rejects_invalid(self) -> None:
+        # ACT, ASSERT
+        with self.assertRaises(ValueError):
+            PoolProfile(size=-1)
+        with self.assertRaises(ValueError):
+            PoolProfile(timeout=0)
+
+    async def test_enter_connection_records_wait(self) -> None:
+        # PREPARE
+        stats = self.database.pool_statistics
+
+        # ACT
+        with patch.object(self.database, "_engine", MagicMock(connect=self._connect)):
+            async with self.database.enter_connection():
+                pass
+            async with self.database.enter_connection():
+                pass
+
+        # ASSERT
+        self.assertEqual(stats.checkouts, 2)
+        self.assertGreater(stats.total_wait, 0)
+        self.assertLessEqual(stats.max_wait, stats.total_wait)
+        self.assertAlmostEqual(stats.mean_wait, stats.total_wait / 2)
+
+        stats.reset()
+        self.assertEqual(stats.checkouts, 0)
+        self.assertEqual(stats.mean_wait, 0.0)
+
+    async def test_warm_pool_opens_connections_together(self) -> None:
+        # ACT
+        with patch.object(self.database, "_engine", MagicMock(connect=self._connect)):
+            n = await self.database.warm_pool()
+            n_capped = await self.database.warm_pool(10)
+
+        # ASSERT
+        self.assertEqual(n, 3)
+        self.assertEqual(n_capped, 3)
+        self.assertEqual(self.max_open_connections, 3)
+        self.assertEqual(self.open_connections, 0)
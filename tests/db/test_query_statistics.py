@@ -0,0 +1,129 @@
+# pyright: basic
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from fazbot.db import LatencyHistogram, QueryStatistics
+
+
+class TestLatencyHistogram(TestCase):
+
+    def test_get_percentile(self) -> None:
+        # PREPARE
+        histogram = LatencyHistogram()
+
+        # ACT
+        for _ in range(90):
+            histogram.record(0.001, rows=1)
+        for _ in range(9):
+            histogram.record(0.010, rows=2)
+        histogram.record(0.5)
+
+        # ASSERT
+        self.assertEqual(histogram.count, 100)
+        self.assertEqual(histogram.rows, 108)
+        self.assertEqual(histogram.max, 0.5)
+        self.assertAlmostEqual(histogram.mean, (0.09 + 0.09 + 0.5) / 100)
+        # Percentiles are bucket upper bounds, within 2^(1/4) of the recorded latency
+        self.assertTrue(0.001 <= histogram.get_percentile(50) < 0.001 * 2 ** 0.25)
+        self.assertTrue(0.010 <= histogram.get_percentile(95) < 0.010 * 2 ** 0.25)
+        self.assertEqual(histogram.get_percentile(100), 0.5)
+
+    def test_get_percentile_empty(self) -> None:
+        # PREPARE
+        histogram = LatencyHistogram()
+
+        # ACT, ASSERT
+        self.assertEqual(histogram.get_percentile(99), 0.0)
+        with self.assertRaises(ValueError):
+            histogram.get_percentile(101)
+
+    def test_record_extreme_latencies(self) -> None:
+        # PREPARE
+        histogram = LatencyHistogram()
+
+        # ACT
+        histogram.record(0.0)
+        histogram.record(1000.0)
+
+        # ASSERT
+        self.assertLessEqual(histogram.get_percentile(50), 0.0001)
+        self.assertEqual(histogram.get_percentile(100), 1000.0)
+
+
+class TestQueryStatistics(IsolatedAsyncioTestCase):
+
+    def test_normalize(self) -> None:
+        # ACT, ASSERT
+        self.assertEqual(
+            QueryStatistics.normalize("SELECT *\n  FROM t WHERE id = %s AND name = 'a''b' LIMIT 10"),
+            "SELECT * FROM t WHERE id = ? AND name = ? LIMIT ?"
+        )
+        self.assertEqual(
+            QueryStatistics.normalize("DELETE FROM t WHERE (t.id) IN ((%s), (%s), (%s))"),
+            QueryStatistics.normalize("DELETE FROM t WHERE (t.id) IN ((%s))"),
+        )
+        self.assertEqual(
+            QueryStatistics.normalize("SELECT * FROM t1 WHERE id IN (%s, %s, %s)"),
+            "SELECT * FROM t1 WHERE id IN (?)"
+        )
+        self.assertEqual(
+            QueryStatistics.normalize("INSERT INTO t (a, b) VALUES (%(a)s, %(b)s), (%(a)s, %(b)s)"),
+            "INSERT INTO t (a, b) VALUES (?, ?)"
+        )
+        self.assertEqual(
+            QueryStatistics.normalize("SELECT :schema, CAST(x AS TEXT)::text"),
+            "SELECT ?, CAST(x AS TEXT)::text"
+        )
+
+    def test_record_logs_slow_queries(self) -> None:
+        # PREPARE
+        stats = QueryStatistics(slow_query_threshold=0.1)
+
+        # ACT
+        with patch("fazbot.db._query_statistics.ConsoleLogger") as console:
+            stats.record("SELECT 1", 0.05)
+            stats.record("SELECT 2", 0.2, rows=1, operation="Repository.is_exists")
+
+        # ASSERT
+        console.warning.assert_called_once()
+        self.assertIn("Repository.is_exists", console.warning.call_args.args[0])
+        self.assertEqual(stats.by_statement["SELECT ?"].count, 2)
+        self.assertEqual(list(stats.by_operation), ["Repository.is_exists"])
+
+        stats.reset()
+        self.assertEqual(stats.by_statement, {})
+
+    async def test_attach_records_statements_by_operation(self) -> None:
+        # PREPARE
+        stats = QueryStatistics()
+        engine = create_engine("sqlite://")
+        stats.attach(MagicMock(sync_engine=engine))
+
+        class Repository:
+            @QueryStatistics.bind_operation
+            async def is_exists(self, conn, id_: int) -> None:
+                conn.execute(text("SELECT * FROM t WHERE id = :id"), {"id": id_})
+
+        # ACT
+        with engine.connect() as conn:
+            conn.execute(text("CREATE TABLE t (id INTEGER)"))
+            conn.execute(text("INSERT INTO t VALUES (1), (2)"))
+            await Repository().is_exists(conn, 1)
+            await Repository().is_exists(conn, 2)
+            with self.assertRaises(OperationalError):
+                conn.execute(text("SELECT * FROM missing"))
+            conn.execute(text("SELECT * FROM t"))
+            query_starts = conn.info.get("query_start")
+
+        # ASSERT
+        by_statement = stats.by_statement
+        self.assertEqual(by_statement["SELECT * FROM t WHERE id = ?"].count, 2)
+        self.assertEqual(by_statement["INSERT INTO t VALUES (?)"].rows, 2)
+        self.assertEqual(by_statement["SELECT * FROM t"].count, 1)
+        self.assertNotIn("SELECT * FROM missing", by_statement)
+        self.assertEqual(list(stats.by_operation), ["Repository.is_exists"])
+        self.assertEqual(stats.by_operation["Repository.is_exists"].count, 2)
+        self.assertEqual(query_starts, [])
@@ -0,0 +1,117 @@
+# pyright: basic
+import pickle
+from unittest import TestCase
+
+from fazbot.object import WynnEmeralds
+
+
+class TestWynnEmeralds(TestCase):
+
+    def test_from_string(self) -> None:
+        # ASSERT
+        self.assertEqual(WynnEmeralds.from_string("2x 1stx 1le 1eb 1e").total, 2 * (262144 + 4096 + 64 + 1))
+        self.assertEqual(WynnEmeralds.from_string("2.5stx 100.5le 100.2eb").total, 655360 + 411648 + 6412)
+        self.assertEqual(WynnEmeralds.from_string("1/3x 1000eb").total, 64000 // 3)
+        self.assertEqual(WynnEmeralds.from_string("50%le").total, 2048)
+        self.assertEqual(WynnEmeralds.from_string("1.5/3stx").total, 131072)
+        self.assertEqual(WynnEmeralds.from_string("  100  ").total, 100)
+        self.assertEqual(WynnEmeralds.from_string("1STX").total, 262144)
+        self.assertEqual(WynnEmeralds.from_string("").total, 0)
+
+    def test_from_string_is_exact(self) -> None:
+        # 0.1 and 1/3 aren't exact in binary floating point
+        self.assertEqual(WynnEmeralds.from_string("0.1stx 10x").total, 262144)
+        self.assertEqual(WynnEmeralds.from_string("3x 1/3e").total, 1)
+
+    def test_from_string_negative(self) -> None:
+        # ASSERT
+        self.assertEqual(WynnEmeralds.from_string("-1e").total, -1)
+        self.assertEqual(WynnEmeralds.from_string("1stx -1le").total, 262144 - 4096)
+        self.assertEqual(WynnEmeralds.from_string("-1.5eb").total, -96)
+        self.assertEqual(WynnEmeralds.from_string("-50%le").total, -2048)
+        self.assertEqual(WynnEmeralds.from_string("-1x 1eb").total, -64)
+        # Rounded down, like positive totals
+        self.assertEqual(WynnEmeralds.from_string("-1/3e").total, -1)
+
+    def test_from_string_invalid(self) -> None:
+        # ASSERT
+        for emerald_string in ("100 e", "1q", "100 5", "abc", "1/0e", "--1e", "1/-2e", "1e2"):
+            with self.assertRaises(ValueError, msg=emerald_string):
+                WynnEmeralds.from_string(emerald_string)
+
+    def test_parse_many(self) -> None:
+        # ACT
+        emeralds = WynnEmeralds.parse_many(["1le", "64eb", "1le", "5"])
+
+        # ASSERT
+        self.assertListEqual([emerald.total for emerald in emeralds], [4096, 4096, 4096, 5])
+
+    def test_denominations(self) -> None:
+        # PREPARE
+        emeralds = WynnEmeralds(emeralds=70, blocks=100, stacks=2)
+
+        # ASSERT
+        self.assertEqual(emeralds.total, 70 + 6400 + 524288)
+        self.assertEqual((emeralds.stacks, emeralds.liquids, emeralds.blocks, emeralds.emeralds), (2, 1, 37, 6))
+        self.assertEqual(str(emeralds), "2stx 1le 37eb 6e")
+        self.assertEqual(str(WynnEmeralds(-65)), "0stx 0le -1eb -1e")
+
+    def test_simplify(self) -> None:
+        # PREPARE
+        emeralds = WynnEmeralds(emeralds=70, blocks=100)
+
+        # ACT
+        simplified = emeralds.simplify()
+
+        # ASSERT
+        self.assertIs(simplified, emeralds)
+        self.assertEqual((simplified.liquids, simplified.blocks, simplified.emeralds), (1, 37, 6))
+
+    def test_immutable(self) -> None:
+        # PREPARE
+        emeralds = WynnEmeralds(100)
+
+        # ASSERT
+        with self.assertRaises(AttributeError):
+            emeralds._total = 5  # type: ignore
+        with self.assertRaises(AttributeError):
+            emeralds.__dict__
+        with self.assertRaises(TypeError):
+            WynnEmeralds(1.5)  # type: ignore
+
+    def test_interned(self) -> None:
+        # ASSERT
+        self.assertIs(WynnEmeralds(5), WynnEmeralds.from_string("5e"))
+        self.assertIs(WynnEmeralds(64), WynnEmeralds(blocks=1))
+        self.assertIsNot(WynnEmeralds(10**6), WynnEmeralds(10**6))
+
+    def test_arithmetic(self) -> None:
+        # PREPARE
+        a = WynnEmeralds(blocks=1, emeralds=5)
+        b = WynnEmeralds(emeralds=10)
+
+        # ASSERT
+        self.assertEqual(a + b, 79)
+        self.assertEqual(a + 1, 70)
+        self.assertEqual(1 + a, 70)
+        self.assertEqual(sum([a, b]), 79)
+        self.assertEqual(a - b, 59)
+        self.assertEqual(100 - a, 31)
+        self.assertEqual(a * 2, 138)
+        self.assertEqual(2 * a, 138)
+        self.assertEqual(-a, -69)
+        self.assertTrue(b < a <= 69 < a + 1)
+        self.assertListEqual(sorted([a, b]), [b, a])
+        self.assertEqual(hash(a), hash(WynnEmeralds(69)))
+        with self.assertRaises(TypeError):
+            a * 1.5  # type: ignore
+
+    def test_pickle(self) -> None:
+        # PREPARE
+        emeralds = WynnEmeralds(10**6)
+
+        # ACT
+        restored = pickle.loads(pickle.dumps(emeralds))
+
+        # ASSERT
+        self.assertEqual(restored, emeralds)
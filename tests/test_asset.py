@@ -0,0 +1,71 @@
+# pyright: basic
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from fazbot import Asset
+
+
+class TestAsset(TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = TemporaryDirectory()
+        self.dir = Path(self.tmpdir.name)
+        (self.dir / "craftingtable.png").write_bytes(b"table")
+        (self.dir / "liquidemerald.png").write_bytes(b"emerald")
+        self.asset = Asset(self.dir)
+        self.asset.read_all()
+
+    def test_get_fp_by_key(self) -> None:
+        # ASSERT
+        self.assertEqual(self.asset.get_fp_by_key("craftingtable"), self.dir / "craftingtable.png")
+        self.assertEqual(self.asset.get_fp_by_key("liquidemerald.png"), self.dir / "liquidemerald.png")
+        self.assertEqual(self.asset.get_fp_by_key("emerald"), self.dir / "liquidemerald.png")
+        with self.assertRaises(KeyError):
+            self.asset.get_fp_by_key("decayingheart")
+
+    def test_read_all_reindexes(self) -> None:
+        # PREPARE
+        (self.dir / "decayingheart.png").write_bytes(b"heart")
+
+        # ACT
+        self.asset.read_all()
+
+        # ASSERT
+        self.assertEqual(self.asset.get("decayingheart"), b"heart")
+
+    def test_reload(self) -> None:
+        # PREPARE
+        (self.dir / "decayingheart.png").write_bytes(b"heart")
+        (self.dir / "craftingtable.png").write_bytes(b"new table")
+        (self.dir / "liquidemerald.png").unlink()
+
+        # ACT
+        changes = self.asset.reload()
+
+        # ASSERT
+        self.assertEqual(changes.added, [self.dir / "decayingheart.png"])
+        self.assertEqual(changes.modified, [self.dir / "craftingtable.png"])
+        self.assertEqual(changes.removed, [self.dir / "liquidemerald.png"])
+        self.assertEqual(self.asset.get("craftingtable"), b"new table")
+        with self.assertRaises(KeyError):
+            self.asset.get("liquidemerald")
+
+    def test_reload_skips_unchanged(self) -> None:
+        # PREPARE
+        fp = self.dir / "craftingtable.png"
+        old_files = self.asset.files
+        fp.write_bytes(b"table")
+        os.utime(fp, ns=(1, 1))  # Same content, new mtime
+
+        # ACT
+        changes = self.asset.reload()
+
+        # ASSERT
+        self.assertFalse(changes)
+        self.assertIs(self.asset.files[fp], old_files[fp])
+        self.assertIn("no changes", str(changes))
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
@@ -0,0 +1,117 @@
+# pyright: basic
+import asyncio
+from time import sleep
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock
+
+from fazbot.object import WynnIngredientValue
+from fazbot.util import CacheUtil
+
+
+class TestCacheUtil(IsolatedAsyncioTestCase):
+
+    def test_decorator_keys_by_arguments(self) -> None:
+        # PREPARE
+        cache = CacheUtil()
+        func = MagicMock(side_effect=lambda x, y=0: x + y)
+        func.__qualname__ = "func"
+        cached = cache.decorator(func)
+
+        # ACT
+        results = [cached(1), cached(1), cached(2), cached(1, y=1), cached(1, y=1)]
+
+        # ASSERT
+        self.assertEqual(results, [1, 1, 2, 2, 2])
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+
+    def test_make_key_canonical(self) -> None:
+        # ASSERT
+        self.assertEqual(CacheUtil.make_key({"a": 1, "b": {2, 3}}), CacheUtil.make_key({"b": {3, 2}, "a": 1}))
+        self.assertEqual(
+            CacheUtil.make_key([WynnIngredientValue(1, 2, 50)]),
+            CacheUtil.make_key([WynnIngredientValue(1, 2, 50)])
+        )
+        self.assertNotEqual(CacheUtil.make_key(1), CacheUtil.make_key("1"))
+        self.assertNotEqual(CacheUtil.make_key(1, 2), CacheUtil.make_key(2, 1))
+
+    def test_lru_eviction(self) -> None:
+        # PREPARE
+        cache = CacheUtil(max_size=2)
+
+        # ACT
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        # ASSERT
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.size, 2)
+
+    def test_ttl(self) -> None:
+        # PREPARE
+        cache = CacheUtil(ttl=0.05)
+        cache.set("a", 1)
+
+        # ACT
+        sleep(0.1)
+
+        # ASSERT
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.size, 0)
+
+    async def test_async_single_flight(self) -> None:
+        # PREPARE
+        cache = CacheUtil()
+        calls = 0
+
+        async def compute() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return 42
+
+        # ACT
+        results = await asyncio.gather(*(cache.async_get_or_compute("key", compute) for _ in range(5)))
+
+        # ASSERT
+        self.assertEqual(results, [42] * 5)
+        self.assertEqual(calls, 1)
+        self.assertEqual(await cache.async_get_or_compute("key", compute), 42)
+        self.assertEqual(cache.hits, 1)
+
+    async def test_async_exception_not_cached(self) -> None:
+        # PREPARE
+        cache = CacheUtil()
+
+        async def fail() -> int:
+            raise ValueError
+
+        # ASSERT
+        with self.assertRaises(ValueError):
+            await cache.async_get_or_compute("key", fail)
+        self.assertEqual(cache.size, 0)
+
+    async def test_async_owner_cancellation_not_propagated(self) -> None:
+        # PREPARE
+        cache = CacheUtil()
+
+        async def compute() -> int:
+            await asyncio.sleep(0.05)
+            return 42
+
+        owner = asyncio.create_task(cache.async_get_or_compute("key", compute))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.async_get_or_compute("key", compute))
+        await asyncio.sleep(0)
+
+        # ACT
+        owner.cancel()
+
+        # ASSERT
+        self.assertEqual(await waiter, 42)
+        self.assertTrue(owner.cancelled())
+        self.assertEqual(cache.get("key"), 42)
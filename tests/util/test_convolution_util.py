@@ -0,0 +1,45 @@
+# pyright: basic
+from unittest import TestCase
+
+import numpy as np
+
+from fazbot.util import ConvolutionUtil
+
+
+class TestConvolutionUtil(TestCase):
+
+    def test_convolve_many_fft_matches_direct(self) -> None:
+        # PREPARE
+        rng = np.random.default_rng(0)
+        arrays = [dist / dist.sum() for dist in rng.random((6, 401))]
+
+        # ACT
+        direct = ConvolutionUtil.convolve_many(arrays, "direct")
+        fft = ConvolutionUtil.convolve_many(arrays, "fft")
+
+        # ASSERT
+        self.assertEqual(len(direct), 6 * 400 + 1)
+        np.testing.assert_allclose(fft, direct, rtol=0, atol=1e-15)
+
+    def test_convolve_many_fft_keeps_zeros(self) -> None:
+        # PREPARE
+        arrays = [np.array([0.5, 0, 0, 0.5])] * 3
+
+        # ACT
+        res = ConvolutionUtil.convolve_many(arrays, "fft")
+
+        # ASSERT
+        np.testing.assert_array_equal(res == 0, ConvolutionUtil.convolve_many(arrays, "direct") == 0)
+
+    def test_convolve_many_exact(self) -> None:
+        # PREPARE
+        arrays = [np.array([1, 2, 3])] * 2
+
+        # ASSERT
+        np.testing.assert_array_equal(ConvolutionUtil.convolve_many_exact(arrays), [1, 4, 10, 12, 9])
+        self.assertEqual(ConvolutionUtil.convolve_many_exact([np.array([101])] * 10)[0], 101**10)
+
+    def test_choose_method(self) -> None:
+        # ASSERT
+        self.assertEqual(ConvolutionUtil.choose_method([2] * 6), "direct")
+        self.assertEqual(ConvolutionUtil.choose_method([401] * 6), "fft")
@@ -0,0 +1,69 @@
+# pyright: basic
+from itertools import combinations_with_replacement
+from unittest import TestCase
+
+from fazbot.object import WynnIngredientValue
+from fazbot.util import CraftedSearchUtil, CraftedUtil
+
+
+class TestCraftedSearchUtil(TestCase):
+
+    def setUp(self) -> None:
+        self.candidates = [
+            WynnIngredientValue(1, 10),
+            WynnIngredientValue(5, 8, 20),
+            WynnIngredientValue(-3, 15),
+            WynnIngredientValue(0, 12, 40),
+            WynnIngredientValue(2, 4),
+        ]
+        self.costs = [3, 5, 1, 8, 0.5]
+        return super().setUp()
+
+    def test_cheapest_set(self) -> None:
+        # ACT
+        searchutil = CraftedSearchUtil(self.candidates, 40, 0.5, self.costs)
+
+        # ASSERT
+        best_cost, best_prob = self._brute_force(40, 0.5, self.costs)
+        self.assertTrue(searchutil.is_complete)
+        self.assertEqual(searchutil.cost, best_cost)
+        self.assertAlmostEqual(searchutil.probability, best_prob)
+        self.assertAlmostEqual(CraftedUtil(searchutil.ingredients).prob_at_least(40), searchutil.probability)
+
+    def test_smallest_set(self) -> None:
+        # ACT
+        searchutil = CraftedSearchUtil(self.candidates, 30, 0.9)
+
+        # ASSERT
+        best_cost, best_prob = self._brute_force(30, 0.9, [1] * len(self.candidates))
+        self.assertEqual(len(searchutil.ingredients), best_cost)
+        self.assertAlmostEqual(searchutil.probability, best_prob)
+
+    def test_unreachable_target(self) -> None:
+        # ACT
+        searchutil = CraftedSearchUtil(self.candidates, 1000, 0.5)
+
+        # ASSERT
+        self.assertListEqual(searchutil.ingredients, [])
+        self.assertEqual(searchutil.probability, 0)
+        self.assertTrue(searchutil.is_complete)
+
+    def test_time_budget(self) -> None:
+        # PREPARE
+        candidates = [WynnIngredientValue(i, i + 30, i * 7 % 50) for i in range(25)]
+
+        # ACT
+        searchutil = CraftedSearchUtil(candidates, 250, 0.9, time_budget=0)
+
+        # ASSERT
+        self.assertFalse(searchutil.is_complete)
+
+    def _brute_force(self, target: int, confidence: float, costs: list[float]) -> tuple[float, float]:
+        best = (float("inf"), 0.0)
+        for n_ings in range(1, 7):
+            for idxs in combinations_with_replacement(range(len(self.candidates)), n_ings):
+                prob = CraftedUtil([self.candidates[i] for i in idxs]).prob_at_least(target)
+                cost = sum(costs[i] for i in idxs)
+                if prob >= confidence - 1e-12 and (cost, -prob) < (best[0], -best[1]):
+                    best = (cost, prob)
+        return best
@@ -0,0 +1,46 @@
+# pyright: basic
+from unittest import TestCase
+
+import numpy as np
+
+from fazbot.object import WynnIngredientValue
+from fazbot.util import CraftedSimulationUtil, CraftedUtil
+
+
+class TestCraftedSimulationUtil(TestCase):
+
+    def test_simulate(self) -> None:
+        # PREPARE
+        ings = [WynnIngredientValue(1, 2, 50)] * 4
+
+        # ACT
+        rolls, counts = CraftedSimulationUtil.simulate(ings, 100_000, seed=0, chunk_size=30_000)
+
+        # ASSERT
+        self.assertEqual(counts.sum(), 100_000)
+        self.assertTrue(np.isin(rolls, CraftedUtil(ings).rolls).all())
+
+    def test_max_z_score(self) -> None:
+        # PREPARE
+        cases = [
+            [WynnIngredientValue(-200, 200, 80)] * 3 + [WynnIngredientValue(0, 100)],
+            [WynnIngredientValue(-20, 30, 40), WynnIngredientValue(0, 100), WynnIngredientValue(5, 7, 130)],
+        ]
+
+        for ings in cases:
+            # ACT
+            z_score = CraftedSimulationUtil.max_z_score(CraftedUtil(ings), 500_000, seed=0)
+
+            # ASSERT
+            self.assertLess(z_score, 6)
+
+    def test_max_z_score_detects_wrong_distribution(self) -> None:
+        # PREPARE
+        craftutil = CraftedUtil([WynnIngredientValue(0, 100)] * 2)
+        craftutil._pmf = np.full(len(craftutil.rolls), 1 / len(craftutil.rolls))
+
+        # ACT
+        z_score = CraftedSimulationUtil.max_z_score(craftutil, 100_000, seed=0)
+
+        # ASSERT
+        self.assertGreater(z_score, 6)
@@ -0,0 +1,103 @@
+# pyright: basic
+from itertools import permutations
+from unittest import TestCase
+
+from fazbot.object import WynnIngredientEffectiveness, WynnIngredientValue
+from fazbot.util import CraftedSlotUtil, CraftedUtil
+
+
+class TestCraftedSlotUtil(TestCase):
+
+    def setUp(self) -> None:
+        self.ings = [
+            WynnIngredientValue(10, 60),
+            WynnIngredientValue(10, 60),
+            WynnIngredientValue(-5, 30, 10),
+            WynnIngredientValue(20, 80),
+        ]
+        self.effs = [
+            WynnIngredientEffectiveness(touching=20),
+            WynnIngredientEffectiveness(under=30),
+            WynnIngredientEffectiveness(not_touching=-10),
+            WynnIngredientEffectiveness(left=15, right=15),
+        ]
+        return super().setUp()
+
+    def test_get_relations(self) -> None:
+        # ACT
+        relations = CraftedSlotUtil.get_relations()
+
+        # ASSERT
+        # Slot 0 is top left. left, right, above, under, touching, not_touching
+        self.assertListEqual(relations[0, 1].tolist(), [0, 1, 0, 0, 1, 0])
+        self.assertListEqual(relations[0, 2].tolist(), [0, 0, 0, 1, 1, 0])
+        self.assertListEqual(relations[0, 3].tolist(), [0, 0, 0, 0, 0, 1])
+        self.assertListEqual(relations[0, 4].tolist(), [0, 0, 0, 1, 0, 1])
+        self.assertListEqual(relations[5, 1].tolist(), [0, 0, 1, 0, 0, 1])
+        self.assertFalse(relations[3, 3].any())
+
+    def test_best_expected_value(self) -> None:
+        # ACT
+        slotutil = CraftedSlotUtil(self.ings, self.effs)
+
+        # ASSERT
+        best = max(self._brute_force_expected_values())
+        self.assertAlmostEqual(slotutil.expected_value, best)
+        self.assertAlmostEqual(CraftedUtil(slotutil.get_arranged_ingredients()).expected_value, best)
+        self.assertEqual(slotutil.arrangements, 360)
+        self.assertLess(slotutil.unique_arrangements, slotutil.arrangements)
+
+    def test_best_probability(self) -> None:
+        # ACT
+        slotutil = CraftedSlotUtil(self.ings, self.effs, target=150)
+
+        # ASSERT
+        assert slotutil.probability is not None
+        arranged_craftutil = CraftedUtil(slotutil.get_arranged_ingredients())
+        self.assertAlmostEqual(arranged_craftutil.prob_at_least(150), slotutil.probability)
+        for slots in permutations(range(CraftedSlotUtil.SLOTS), len(self.ings)):
+            craftutil = CraftedUtil(self._get_arranged_ingredients(slots))
+            self.assertLessEqual(craftutil.prob_at_least(150), slotutil.probability + 1e-12)
+
+    def test_invalid_params(self) -> None:
+        # ASSERT
+        with self.assertRaises(ValueError):
+            CraftedSlotUtil(self.ings, self.effs[:2])
+        with self.assertRaises(ValueError):
+            CraftedSlotUtil([], [])
+
+    def test_effectiveness_from_string(self) -> None:
+        # ACT
+        eff = WynnIngredientEffectiveness.from_string("touching=-10, Under=20")
+
+        # ASSERT
+        self.assertEqual(eff, WynnIngredientEffectiveness(under=20, touching=-10))
+        with self.assertRaises(ValueError):
+            WynnIngredientEffectiveness.from_string("diagonal=10")
+        with self.assertRaises(ValueError):
+            WynnIngredientEffectiveness.from_string("touching")
+
+    def _brute_force_expected_values(self) -> list[float]:
+        return [
+            CraftedUtil(self._get_arranged_ingredients(slots)).expected_value
+            for slots in permutations(range(CraftedSlotUtil.SLOTS), len(self.ings))
+        ]
+
+    def _get_arranged_ingredients(self, slots: tuple[int, ...]) -> list[WynnIngredientValue]:
+        """Reference implementation of positional effectiveness with plain loops."""
+        arranged: list[WynnIngredientValue] = []
+        for j, ing in enumerate(self.ings):
+            row_j, col_j = divmod(slots[j], CraftedSlotUtil.GRID_COLS)
+            boost = ing.boost
+            for i, eff in enumerate(self.effs):
+                if i == j:
+                    continue
+                row_i, col_i = divmod(slots[i], CraftedSlotUtil.GRID_COLS)
+                is_touching = abs(row_i - row_j) + abs(col_i - col_j) == 1
+                boost += eff.left if row_i == row_j and col_j < col_i else 0
+                boost += eff.right if row_i == row_j and col_j > col_i else 0
+                boost += eff.above if col_i == col_j and row_j < row_i else 0
+                boost += eff.under if col_i == col_j and row_j > row_i else 0
+                boost += eff.touching if is_touching else eff.not_touching
+            arranged.append(WynnIngredientValue(ing.min_value, ing.max_value, max(boost, -100)))
+        return arranged
@@ -2,6 +2,8 @@
 from decimal import Decimal
 from unittest import TestCase
 
+import numpy as np
+
 from fazbot.object import WynnIngredientValue
 from fazbot.util import CraftedUtil
 
@@ -26,3 +28,133 @@ class TestCraftedUtil(TestCase):
         self.assertAlmostEqual(Decimal(0.255), craftedutil.craft_probs[10], delta=0.001)
         self.assertAlmostEqual(Decimal(0.065), craftedutil.craft_probs[12], delta=0.001)
 
+    def test_crafted_util_methods_parity(self) -> None:
+        # PREPARE
+        ings = [
+            WynnIngredientValue(-200, 200, 80),
+            WynnIngredientValue(-200, 200, 80),
+            WynnIngredientValue(-150, 250, 40),
+            WynnIngredientValue(-100, 100, 0),
+            WynnIngredientValue(20, 60, 120),
+            WynnIngredientValue(-200, 200, 80),
+        ]
+        direct = CraftedUtil(ings, method="direct")
+        fft = CraftedUtil(ings, method="fft")
+        exact = CraftedUtil(ings, exact=True)
+
+        # ASSERT
+        self.assertEqual(direct.craft_probs.keys(), fft.craft_probs.keys())
+        self.assertEqual(direct.craft_probs.keys(), exact.craft_probs.keys())
+        for roll, prob in direct.craft_probs.items():
+            self.assertAlmostEqual(prob, fft.craft_probs[roll], delta=Decimal(1e-14))
+            self.assertAlmostEqual(prob, exact.craft_probs[roll], delta=Decimal(1e-14))
+        self.assertAlmostEqual(Decimal(1), sum(exact.craft_probs.values()), delta=Decimal(1e-25))
+
+    def test_crafted_util_exact(self) -> None:
+        # PREPARE
+        craftedutil = CraftedUtil([WynnIngredientValue(1, 2, 50)] * 4, exact=True)
+
+        # ASSERT
+        # 50 base rolls round to 1 (roll 1), 51 base rolls round to 2 (roll 3) for each ingredient
+        self.assertEqual(Decimal(50**4) / Decimal(101**4), craftedutil.craft_probs[4])
+        self.assertEqual(Decimal(51**4) / Decimal(101**4), craftedutil.craft_probs[12])
+
+    def test_crafted_util_queries(self) -> None:
+        # PREPARE
+        craftedutil = CraftedUtil([WynnIngredientValue(1, 2, 50)] * 4)
+        probs = {roll: float(prob) for roll, prob in craftedutil.craft_probs.items()}
+
+        # ASSERT
+        np.testing.assert_array_equal(craftedutil.rolls, [4, 6, 8, 10, 12])
+        self.assertAlmostEqual(craftedutil.prob_at_least(8), probs[8] + probs[10] + probs[12])
+        self.assertAlmostEqual(craftedutil.prob_at_least(7), probs[8] + probs[10] + probs[12])
+        self.assertAlmostEqual(craftedutil.prob_at_least(4), 1)
+        self.assertAlmostEqual(craftedutil.prob_at_least(13), 0)
+        self.assertAlmostEqual(craftedutil.prob_at_most(6), probs[4] + probs[6])
+        self.assertAlmostEqual(craftedutil.prob_at_most(3), 0)
+        np.testing.assert_allclose(craftedutil.prob_at_most(np.array([4, 12])), [probs[4], 1])
+        self.assertAlmostEqual(craftedutil.expected_value, sum(roll * prob for roll, prob in probs.items()))
+        self.assertEqual(craftedutil.quantile(0.5), 8)
+        self.assertEqual(craftedutil.quantile(1), 12)
+        self.assertEqual(craftedutil.roll_at_confidence(1), 4)
+        self.assertEqual(craftedutil.roll_at_confidence(0.5), 8)
+        self.assertEqual(craftedutil.roll_at_confidence(probs[12]), 12)
+
+    def test_crafted_util_batch_parity(self) -> None:
+        # PREPARE
+        recipes = np.array([
+            [[1, 2, 50], [1, 2, 50], [1, 2, 50], [1, 2, 50], [0, 0, 0], [0, 0, 0]],
+            [[-200, 200, 80], [-150, 250, 40], [-100, 100, 0], [20, 60, 120], [-200, 200, 80], [5, 5, 0]],
+            [[0, 0, 0], [0, 0, 0], [0, 0, 0], [0, 0, 0], [0, 0, 0], [-7, 13, 35]],
+        ])
+
+        # ACT
+        batch = CraftedUtil.batch(recipes)
+
+        # ASSERT
+        self.assertEqual(len(batch), 3)
+        for i, recipe in enumerate(recipes):
+            craftedutil = CraftedUtil([WynnIngredientValue(*ing) for ing in recipe.tolist()])
+            dist = batch.get_distribution(i)
+            self.assertEqual(list(dist), craftedutil.rolls.tolist())
+            np.testing.assert_allclose(list(dist.values()), craftedutil.pmf, rtol=0, atol=1e-15)
+            self.assertEqual(batch.roll_mins[i], craftedutil.crafted_roll_min)
+            self.assertEqual(batch.roll_maxs[i], craftedutil.crafted_roll_max)
+            self.assertAlmostEqual(batch.expected_values[i], craftedutil.expected_value)
+            self.assertEqual(batch.quantile(0.5)[i], craftedutil.quantile(0.5))
+            self.assertEqual(batch.roll_at_confidence(0.9)[i], craftedutil.roll_at_confidence(0.9))
+            for roll in (craftedutil.rolls[0] - 1, craftedutil.rolls[len(craftedutil.rolls) // 2], craftedutil.rolls[-1] + 1):
+                self.assertAlmostEqual(batch.prob_at_least(roll)[i], craftedutil.prob_at_least(roll))
+                self.assertAlmostEqual(batch.prob_at_most(roll)[i], craftedutil.prob_at_most(roll))
+
+    def test_crafted_util_bytes_roundtrip(self) -> None:
+        # PREPARE
+        ings = [WynnIngredientValue(-20, 30, 40), WynnIngredientValue(1, 2, 50), WynnIngredientValue(0, 100, 0)]
+        craftedutil = CraftedUtil(ings)
+
+        # ACT
+        restored = CraftedUtil.from_bytes(ings, craftedutil.to_bytes())
+
+        # ASSERT
+        self.assertEqual(restored.ingredients, ings)
+        self.assertEqual(restored.crafted_roll_min, craftedutil.crafted_roll_min)
+        self.assertEqual(restored.crafted_roll_max, craftedutil.crafted_roll_max)
+        self.assertIsInstance(craftedutil.crafted_roll_min, np.int32)
+        self.assertIsInstance(restored.crafted_roll_min, np.int32)
+        self.assertIsInstance(restored.crafted_roll_max, np.int32)
+        np.testing.assert_array_equal(restored.rolls, craftedutil.rolls)
+        np.testing.assert_array_equal(restored.pmf, craftedutil.pmf)
+        np.testing.assert_array_equal(restored.sf, craftedutil.sf)
+        self.assertEqual(restored.craft_probs, craftedutil.craft_probs)
+
+    def test_bin(self) -> None:
+        # PREPARE
+        craftedutil = CraftedUtil([WynnIngredientValue(-200, 200, 80)] * 3 + [WynnIngredientValue(0, 100)])
+
+        for method in ("mass", "width"):
+            # ACT
+            lows, highs, probs = craftedutil.bin(10, method)  # type: ignore
+
+            # ASSERT
+            self.assertLessEqual(len(lows), 10)
+            self.assertEqual(lows[0], craftedutil.rolls[0])
+            self.assertEqual(highs[-1], craftedutil.rolls[-1])
+            self.assertTrue(np.all(lows[1:] > highs[:-1]))
+            self.assertAlmostEqual(probs.sum(), 1.0)
+            for low, high, prob in zip(lows, highs, probs):
+                self.assertAlmostEqual(craftedutil.prob_at_least(low) - craftedutil.prob_at_least(high + 1), prob)
+
+        _, _, probs = craftedutil.bin(10, "mass")
+        np.testing.assert_allclose(probs, 0.1, atol=0.005)
+
+    def test_bin_heavy_roll(self) -> None:
+        # PREPARE
+        craftedutil = CraftedUtil([WynnIngredientValue(1, 2, 50)])
+
+        # ACT
+        lows, highs, probs = craftedutil.bin(10)
+
+        # ASSERT
+        self.assertListEqual(lows.tolist(), [1, 3])
+        self.assertListEqual(highs.tolist(), [1, 3])
+        self.assertAlmostEqual(probs.sum(), 1.0)
@@ -2,6 +2,8 @@
 from decimal import Decimal
 from unittest import TestCase
 
+import numpy as np
+
 from fazbot.object import WynnEmeralds
 from fazbot.util import EmeraldUtil
 
@@ -13,3 +15,52 @@ class TestEmeraldUtil(TestCase):
         set_price_tm, set_price_silverbull = EmeraldUtil.get_set_price(WynnEmeralds.from_string("100eb"))
         self.assertEqual(set_price_tm.total, 6094)
         self.assertEqual(set_price_silverbull.total, 6212)
+
+    def test_get_set_prices(self) -> None:
+        # PREPARE
+        totals = np.arange(0, 100_000, 37)
+
+        # ACT
+        set_prices_tm, set_prices_silverbull = EmeraldUtil.get_set_prices(totals)
+
+        # ASSERT
+        for total, set_price_tm, set_price_silverbull in zip(totals.tolist(), set_prices_tm, set_prices_silverbull):
+            expected_tm, expected_silverbull = EmeraldUtil.get_set_price(WynnEmeralds(total))
+            self.assertEqual(set_price_tm, expected_tm.total)
+            self.assertEqual(set_price_silverbull, expected_silverbull.total)
+
+    def test_get_set_price_exact(self) -> None:
+        # 2100 * 100 / 105 is exactly 2000
+        set_price_tm, _ = EmeraldUtil.get_set_price(WynnEmeralds(2100))
+        self.assertEqual(set_price_tm.total, 1999)
+
+    def test_get_set_prices_max_total(self) -> None:
+        # PREPARE
+        totals = np.array([EmeraldUtil.MAX_VECTORIZED_TOTAL, -EmeraldUtil.MAX_VECTORIZED_TOTAL])
+
+        # ACT
+        set_prices_tm, set_prices_silverbull = EmeraldUtil.get_set_prices(totals)
+
+        # ASSERT
+        for total, set_price_tm, set_price_silverbull in zip(totals.tolist(), set_prices_tm.tolist(), set_prices_silverbull.tolist()):
+            expected_tm, expected_silverbull = EmeraldUtil.get_set_price(WynnEmeralds(total))
+            self.assertEqual(set_price_tm, expected_tm.total)
+            self.assertEqual(set_price_silverbull, expected_silverbull.total)
+        with self.assertRaises(ValueError):
+            EmeraldUtil.get_set_prices(np.array([EmeraldUtil.MAX_VECTORIZED_TOTAL + 1]))
+
+    def test_get_breakdowns(self) -> None:
+        # PREPARE
+        totals = np.array([409600, 63, 262144 * 70 + 4096 * 3 + 64 * 2 + 1, -65, -409600, 0])
+
+        # ACT
+        breakdowns = EmeraldUtil.get_breakdowns(totals)
+
+        # ASSERT
+        self.assertListEqual(
+            breakdowns.tolist(),
+            [[1, 36, 0, 0], [0, 0, 0, 63], [70, 3, 2, 1], [0, 0, -1, -1], [-1, -36, 0, 0], [0, 0, 0, 0]]
+        )
+        for total, breakdown in zip(totals.tolist(), breakdowns.tolist()):
+            emeralds = WynnEmeralds(total)
+            self.assertListEqual(breakdown, [emeralds.stacks, emeralds.liquids, emeralds.blocks, emeralds.emeralds])
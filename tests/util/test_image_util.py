@@ -0,0 +1,45 @@
+# pyright: basic
+from io import BytesIO
+from unittest import TestCase
+
+from PIL import Image
+
+from fazbot.util import ImageUtil
+
+
+class TestImageUtil(TestCase):
+
+    def _get_png(self, size: tuple[int, int]) -> bytes:
+        image = Image.new("RGBA", size)
+        for x in range(size[0]):
+            for y in range(size[1]):
+                image.putpixel((x, y), (x % 256, y % 256, (x * y) % 256, 128 + x % 128))
+        output = BytesIO()
+        image.save(output, format="PNG")
+        return output.getvalue()
+
+    def test_get_thumbnail(self) -> None:
+        # PREPARE
+        data = self._get_png((320, 200))
+
+        # ACT
+        thumbnail = ImageUtil.get_thumbnail(data, 80)
+
+        # ASSERT
+        self.assertLess(len(thumbnail), len(data))
+        with Image.open(BytesIO(thumbnail)) as image:
+            self.assertEqual(image.size, (80, 50))
+            self.assertEqual(image.format, "PNG")
+            self.assertIn("transparency", image.info)
+
+    def test_get_thumbnail_keeps_smaller_source(self) -> None:
+        # PREPARE
+        data = self._get_png((1, 1))
+
+        # ASSERT
+        self.assertIs(ImageUtil.get_thumbnail(data, 80), data)
+
+    def test_get_thumbnail_not_image(self) -> None:
+        # ASSERT
+        with self.assertRaises(ValueError):
+            ImageUtil.get_thumbnail(b"not an image", 80)
@@ -1,6 +1,9 @@
 from decimal import Decimal
+import math
 from unittest import TestCase
 
+import numpy as np
+
 from fazbot.util import IngredientUtil
 
 
@@ -15,3 +18,76 @@ class TestIngredientUtil(TestCase):
         self.assertEqual(ingutil.loot_bonus, 50)
         self.assertEqual(ingutil.loot_boost, 100)
         self.assertAlmostEqual(ingutil.boosted_probability, Decimal(0.2))
+
+    def test_get_drop_chances(self) -> None:
+        # PREPARE
+        ingutil = IngredientUtil(0.001)
+        kills = np.array([0, 5, 1000, 5000, 10000])
+
+        # ACT
+        chances = ingutil.get_drop_chances(kills, drops=5)
+
+        # ASSERT
+        expected = [
+            1 - sum(math.comb(n, i) * 0.001**i * 0.999**(n - i) for i in range(5))
+            for n in kills.tolist()
+        ]
+        np.testing.assert_allclose(chances[2:], expected[2:], rtol=1e-9)
+        self.assertEqual(chances[0], 0)
+        self.assertAlmostEqual(chances[1] / 0.001**5, 1, places=1)
+        np.testing.assert_allclose(ingutil.get_drop_chances(kills), 1 - 0.999**kills, rtol=1e-9)
+
+    def test_get_drop_chances_tiny_probability(self) -> None:
+        # PREPARE
+        ingutil = IngredientUtil(1e-12)
+
+        # ACT
+        chances = ingutil.get_drop_chances(np.array([1, 10**6]))
+
+        # ASSERT
+        np.testing.assert_allclose(chances, [1e-12, -math.expm1(10**6 * math.log1p(-1e-12))], rtol=1e-9)
+
+    def test_get_kills_for_confidence(self) -> None:
+        # PREPARE
+        ingutil = IngredientUtil(0.001)
+
+        # ACT
+        kills = ingutil.get_kills_for_confidence(0.9, drops=5)
+
+        # ASSERT
+        self.assertGreaterEqual(ingutil.get_drop_chances(kills, 5), 0.9)
+        self.assertLess(ingutil.get_drop_chances(kills - 1, 5), 0.9)
+        self.assertEqual(ingutil.get_kills_for_confidence(0.9), math.ceil(math.log(0.1) / math.log(0.999)))
+        self.assertEqual(IngredientUtil(2).get_kills_for_confidence(0.9, 3), 3)
+
+    def test_drops_out_of_range(self) -> None:
+        # PREPARE
+        ingutil = IngredientUtil(0.001)
+
+        # ACT, ASSERT
+        for drops in (0, IngredientUtil.MAX_DROPS + 1):
+            with self.assertRaises(ValueError):
+                ingutil.get_drop_chances(10, drops)
+            with self.assertRaises(ValueError):
+                ingutil.get_kills_for_confidence(0.9, drops)
+
+    def test_get_expected_kills(self) -> None:
+        # ASSERT
+        self.assertAlmostEqual(IngredientUtil(0.01, 50, 50).get_expected_kills(3), 150)
+
+    def test_sweep(self) -> None:
+        # PREPARE
+        loot_bonuses = np.array([0, 100, 200])
+        loot_qualities = np.array([0, 50])
+
+        # ACT
+        probabilities, expected_kills = IngredientUtil.sweep(0.01, loot_bonuses, loot_qualities, drops=2)
+
+        # ASSERT
+        self.assertEqual(probabilities.shape, (3, 2))
+        for i, bonus in enumerate(loot_bonuses.tolist()):
+            for j, quality in enumerate(loot_qualities.tolist()):
+                ingutil = IngredientUtil(0.01, quality, bonus)
+                self.assertAlmostEqual(probabilities[i, j], float(ingutil.boosted_probability))
+                self.assertAlmostEqual(expected_kills[i, j], ingutil.get_expected_kills(2))
+        self.assertEqual(IngredientUtil.sweep(0, loot_bonuses, loot_qualities)[1][0, 0], np.inf)